@@ -0,0 +1 @@
+# DevKit Max Benchmarks
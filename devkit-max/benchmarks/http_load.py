@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+HTTP Transport Load Test
+Starts `server.py --transport http` on localhost and measures tool-call
+throughput and latency as the number of concurrent MCP clients grows
+
+Usage:
+    python benchmarks/http_load.py                        # 1, 2, 4, 8, 16 clients
+    python benchmarks/http_load.py --clients 1,32 --calls 200
+    python benchmarks/http_load.py --tool json_formatter --max-concurrency 8
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from mcp import ClientSession
+from mcp.client.streamable_http import streamable_http_client
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WORKLOADS = {
+    "hash_generator": {"input": "DevKit load test payload " * 40, "algorithm": "sha256"},
+    "json_formatter": {"json_string": '{"id": 1, "tags": ["a", "b"], "nested": {"ok": true}}'},
+    "uuid_generator": {"count": 5},
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class HttpServerProcess:
+    """
+    `server.py --transport http` in a subprocess on an ephemeral port.
+
+    Use as a context manager; on exit the server gets SIGINT and is given time
+    to shut down gracefully. `returncode` and `stderr` are set afterwards.
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None, extra_args: Optional[List[str]] = None):
+        self.port = free_port()
+        self.args = ["--transport", "http", "--port", str(self.port)] + (extra_args or [])
+        if max_concurrency is not None:
+            self.args += ["--max-concurrency", str(max_concurrency)]
+        self.proc: Optional[subprocess.Popen] = None
+        self.returncode: Optional[int] = None
+        self.stderr = ""
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/mcp/"
+
+    def __enter__(self):
+        self.proc = subprocess.Popen(
+            [sys.executable, "server.py"] + self.args,
+            cwd=HERE,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        deadline = time.monotonic() + 15
+        while time.monotonic() < deadline:
+            if self.proc.poll() is not None:
+                raise RuntimeError(f"server exited early: {self.proc.stderr.read()}")
+            try:
+                socket.create_connection(("127.0.0.1", self.port), timeout=0.2).close()
+                return self
+            except OSError:
+                time.sleep(0.05)
+        self.stop()
+        raise RuntimeError("server did not start listening within 15s")
+
+    def stop(self, timeout: float = 20):
+        if self.proc is None or self.returncode is not None:
+            return
+        self.proc.send_signal(signal.SIGINT)
+        try:
+            _, self.stderr = self.proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            _, self.stderr = self.proc.communicate()
+        self.returncode = self.proc.returncode
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+async def run_client(url: str, tool: str, arguments: Dict[str, Any], calls: int, start: asyncio.Event) -> List[float]:
+    """One MCP session making `calls` sequential tool calls; returns latencies in ms"""
+    latencies = []
+    async with streamable_http_client(url) as (read_stream, write_stream, _):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            await start.wait()
+            for _ in range(calls):
+                began = time.perf_counter()
+                result = await session.call_tool(tool, arguments)
+                latencies.append((time.perf_counter() - began) * 1000)
+                if result.isError:
+                    raise RuntimeError(result.content[0].text)
+    return latencies
+
+
+async def run_level(url: str, clients: int, calls: int, tool: str) -> Dict[str, Any]:
+    """
+    Connect `clients` sessions, then release them together. Session setup is
+    excluded so the number reflects steady-state call throughput.
+    """
+    start = asyncio.Event()
+    tasks = [asyncio.create_task(run_client(url, tool, WORKLOADS[tool], calls, start)) for _ in range(clients)]
+    # Give every session time to finish its handshake before the clock starts
+    await asyncio.sleep(0.2 + 0.02 * clients)
+    began = time.perf_counter()
+    start.set()
+    per_client = await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - began
+
+    ordered = sorted(ms for latencies in per_client for ms in latencies)
+    p = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return {
+        "clients": clients,
+        "calls": len(ordered),
+        "seconds": elapsed,
+        "calls_per_sec": len(ordered) / elapsed,
+        "p50_ms": p(0.50),
+        "p99_ms": p(0.99),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    parser = argparse.ArgumentParser(description="DevKit Max HTTP transport load test")
+    parser.add_argument("--clients", default="1,2,4,8,16", help="comma-separated client counts")
+    parser.add_argument("--calls", type=int, default=100, help="calls per client")
+    parser.add_argument("--tool", choices=sorted(WORKLOADS), default="hash_generator")
+    parser.add_argument("--max-concurrency", type=int, help="server request limit (default: server setting)")
+    args = parser.parse_args(argv)
+
+    levels = [int(n) for n in args.clients.split(",") if n.strip()]
+    print(f"🌐 {args.tool} over streamable HTTP, {args.calls} calls per client\n", file=sys.stderr)
+
+    rows = []
+    with HttpServerProcess(args.max_concurrency) as server:
+        for clients in levels:
+            row = asyncio.run(run_level(server.url, clients, args.calls, args.tool))
+            rows.append(row)
+            print(
+                f"  {clients:>4} clients {row['calls_per_sec']:>10.1f} calls/s "
+                f"p50 {row['p50_ms']:>8.2f}ms p99 {row['p99_ms']:>8.2f}ms",
+                file=sys.stderr
+            )
+    if server.returncode != 0:
+        print(f"\n❌ Server exited with {server.returncode}", file=sys.stderr)
+    return rows
+
+
+if __name__ == "__main__":
+    main()
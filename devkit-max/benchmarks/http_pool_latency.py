@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+HTTP Pool Latency Benchmark
+Compares http_tester latency against a local server with a fresh connection
+per call (cold) and with the shared keep-alive pool (warm)
+
+Usage: python benchmarks/http_pool_latency.py [--calls 200] [--path /json/1024]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_server import StubServer  # noqa: E402
+from tools.manifest import TOOLS  # noqa: E402
+from utils import http_pool  # noqa: E402
+from utils.registry import ToolRegistry  # noqa: E402
+
+
+async def measure(registry: ToolRegistry, url: str, calls: int, cold: bool):
+    arguments = {"method": "GET", "url": url, "output": "structured"}
+    # Warm-up call: imports the tool module
+    await registry.call("http_tester", arguments)
+
+    latencies = []
+    for _ in range(calls):
+        if cold:
+            # Drop pooled clients so the call pays client setup and TCP connect
+            await http_pool.close_clients()
+        start = time.perf_counter()
+        await registry.call("http_tester", arguments)
+        latencies.append((time.perf_counter() - start) * 1000)
+    await http_pool.close_clients()
+    return latencies
+
+
+def report(label: str, latencies):
+    ordered = sorted(latencies)
+    p = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    print(
+        f"{label:<6} latency ms: p50={statistics.median(ordered):7.3f} "
+        f"p90={p(0.90):7.3f} p99={p(0.99):7.3f} max={ordered[-1]:7.3f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200, help="calls per mode")
+    parser.add_argument("--path", default="/json/1024", help="stub server path to request")
+    args = parser.parse_args()
+
+    registry = ToolRegistry()
+    registry.load_manifest(TOOLS)
+
+    with StubServer() as stub:
+        url = stub.url + args.path
+        print(f"🌐 {args.calls} GET {args.path} calls per mode\n")
+        for label, cold in [("cold", True), ("warm", False)]:
+            report(label, asyncio.run(measure(registry, url, args.calls, cold)))
+
+
+if __name__ == "__main__":
+    main()
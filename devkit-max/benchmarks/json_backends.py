@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+JSON Backend Benchmark
+Compares the stdlib json module with orjson for json_formatter's
+parse-and-format step on API-style payloads
+
+Usage: python benchmarks/json_backends.py [--sizes 2,64,1024] [--min-time 1.0]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import json_backend  # noqa: E402
+
+LAYOUTS = {
+    "indent=2": {"indent": 2},
+    "compact": {"indent": 2, "compact": True},
+    "indent=2,sorted": {"indent": 2, "sort_keys": True},
+}
+
+
+def api_payload(size_kb: int, seed: int = 7) -> str:
+    """A paginated list endpoint: nested objects, timestamps, URLs, floats, nulls, unicode"""
+    rng = random.Random(seed)
+    items = []
+    size = 0
+    while size < size_kb * 1024:
+        n = len(items)
+        item = {
+            "id": 1_000_000 + n,
+            "node_id": f"MDQ6VXNlcj{n:08d}",
+            "login": f"user-{n}",
+            "name": rng.choice(["Zoë Ramírez", "Li Wei", "Ada Lovelace", "Søren Kierkegaard"]),
+            "html_url": f"https://example.com/users/user-{n}",
+            "created_at": f"2024-{1 + n % 12:02d}-{1 + n % 28:02d}T12:{n % 60:02d}:00Z",
+            "score": round(rng.uniform(0, 100), 4),
+            "site_admin": n % 17 == 0,
+            "company": None if n % 3 else "Example Corp",
+            "labels": [{"name": label, "color": f"{rng.randrange(16 ** 6):06x}"} for label in ("bug", "ui")[: n % 3]],
+            "stats": {"followers": rng.randrange(10_000), "ratio": rng.random(), "history": [rng.randrange(100) for _ in range(8)]},
+        }
+        items.append(item)
+        size += len(json.dumps(item)) + 2
+    return json.dumps({"total_count": len(items), "incomplete_results": False, "items": items})
+
+
+def measure(document: str, layout: Dict[str, Any], min_time: float) -> float:
+    """Calls per second of json_backend.reformat"""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        json_backend.reformat(document, **layout)
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return calls / elapsed
+
+
+def main(argv: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="2,64,1024", help="comma-separated payload sizes in KB")
+    parser.add_argument("--min-time", type=float, default=1.0, help="seconds per case")
+    args = parser.parse_args(argv)
+
+    fast = json_backend.orjson
+    if fast is None:
+        print("⚠️ orjson is not installed (or DEVKIT_JSON_BACKEND=json); only the stdlib can be measured")
+
+    print(f"{'payload':>9}  {'layout':<16} {'json/s':>10} {'orjson/s':>10} {'speedup':>8}")
+    rows = []
+    for size_kb in [int(size) for size in args.sizes.split(",") if size]:
+        document = api_payload(size_kb)
+        for label, layout in LAYOUTS.items():
+            json_backend.orjson = None
+            stdlib = measure(document, layout, args.min_time)
+            json_backend.orjson = fast
+            accelerated = measure(document, layout, args.min_time) if fast is not None else None
+            row = {"size_kb": size_kb, "layout": label, "json_per_s": round(stdlib, 1),
+                   "orjson_per_s": round(accelerated, 1) if accelerated else None}
+            rows.append(row)
+            speedup = f"{accelerated / stdlib:7.1f}x" if accelerated else "-"
+            print(f"{size_kb:>7}KB  {label:<16} {stdlib:>10.1f} {accelerated or 0:>10.1f} {speedup:>8}")
+    return rows
+
+
+if __name__ == "__main__":
+    main()
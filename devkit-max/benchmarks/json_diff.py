@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+JSON Diff Benchmark
+Times json_diff on pairs of large API-style documents that differ in a few
+places, to show time per MB staying flat as the documents grow
+
+Usage: python benchmarks/json_diff.py [--sizes 5,10,25,50] [--changes 10]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.json_backends import api_payload  # noqa: E402
+from utils import json_backend  # noqa: E402
+from utils.json_diff import diff  # noqa: E402
+
+
+def changed_copy(document: str, changes: int, seed: int = 11) -> str:
+    """The document with `changes` edits: changed scores and labels, one item inserted, one removed"""
+    rng = random.Random(seed)
+    data = json.loads(document)
+    items = data["items"]
+    for _ in range(max(changes - 2, 0)):
+        item = rng.choice(items)
+        if rng.random() < 0.5:
+            item["score"] = -1.0
+        else:
+            item["labels"].append({"name": "regression", "color": "ff0000"})
+    items.insert(rng.randrange(len(items)), dict(items[0], id=-1))
+    items.pop(rng.randrange(len(items)))
+    return json.dumps(data)
+
+
+def main(argv: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="5,10,25,50", help="comma-separated document sizes in MB")
+    parser.add_argument("--changes", type=int, default=10, help="edits between the two documents")
+    args = parser.parse_args(argv)
+
+    print(f"📄 json_diff on two documents {args.changes} edits apart ({json_backend.name()} parser)\n")
+    print(f"{'size':>7}  {'parse s':>8}  {'by position s':>13}  {'by id s':>8}  {'ms/MB':>6}  {'ops':>5}")
+    rows = []
+    for size_mb in [int(size) for size in args.sizes.split(",") if size]:
+        old_json = api_payload(size_mb * 1024)
+        new_json = changed_copy(old_json, args.changes)
+
+        start = time.perf_counter()
+        old = json_backend.loads(old_json)
+        new = json_backend.loads(new_json)
+        parse = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ops = diff(old, new)
+        positional = time.perf_counter() - start
+
+        start = time.perf_counter()
+        keyed_ops = diff(old, new, "id")
+        keyed = time.perf_counter() - start
+
+        per_mb = (parse + positional) / size_mb * 1000
+        rows.append({"size_mb": size_mb, "parse_s": round(parse, 3), "positional_s": round(positional, 3),
+                     "keyed_s": round(keyed, 3), "ms_per_mb": round(per_mb, 1),
+                     "ops": len(ops), "keyed_ops": len(keyed_ops)})
+        print(f"{size_mb:>5}MB  {parse:>8.2f}  {positional:>13.2f}  {keyed:>8.2f}  {per_mb:>6.0f}  {len(ops):>5}")
+        del old, new
+    return rows
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+JSON Profile Benchmark
+Times json_formatter's streaming profile mode, full and sampled, against
+json.loads and compares their peak memory
+
+Usage: python benchmarks/json_profile.py [--sizes 1,2,4] [--sample 10]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.json_backends import api_payload  # noqa: E402
+from utils.json_profile import profile  # noqa: E402
+
+
+def peak_memory(func, *args) -> int:
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="1,2,4", help="comma-separated document sizes in MB")
+    parser.add_argument("--sample", type=int, default=10, help="profile every Nth array element in the sampled run")
+    args = parser.parse_args(argv)
+
+    print(f"{'MB':>4}  {'profile s':>9}  {'sampled s':>9}  {'loads s':>8}  {'profile peak':>12}  {'loads peak':>10}")
+    rows = []
+    for size in [int(size) for size in args.sizes.split(",") if size]:
+        text = api_payload(size * 1024)
+        data = text.encode("utf-8")
+
+        start = time.perf_counter()
+        profile(data)
+        full = time.perf_counter() - start
+
+        start = time.perf_counter()
+        profile(data, sample=args.sample)
+        sampled = time.perf_counter() - start
+
+        start = time.perf_counter()
+        json.loads(text)
+        loads = time.perf_counter() - start
+
+        profile_peak = peak_memory(profile, data)
+        loads_peak = peak_memory(json.loads, text)
+
+        rows.append({
+            "mb": size, "profile_s": round(full, 3), "sampled_s": round(sampled, 3), "loads_s": round(loads, 3),
+            "profile_peak_kb": profile_peak // 1024, "loads_peak_kb": loads_peak // 1024,
+        })
+        print(
+            f"{size:>4}  {full:>9.2f}  {sampled:>9.2f}  {loads:>8.3f}  "
+            f"{profile_peak / 1024:>10.0f}KB  {loads_peak / 1024 / 1024:>8.1f}MB"
+        )
+    return rows
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+JSON Schema Benchmark
+Compares json_formatter's compiled schema validators with jsonschema on
+arrays of order records
+
+Usage: python benchmarks/json_schema.py [--counts 1000,10000,100000]
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from jsonschema import validators
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.json_schema import compile_schema  # noqa: E402
+
+SCHEMA = {
+    "type": "array",
+    "items": {"$ref": "#/$defs/order"},
+    "$defs": {
+        "order": {
+            "type": "object",
+            "required": ["id", "customer", "total", "lines"],
+            "additionalProperties": False,
+            "properties": {
+                "id": {"type": "integer", "minimum": 1},
+                "customer": {"type": "string", "minLength": 1},
+                "status": {"enum": ["open", "paid", "shipped"]},
+                "total": {"type": "number", "minimum": 0},
+                "lines": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "required": ["sku", "qty"],
+                        "properties": {"sku": {"type": "string", "pattern": "^[A-Z]{3}-[0-9]+$"}, "qty": {"type": "integer"}},
+                    },
+                },
+            },
+        }
+    },
+}
+
+
+def orders(count: int) -> List[Dict[str, Any]]:
+    return [
+        {"id": n + 1, "customer": f"customer-{n % 997}", "status": ("open", "paid", "shipped")[n % 3],
+         "total": round(n * 1.37, 2), "lines": [{"sku": f"ABC-{n % 50}", "qty": 1 + n % 4}] * (1 + n % 3)}
+        for n in range(count)
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--counts", default="1000,10000,100000", help="comma-separated array lengths")
+    args = parser.parse_args(argv)
+
+    reference = validators.validator_for(SCHEMA)(SCHEMA)
+    print(f"{'records':>8}  {'compiled s':>10}  {'jsonschema s':>12}  {'speedup':>8}")
+    rows = []
+    for count in [int(count) for count in args.counts.split(",") if count]:
+        data = orders(count)
+
+        start = time.perf_counter()
+        compile_schema(SCHEMA).violations(data)
+        compiled = time.perf_counter() - start
+
+        start = time.perf_counter()
+        list(reference.iter_errors(data))
+        interpreted = time.perf_counter() - start
+
+        rows.append({"records": count, "compiled_s": round(compiled, 4), "jsonschema_s": round(interpreted, 4)})
+        print(f"{count:>8}  {compiled:>10.3f}  {interpreted:>12.3f}  {interpreted / compiled:>7.1f}x")
+    return rows
+
+
+if __name__ == "__main__":
+    main()
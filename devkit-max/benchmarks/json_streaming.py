@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+JSON Streaming Benchmark
+Compares json_formatter's tree path (json.loads + json.dumps) with the
+streaming re-indenter on large documents: throughput and peak memory
+
+Each case runs in a fresh process so peak RSS belongs to that case alone.
+
+Usage: python benchmarks/json_streaming.py [--sizes 10,100,500] [--indent 2] [--compact]
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.json_stream import reindent  # noqa: E402
+
+ROW = {
+    "id": 123456,
+    "name": "Widget \"deluxe\" é",
+    "price": 19.99,
+    "tags": ["alpha", "beta", "gamma"],
+    "active": True,
+    "meta": {"owner": None, "dims": [1.5, 2, 3e-5]},
+}
+
+
+def build_document(size_mb: int) -> str:
+    row = json.dumps(ROW, ensure_ascii=False)
+    rows = max(1, size_mb * 1024 * 1024 // (len(row) + 1))
+    return "[" + ",".join([row] * rows) + "]"
+
+
+def rss_kb(field: str) -> Optional[int]:
+    """VmRSS / VmHWM from /proc (Linux); None elsewhere"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def reset_peak() -> bool:
+    """Reset VmHWM to the current RSS so the peak covers only what follows"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def run_case(path: str, size_mb: int, indent: Optional[int], compact: bool) -> Dict[str, Any]:
+    """Format one document in this process; peak_mb is memory above the input document"""
+    document = build_document(size_mb)
+    exact = reset_peak()
+    before_kb = rss_kb("VmRSS") if exact else resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    if path == "tree":
+        formatted = json.dumps(
+            json.loads(document),
+            indent=indent if indent and not compact else None,
+            separators=(",", ":") if compact else None,
+            ensure_ascii=False
+        )
+    else:
+        formatted, _ = reindent(document, indent, compact)
+    elapsed = time.perf_counter() - start
+
+    peak_kb = rss_kb("VmHWM") if exact else resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "path": path,
+        "size_mb": size_mb,
+        "input_bytes": len(document),
+        "output_bytes": len(formatted),
+        "seconds": round(elapsed, 3),
+        "mb_per_s": round(len(document) / 1e6 / elapsed, 2),
+        "peak_mb": round((peak_kb - before_kb) / 1024, 1),
+        "exact_peak": exact,
+    }
+
+
+def spawn_case(path: str, size_mb: int, indent: Optional[int], compact: bool) -> Dict[str, Any]:
+    command = [sys.executable, os.path.abspath(__file__), "--case", path, "--sizes", str(size_mb), "--indent", str(indent)]
+    if compact:
+        command.append("--compact")
+    proc = subprocess.run(command, capture_output=True, text=True)
+    if proc.returncode != 0:
+        reason = "out of memory" if proc.returncode == -9 else f"exit {proc.returncode}"
+        return {"path": path, "size_mb": size_mb, "error": reason}
+    return json.loads(proc.stdout)
+
+
+def main(argv: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="10,100,500", help="comma-separated document sizes in MB")
+    parser.add_argument("--indent", type=int, default=2)
+    parser.add_argument("--compact", action="store_true", help="compact output (structured mode)")
+    parser.add_argument("--case", choices=["tree", "stream"], help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+
+    if args.case:
+        print(json.dumps(run_case(args.case, sizes[0], args.indent, args.compact)))
+        return []
+
+    layout = "compact" if args.compact else f"indent={args.indent}"
+    print(f"📄 json_formatter tree vs streaming ({layout}), one process per case\n")
+    print(f"{'size':>7}  {'path':<7} {'seconds':>9} {'MB/s':>8} {'peak MB':>9}")
+    rows = []
+    for size_mb in sizes:
+        for path in ("tree", "stream"):
+            row = spawn_case(path, size_mb, args.indent, args.compact)
+            rows.append(row)
+            if "error" in row:
+                print(f"{size_mb:>5}MB  {path:<7} {row['error']}")
+                continue
+            print(f"{size_mb:>5}MB  {path:<7} {row['seconds']:>9.2f} {row['mb_per_s']:>8.2f} {row['peak_mb']:>9.1f}")
+    return rows
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Local Input Benchmark
+Compares passing a payload inline through a JSON-RPC request with passing its
+path, for hash_generator, base64_tool and json_formatter's profile mode
+
+Usage: python benchmarks/local_input.py [--sizes 1,16]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.json_backends import api_payload  # noqa: E402
+from tools.manifest import TOOLS  # noqa: E402
+from utils import config  # noqa: E402
+from utils.registry import ToolRegistry  # noqa: E402
+
+CALLS = [
+    ("hash_generator", "input", {"algorithm": "sha256"}),
+    ("base64_tool", "input", {"operation": "encode"}),
+    ("json_formatter", "json_string", {"mode": "profile"}),
+]
+
+
+def timed_call(name: str, arguments: Dict[str, Any]) -> float:
+    """Seconds to serialize and parse the JSON-RPC request, then run the tool"""
+    registry = ToolRegistry()
+    registry.load_manifest(TOOLS)
+    start = time.perf_counter()
+    request = json.dumps({"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+                          "params": {"name": name, "arguments": arguments}})
+    params = json.loads(request)["params"]
+    asyncio.run(registry.call(params["name"], params["arguments"]))
+    return time.perf_counter() - start
+
+
+def main(argv: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="1,16", help="comma-separated payload sizes in MB")
+    args = parser.parse_args(argv)
+
+    print(f"{'tool':<16}  {'MB':>4}  {'inline s':>8}  {'path s':>8}  {'speedup':>8}")
+    rows = []
+    with tempfile.TemporaryDirectory() as root:
+        config.ALLOWED_ROOTS = [root]
+        for size in [int(size) for size in args.sizes.split(",") if size]:
+            payload = api_payload(size * 1024)
+            path = os.path.join(root, f"payload-{size}.json")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(payload)
+
+            for name, argument, extra in CALLS:
+                inline = timed_call(name, {argument: payload, **extra})
+                by_path = timed_call(name, {"path": path, **extra})
+                rows.append({"tool": name, "mb": size, "inline_s": round(inline, 3), "path_s": round(by_path, 3)})
+                print(f"{name:<16}  {size:>4}  {inline:>8.3f}  {by_path:>8.3f}  {inline / by_path:>7.1f}x")
+    return rows
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Offload Latency Benchmark
+Measures small-request latency while large json/sql/base64/hash calls run,
+with worker-pool offloading enabled and disabled
+
+Usage: python benchmarks/offload_latency.py [--size-mb 8] [--small 200]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.manifest import TOOLS  # noqa: E402
+from utils import config, executor  # noqa: E402
+from utils.registry import ToolRegistry  # noqa: E402
+
+
+def large_calls(size_mb: int):
+    size = size_mb * 1024 * 1024
+    row = {"id": 1, "name": "benchmark", "tags": ["a", "b", "c"], "score": 0.5}
+    rows = max(1, size // len(json.dumps(row)))
+    document = json.dumps([row] * rows)
+    sql = "select id, name from users where id = 1 and name = 'x' order by id;\n"
+    return [
+        ("json_formatter", {"json_string": document, "sort_keys": True}),
+        ("sql_formatter", {"sql": sql * (size // len(sql) // 8)}),
+        ("base64_tool", {"operation": "encode", "input": "x" * size}),
+        ("hash_generator", {"input": "x" * size, "algorithm": "sha512"}),
+    ]
+
+
+async def measure(registry: ToolRegistry, size_mb: int, small: int, interval: float = 0.005):
+    """
+    Issue small calls on a fixed schedule while large calls run. Latency is
+    measured from each call's scheduled time, so event loop stalls count.
+    """
+    large = [asyncio.create_task(registry.call(name, args)) for name, args in large_calls(size_mb)]
+
+    latencies = []
+    origin = time.perf_counter()
+    for i in range(small):
+        scheduled = origin + i * interval
+        await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+        await registry.call("hash_generator", {"input": "hello"})
+        latencies.append((time.perf_counter() - scheduled) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*large)
+    drain_ms = (time.perf_counter() - started) * 1000
+    return latencies, drain_ms
+
+
+def report(label: str, latencies, drain_ms: float):
+    ordered = sorted(latencies)
+    p = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    print(
+        f"{label:<10} small-call latency ms: "
+        f"p50={statistics.median(ordered):8.2f} p90={p(0.90):8.2f} "
+        f"p99={p(0.99):8.2f} max={ordered[-1]:8.2f}  "
+        f"(large calls still running after small ones: {drain_ms:.0f}ms)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=int, default=8, help="size of each large payload")
+    parser.add_argument("--small", type=int, default=200, help="number of small calls")
+    args = parser.parse_args()
+
+    registry = ToolRegistry()
+    registry.load_manifest(TOOLS)
+    registry.warm_up()
+
+    print(f"⚙️ {args.size_mb} MB payloads, {args.small} small hash_generator calls\n")
+    for label, scale in [("inline", 10 ** 9), ("offloaded", 100)]:
+        config.OFFLOAD_THRESHOLD_SCALE = scale
+        try:
+            latencies, drain_ms = asyncio.run(measure(registry, args.size_mb, args.small))
+        finally:
+            executor.shutdown_pools()
+        report(label, latencies, drain_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Output Mode Benchmark
+Compares JSON-RPC payload size and serialization time of markdown and
+structured replies for large tool results
+
+Usage: python benchmarks/output_modes.py [--size-mb 10]
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mcp.types as types  # noqa: E402
+
+from tools.manifest import TOOLS  # noqa: E402
+from utils import config, executor  # noqa: E402
+from utils.registry import ToolRegistry, to_content  # noqa: E402
+
+
+def cases(size: int):
+    text = ("DevKit output benchmark 0123456789 " * (size // 35 + 1))[:size]
+    document = json.dumps([{"id": i, "name": "row", "tags": ["a", "b"]} for i in range(size // 40)])
+    return [
+        ("base64_tool encode", "base64_tool", {"operation": "encode", "input": text}),
+        ("base64_tool decode", "base64_tool",
+         {"operation": "decode", "input": base64.b64encode(text.encode()).decode()}),
+        ("json_formatter", "json_formatter", {"json_string": document, "indent": 2}),
+        ("hash_generator", "hash_generator", {"input": text}),
+        ("uuid_generator x50", "uuid_generator", {"count": 50}),
+    ]
+
+
+def serialize(result) -> str:
+    """What the server writes to the transport for a tools/call reply"""
+    return types.CallToolResult(content=to_content(result)).model_dump_json(by_alias=True, exclude_none=True)
+
+
+async def measure(registry: ToolRegistry, tool: str, arguments: dict, repeat: int):
+    result = await registry.call(tool, arguments)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        payload = serialize(result)
+    return len(payload.encode()), (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=float, default=10, help="input size for payload tools")
+    parser.add_argument("--repeat", type=int, default=5, help="serializations per measurement")
+    args = parser.parse_args()
+
+    config.OFFLOAD_THRESHOLD_SCALE = 10 ** 9
+    registry = ToolRegistry()
+    registry.load_manifest(TOOLS)
+    registry.cache_policies.clear()
+
+    size = int(args.size_mb * 1024 * 1024)
+    print(f"📏 Inputs of {args.size_mb:g} MB\n")
+    print(f"{'case':<20} {'markdown':>14} {'structured':>14} {'saved':>7}   {'md ser':>9} {'st ser':>9}")
+    try:
+        for label, tool, arguments in cases(size):
+            md_bytes, md_ms = asyncio.run(measure(registry, tool, arguments, args.repeat))
+            st_bytes, st_ms = asyncio.run(
+                measure(registry, tool, dict(arguments, output="structured"), args.repeat)
+            )
+            saved = (1 - st_bytes / md_bytes) * 100
+            print(
+                f"{label:<20} {md_bytes:>12,}B {st_bytes:>12,}B {saved:>6.1f}%   "
+                f"{md_ms:>7.2f}ms {st_ms:>7.2f}ms"
+            )
+    finally:
+        executor.shutdown_pools()
+
+
+if __name__ == "__main__":
+    main()
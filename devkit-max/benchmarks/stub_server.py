@@ -0,0 +1,116 @@
+"""
+Local HTTP Stub Server
+In-process HTTP server for benchmarking and testing http_tester
+
+Routes:
+    /bytes/<n>   n bytes of text/plain
+    /json/<n>    JSON array of about n bytes
+    /delay/<ms>  small JSON reply after a delay
+    /cache/<s>   JSON with Cache-Control max-age=<s> and an ETag; answers
+                 If-None-Match with 304
+    anything     JSON echo of method, path and body
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY, keep-alive
+    # requests stall ~40ms on Nagle's algorithm plus delayed ACKs
+    disable_nagle_algorithm = True
+
+    def _send(self, status: int, content_type: str, payload: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(payload)
+
+    def _send_repeated(self, status: int, content_type: str, unit: bytes, size: int):
+        """Write `size` bytes of `unit` in blocks, so huge bodies never sit in memory"""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(size))
+        self.end_headers()
+        if self.command == "HEAD":
+            return
+        block = unit * (64 * 1024 // len(unit))
+        try:
+            while size > 0:
+                self.wfile.write(block[:size])
+                size -= len(block)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client stopped reading (e.g. http_tester max_bytes)
+            self.close_connection = True
+
+    def _reply(self):
+        self.server.requests.append((self.command, self.path, dict(self.headers)))
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode() if length else ""
+        parts = self.path.split("?")[0].strip("/").split("/")
+
+        if len(parts) == 2 and parts[0] == "bytes" and parts[1].isdigit():
+            self._send_repeated(200, "text/plain", b"x", int(parts[1]))
+        elif len(parts) == 2 and parts[0] == "json" and parts[1].isdigit():
+            item = b'{"id": 1, "name": "stub"}'
+            count = max(1, int(parts[1]) // (len(item) + 2))
+            self._send(200, "application/json", b"[" + b", ".join([item] * count) + b"]")
+        elif len(parts) == 2 and parts[0] == "cache" and parts[1].isdigit():
+            etag = '"v1"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", f"max-age={parts[1]}")
+                self.end_headers()
+            else:
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", "15")
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", f"max-age={parts[1]}")
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(b'{"version": 1}\n')
+        elif len(parts) == 2 and parts[0] == "delay" and parts[1].isdigit():
+            time.sleep(int(parts[1]) / 1000)
+            self._send(200, "application/json", b'{"delayed": true}')
+        else:
+            payload = json.dumps({"method": self.command, "path": self.path, "body": body}).encode()
+            self._send(200, "application/json", payload)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = do_HEAD = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer:
+    """Runs StubHandler on an ephemeral localhost port in a daemon thread"""
+
+    def __init__(self, handler=StubHandler):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.httpd.daemon_threads = True
+        # (method, path, headers) of every request received
+        self.httpd.requests = []
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    @property
+    def requests(self):
+        return self.httpd.requests
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+DevKit Max Benchmark Suite
+Runs the real tool handlers in-process over payload-size sweeps and reports
+ops/sec, latency percentiles and peak memory, with JSON baselines for
+regression checks
+
+Usage:
+    python benchmarks/suite.py                         # full sweep (up to 50 MB)
+    python benchmarks/suite.py --quick                 # payloads up to 1 MB
+    python benchmarks/suite.py --save baseline.json
+    python benchmarks/suite.py --compare baseline.json --threshold 25
+    python benchmarks/suite.py --only json_formatter,hash_generator
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_server import StubServer  # noqa: E402
+from tools.manifest import TOOLS  # noqa: E402
+from utils import config, executor  # noqa: E402
+from utils.registry import ToolRegistry  # noqa: E402
+
+KB = 1024
+MB = 1024 * KB
+
+SAMPLE_JWT = (
+    "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9."
+    "eyJzdWIiOiIxMjM0NTY3ODkwIiwibmFtZSI6IkpvaG4gRG9lIiwiaWF0IjoxNTE2MjM5MDIyfQ."
+    "SflKxwRJSMeKKF2QT4fwpMeJf36POk6yJV_adQssw5c"
+)
+
+
+def size_label(size: int) -> str:
+    if size >= MB:
+        return f"{size // MB}MB"
+    if size >= KB:
+        return f"{size // KB}KB"
+    return f"{size}B"
+
+
+def json_payload(size: int) -> str:
+    """A JSON array of API-like records, about `size` bytes"""
+    row = {"id": 12345, "name": "benchmark user", "active": True, "tags": ["a", "b"], "score": 0.75}
+    rows = max(1, size // (len(json.dumps(row)) + 2))
+    return json.dumps([dict(row, id=i) for i in range(rows)])
+
+
+def sql_payload(size: int) -> str:
+    statement = (
+        "select u.id, u.name, count(o.id) as orders from users u "
+        "left join orders o on o.user_id = u.id where u.active = 1 and o.total > 10 "
+        "group by u.id, u.name having count(o.id) > 2 order by orders desc limit 50;\n"
+    )
+    return statement * max(1, size // len(statement))
+
+
+def text_payload(size: int) -> str:
+    return ("DevKit benchmark payload 0123456789 " * (size // 36 + 1))[:size]
+
+
+class Case:
+    """One benchmark: a tool called with fixed arguments"""
+
+    def __init__(self, tool: str, label: str, arguments: Callable[[], Dict[str, Any]], size: int = 0):
+        self.tool = tool
+        self.label = label
+        self.arguments = arguments
+        self.size = size
+
+    @property
+    def id(self) -> str:
+        return f"{self.tool}/{self.label}"
+
+
+def build_cases(max_size: int, http_url: Optional[str]) -> List[Case]:
+    cases = []
+    sizes = [s for s in [1 * KB, 64 * KB, 1 * MB, 10 * MB, 50 * MB] if s <= max_size]
+
+    for size in sizes:
+        cases.append(Case("json_formatter", size_label(size),
+                          lambda s=size: {"json_string": json_payload(s)}, size))
+        cases.append(Case("json_formatter", f"{size_label(size)}-sorted",
+                          lambda s=size: {"json_string": json_payload(s), "sort_keys": True}, size))
+        cases.append(Case("hash_generator", size_label(size),
+                          lambda s=size: {"input": text_payload(s), "algorithm": "sha256"}, size))
+        cases.append(Case("base64_tool", f"encode-{size_label(size)}",
+                          lambda s=size: {"operation": "encode", "input": text_payload(s)}, size))
+        cases.append(Case("base64_tool", f"decode-{size_label(size)}",
+                          lambda s=size: {"operation": "decode",
+                                          "input": base64.b64encode(text_payload(s).encode()).decode()}, size))
+
+    for size in [s for s in [1 * KB, 100 * KB, 1 * MB, 5 * MB] if s <= max_size]:
+        cases.append(Case("sql_formatter", size_label(size), lambda s=size: {"sql": sql_payload(s)}, size))
+
+    for count in [1, 10, 50]:
+        cases.append(Case("uuid_generator", f"count-{count}", lambda c=count: {"count": c}))
+
+    cases.append(Case("jwt_decoder", "token", lambda: {"token": SAMPLE_JWT}, len(SAMPLE_JWT)))
+    cases.append(Case("timestamp_tool", "unix", lambda: {"input": "1672531200"}))
+    cases.append(Case("timestamp_tool", "human", lambda: {"input": "January 1, 2023 10:00 AM"}))
+    cases.append(Case("color_converter", "hex", lambda: {"color": "#FF5733"}))
+    cases.append(Case("color_converter", "hsl", lambda: {"color": "hsl(11, 100%, 60%)"}))
+
+    if http_url:
+        for size in [s for s in [1 * KB, 100 * KB, 1 * MB] if s <= max_size]:
+            cases.append(Case("http_tester", f"json-{size_label(size)}",
+                              lambda s=size: {"method": "GET", "url": f"{http_url}/json/{s}"}, size))
+        cases.append(Case("http_tester", "post-echo",
+                          lambda: {"method": "POST", "url": f"{http_url}/echo", "body": '{"a": 1}'}))
+
+    return cases
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run_case(registry: ToolRegistry, case: Case, min_time: float, max_iterations: int) -> Dict[str, Any]:
+    arguments = case.arguments()
+
+    # Warm-up call: imports the tool module and primes any pools
+    await registry.call(case.tool, arguments)
+
+    samples = []
+    started = time.perf_counter()
+    while len(samples) < max_iterations:
+        start = time.perf_counter()
+        await registry.call(case.tool, arguments)
+        samples.append((time.perf_counter() - start) * 1000)
+        if len(samples) >= 3 and time.perf_counter() - started >= min_time:
+            break
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    await registry.call(case.tool, arguments)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    ordered = sorted(samples)
+    return {
+        "tool": case.tool,
+        "case": case.label,
+        "payload_bytes": case.size,
+        "iterations": len(samples),
+        "ops_per_sec": len(samples) / elapsed,
+        "p50_ms": percentile(ordered, 0.50),
+        "p90_ms": percentile(ordered, 0.90),
+        "p99_ms": percentile(ordered, 0.99),
+        "max_ms": ordered[-1],
+        "peak_mem_bytes": peak,
+    }
+
+
+async def run_suite(cases: List[Case], min_time: float, max_iterations: int) -> Dict[str, Dict[str, Any]]:
+    registry = ToolRegistry()
+    registry.load_manifest(TOOLS)
+    # Measure the tools themselves, not the result cache
+    registry.cache_policies.clear()
+
+    results = {}
+    for case in cases:
+        result = await run_case(registry, case, min_time, max_iterations)
+        results[case.id] = result
+        print(
+            f"  {case.id:<36} {result['ops_per_sec']:>10.1f} ops/s "
+            f"p50 {result['p50_ms']:>9.3f}ms p90 {result['p90_ms']:>9.3f}ms "
+            f"p99 {result['p99_ms']:>9.3f}ms peak {result['peak_mem_bytes'] / MB:>8.2f}MB",
+            file=sys.stderr
+        )
+    return results
+
+
+def compare(baseline: Dict[str, Any], results: Dict[str, Dict[str, Any]], threshold: float) -> List[str]:
+    """Cases whose p50 latency or peak memory grew more than `threshold` percent"""
+    regressions = []
+    for case_id, result in results.items():
+        before = baseline.get("results", {}).get(case_id)
+        if before is None:
+            continue
+        for metric in ["p50_ms", "peak_mem_bytes"]:
+            old, new = before[metric], result[metric]
+            if old > 0 and (new - old) / old * 100 > threshold:
+                regressions.append(f"{case_id} {metric}: {old:.3f} → {new:.3f} (+{(new - old) / old * 100:.0f}%)")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="DevKit Max benchmark suite")
+    parser.add_argument("--quick", action="store_true", help="cap payloads at 1 MB")
+    parser.add_argument("--max-size-mb", type=int, default=50, help="largest payload size")
+    parser.add_argument("--only", default="", help="comma-separated tool names")
+    parser.add_argument("--min-time", type=float, default=1.0, help="seconds per case")
+    parser.add_argument("--max-iterations", type=int, default=1000, help="iterations per case")
+    parser.add_argument("--offload", action="store_true", help="keep worker-pool offloading enabled")
+    parser.add_argument("--no-http", action="store_true", help="skip http_tester cases")
+    parser.add_argument("--save", help="write results as a JSON baseline")
+    parser.add_argument("--compare", help="baseline JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=20.0, help="regression threshold in percent")
+    args = parser.parse_args(argv)
+
+    max_size = 1 * MB if args.quick else args.max_size_mb * MB
+    only = {name.strip() for name in args.only.split(",") if name.strip()}
+
+    offload_scale = config.OFFLOAD_THRESHOLD_SCALE
+    if not args.offload:
+        # Run everything on the calling thread so peak memory covers the work
+        config.OFFLOAD_THRESHOLD_SCALE = 10 ** 9
+
+    print(f"🏁 DevKit Max benchmarks (payloads up to {size_label(max_size)})\n", file=sys.stderr)
+
+    stub = None if args.no_http else StubServer().__enter__()
+    try:
+        cases = build_cases(max_size, stub.url if stub else None)
+        if only:
+            cases = [case for case in cases if case.tool in only]
+        results = asyncio.run(run_suite(cases, args.min_time, args.max_iterations))
+    finally:
+        if stub:
+            stub.__exit__(None, None, None)
+        executor.shutdown_pools()
+        config.OFFLOAD_THRESHOLD_SCALE = offload_scale
+
+    report = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "offload": args.offload,
+        },
+        "results": results,
+    }
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Saved baseline to {args.save}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, results, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) over {args.threshold:g}%:", file=sys.stderr)
+            for line in regressions:
+                print(f"  • {line}", file=sys.stderr)
+            return 1
+        print(f"\n✅ No regressions over {args.threshold:g}%", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""
+Shared pytest fixtures for DevKit Max
+"""
+
+import asyncio
+
+import pytest
+
+from benchmarks.stub_server import StubServer
+from tools.manifest import TOOLS
+from utils import http_pool
+from utils.registry import ToolRegistry
+
+
+@pytest.fixture
+def http_stub():
+    """Local HTTP server on an ephemeral port; yields its base URL"""
+    with StubServer() as stub:
+        yield stub.url
+
+
+@pytest.fixture
+def registry():
+    """A ToolRegistry loaded from the manifest, as server.py builds it"""
+    registry = ToolRegistry()
+    registry.load_manifest(TOOLS)
+    return registry
+
+
+@pytest.fixture
+def call_tool(registry):
+    """
+    call_tool(name, arguments) runs one call through the registry fixture and
+    returns its reply; http_tester's pooled clients are closed afterwards,
+    since each call gets its own event loop
+    """
+    def call(name, arguments):
+        async def scenario():
+            try:
+                return await registry.call(name, arguments)
+            finally:
+                await http_pool.close_clients()
+
+        return asyncio.run(scenario())
+
+    return call
+
+
+@pytest.fixture
+def tool_text(call_tool):
+    """tool_text(name, arguments): the text of the reply's first content block"""
+    return lambda name, arguments: call_tool(name, arguments)["content"][0]["text"]
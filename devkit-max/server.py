@@ -1,67 +1,218 @@
 #!/usr/bin/env python3
 """
 DevKit Max - MCP Server with 9 Developer Tools
-Main server entry point with dynamic tool loading
+Main server entry point with lazy tool loading
+
+All tools share one registry: a single list_tools/call_tool pair is installed
+on the server and calls are dispatched by tool name in constant time.
+list_tools is answered from the static manifest in tools/manifest.py; each
+tool module is imported only when it is first called.
 """
 
+import argparse
 import asyncio
-import importlib
-import os
+import secrets
 import sys
-from typing import List
+import weakref
+from typing import List, Optional, Set
 
 from mcp.server import Server, NotificationOptions
+from mcp.server.lowlevel.helper_types import ReadResourceContents
 import mcp.server.stdio
+import mcp.types as types
+
+from tools.manifest import TOOLS
+from utils import config, http_pool, spill
+from utils.executor import shutdown_pools
+from utils.output import is_structured
+from utils.registry import ToolRegistry, to_content
 
 # Initialize server
 server = Server("devkit-max")
 
-# Track loaded tools
+# Tool name -> handler, plus the schemas advertised by list_tools
+registry = ToolRegistry()
+
+# Track indexed tools
 loaded_tools: List[str] = []
 
+# Keeps background warm-up futures alive until they finish
+_background: Set[asyncio.Future] = set()
+
+# Client session -> key its spilled results are stored under
+_session_keys: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def session_key() -> Optional[str]:
+    """The spill store key of the session making the current request"""
+    try:
+        session = server.request_context.session
+    except LookupError:
+        return None
+    return _session_keys.setdefault(session, secrets.token_hex(8))
+
+
+@server.list_tools()
+async def handle_list_tools() -> List[types.Tool]:
+    return registry.tools
+
+
+@server.call_tool()
+async def handle_call_tool(name: str, arguments: dict) -> List[types.TextContent]:
+    token = spill.session.set(session_key())
+    try:
+        result = await registry.call(name, arguments)
+        return to_content(spill.spill_large_result(result, name, is_structured(arguments or {})))
+    finally:
+        spill.session.reset(token)
+
+
+@server.list_resources()
+async def handle_list_resources() -> List[types.Resource]:
+    return [
+        types.Resource(
+            uri=entry.uri,
+            name=f"{entry.label} result",
+            description=f"{entry.chars:,} chars; append ?offset=&length= to read a range",
+            mimeType=entry.mime_type,
+            size=entry.bytes
+        )
+        for entry in spill.store.list(session_key())
+    ]
+
+
+@server.list_resource_templates()
+async def handle_list_resource_templates() -> List[types.ResourceTemplate]:
+    return [
+        types.ResourceTemplate(
+            uriTemplate=spill.URI_PREFIX + "{id}?offset={offset}&length={length}",
+            name="result-range",
+            description="A character range of a large tool result"
+        )
+    ]
+
+
+@server.read_resource()
+async def handle_read_resource(uri) -> List[ReadResourceContents]:
+    entry_id, offset, length = spill.parse_uri(str(uri))
+    try:
+        text, entry = await asyncio.to_thread(spill.store.read, entry_id, offset, length, session_key())
+    except KeyError:
+        raise ValueError(f"Result expired or unknown: {uri}")
+    return [ReadResourceContents(content=text, mime_type=entry.mime_type)]
+
 
 def load_tools():
-    """Dynamically load all tools from tools directory"""
+    """Index all tools from the static manifest; modules are imported on first call"""
     global loaded_tools
     
-    tools_dir = os.path.join(os.path.dirname(__file__), "tools")
+    if loaded_tools:
+        return loaded_tools
     
-    # Find all Python files in tools directory
-    tool_files = [
-        f[:-3] for f in os.listdir(tools_dir)
-        if f.endswith(".py") and f != "__init__.py"
-    ]
+    loaded_tools = registry.load_manifest(TOOLS)
+    print(f"📦 Indexed {len(loaded_tools)} tools (imported on first use)", file=sys.stderr)
+    return loaded_tools
+
+
+def enable_warm_up():
+    """Import every tool module in a background thread once the client handshake completes"""
     
-    print(f"📦 Loading {len(tool_files)} tools...", file=sys.stderr)
+    async def handle_initialized(notification: types.InitializedNotification):
+        loop = asyncio.get_running_loop()
+        _background.add(loop.run_in_executor(None, _warm_up))
     
-    for tool_file in sorted(tool_files):
+    server.notification_handlers[types.InitializedNotification] = handle_initialized
+
+
+def _warm_up():
+    try:
+        warmed = registry.warm_up()
+        print(f"🔥 Warmed up {len(warmed)} tools", file=sys.stderr)
+    except Exception as e:
+        print(f"  ❌ Warm-up failed - {str(e)}", file=sys.stderr)
+
+
+async def dump_metrics(path: str, interval: int):
+    """Write Prometheus-format metrics to a local file every `interval` seconds"""
+    while True:
+        await asyncio.sleep(interval)
         try:
-            # Dynamically import tool module
-            module = importlib.import_module(f"tools.{tool_file}")
-            
-            # Call register_tool function if it exists
-            if hasattr(module, "register_tool"):
-                module.register_tool(server)
-                loaded_tools.append(tool_file)
-                print(f"  ✅ {tool_file}", file=sys.stderr)
-            else:
-                print(f"  ⚠️  {tool_file} - missing register_tool function", file=sys.stderr)
-        except Exception as e:
-            print(f"  ❌ {tool_file} - {str(e)}", file=sys.stderr)
-    
-    print(f"\n✨ Loaded {len(loaded_tools)} tools successfully!", file=sys.stderr)
-    return loaded_tools
+            registry.metrics.write_prometheus(path, registry.cache.stats())
+        except OSError as e:
+            print(f"  ❌ Metrics dump failed - {str(e)}", file=sys.stderr)
 
 
-async def main():
+async def main(
+    warm_up: bool = False,
+    transport: str = "stdio",
+    host: str = config.HTTP_HOST,
+    port: int = config.HTTP_PORT,
+    max_concurrency: int = config.HTTP_MAX_CONCURRENCY
+):
     """Main entry point for the MCP server"""
-    # Load all tools
+    # Index all tools
     load_tools()
+    if warm_up and transport == "http":
+        # Clients share this process, so warm up once at startup instead of per session
+        _background.add(asyncio.get_running_loop().run_in_executor(None, _warm_up))
+    elif warm_up:
+        enable_warm_up()
+    
+    metrics_task = None
+    if config.METRICS_FILE:
+        metrics_task = asyncio.create_task(
+            dump_metrics(config.METRICS_FILE, max(1, config.METRICS_INTERVAL))
+        )
     
-    # Run MCP server over stdio
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, NotificationOptions())
+    try:
+        if transport == "http":
+            # Imported here so stdio startup does not pay for uvicorn/starlette
+            from utils import http_transport
+            await http_transport.serve(server, host, port, max_concurrency, config.HTTP_SHUTDOWN_TIMEOUT)
+            return
+        
+        # Run MCP server over stdio
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(NotificationOptions())
+            )
+    finally:
+        if metrics_task is not None:
+            metrics_task.cancel()
+            registry.metrics.write_prometheus(config.METRICS_FILE, registry.cache.stats())
+        await http_pool.close_clients()
+        shutdown_pools()
+        spill.store.clear()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="DevKit Max MCP server")
+    parser.add_argument(
+        "--warm-up",
+        action="store_true",
+        help="import all tool modules in the background after the handshake"
+    )
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "http"],
+        default="stdio",
+        help="stdio for one client per process, http to serve many clients at /mcp"
+    )
+    parser.add_argument("--host", default=config.HTTP_HOST, help="HTTP bind address")
+    parser.add_argument("--port", type=int, default=config.HTTP_PORT, help="HTTP port")
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=config.HTTP_MAX_CONCURRENCY,
+        help="HTTP requests handled at once; further requests wait"
+    )
+    args = parser.parse_args()
+    asyncio.run(main(
+        warm_up=args.warm_up,
+        transport=args.transport,
+        host=args.host,
+        port=args.port,
+        max_concurrency=args.max_concurrency
+    ))
@@ -0,0 +1,39 @@
+"""
+Benchmark suite tests for DevKit Max
+Runs a tiny sweep and checks baseline save/compare
+"""
+
+import json
+
+from benchmarks import suite
+
+
+def test_suite_saves_baseline_and_flags_regressions(tmp_path):
+    baseline_path = tmp_path / "baseline.json"
+    argv = [
+        "--quick", "--only", "hash_generator,uuid_generator",
+        "--min-time", "0", "--max-iterations", "3", "--no-http",
+    ]
+
+    assert suite.main(argv + ["--save", str(baseline_path)]) == 0
+    baseline = json.loads(baseline_path.read_text())
+    assert "hash_generator/1MB" in baseline["results"]
+    assert "uuid_generator/count-50" in baseline["results"]
+    row = baseline["results"]["hash_generator/1KB"]
+    assert row["iterations"] == 3 and row["ops_per_sec"] > 0
+    assert row["p50_ms"] <= row["p99_ms"] <= row["max_ms"]
+
+    # A baseline claiming everything used to be 1000x faster must fail the comparison
+    for row in baseline["results"].values():
+        row["p50_ms"] /= 1000
+    baseline_path.write_text(json.dumps(baseline))
+    assert suite.main(argv + ["--compare", str(baseline_path)]) == 1
+
+
+def test_compare_ignores_small_changes_and_new_cases():
+    baseline = {"results": {"t/a": {"p50_ms": 1.0, "peak_mem_bytes": 1000}}}
+    results = {
+        "t/a": {"p50_ms": 1.1, "peak_mem_bytes": 1300},
+        "t/b": {"p50_ms": 50.0, "peak_mem_bytes": 10},
+    }
+    assert suite.compare(baseline, results, threshold=20) == ["t/a peak_mem_bytes: 1000.000 → 1300.000 (+30%)"]
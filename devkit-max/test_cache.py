@@ -0,0 +1,110 @@
+"""
+Cache tests for DevKit Max
+Covers LRU eviction, TTL expiry, counters and registry integration
+"""
+
+import asyncio
+
+from tools.manifest import TOOLS
+from utils import config
+from utils.cache import ResultCache, cache_key, result_size
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def text_result(text):
+    return {"content": [{"type": "text", "text": text}]}
+
+
+def test_key_is_canonical():
+    assert cache_key("t", {"a": 1, "b": [1, 2]}) == cache_key("t", {"b": [1, 2], "a": 1})
+    assert cache_key("t", {"a": 1}) != cache_key("u", {"a": 1})
+    assert cache_key("t", {"a": 1}) != cache_key("t", {"a": "1"})
+
+
+def test_lru_eviction_respects_byte_bound():
+    entry = text_result("x" * 1000)
+    per_entry = result_size(entry) + 100
+    cache = ResultCache(max_bytes=3 * per_entry)
+
+    for key in ["a", "b", "c"]:
+        cache.put(key, entry)
+    assert cache.get("a") is entry  # "a" becomes most recently used
+    cache.put("d", entry)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is entry
+    assert cache.evictions == 1
+    assert cache.current_bytes <= cache.max_bytes
+
+
+def test_oversized_result_is_not_cached():
+    cache = ResultCache(max_bytes=100)
+    cache.put("big", text_result("x" * 1000))
+    assert len(cache) == 0 and cache.current_bytes == 0
+
+
+def test_ttl_expiry():
+    clock = FakeClock()
+    cache = ResultCache(max_bytes=10_000, clock=clock)
+    cache.put("k", text_result("v"), ttl=60)
+
+    clock.now = 59.9
+    assert cache.get("k") is not None
+    clock.now = 60.0
+    assert cache.get("k") is None
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["expirations"]) == (1, 1, 1)
+    assert stats["entries"] == 0 and stats["bytes"] == 0
+
+
+def test_registry_caches_opted_in_tools_only(registry):
+    calls = []
+
+    async def counting_handler(name, arguments):
+        calls.append(name)
+        return text_result(f"{name} result")
+
+    registry.handlers["hash_generator"] = counting_handler
+    registry.handlers["uuid_generator"] = counting_handler
+
+    async def scenario():
+        for _ in range(3):
+            await registry.call("hash_generator", {"input": "a", "algorithm": "md5"})
+            await registry.call("hash_generator", {"algorithm": "md5", "input": "a"})
+            await registry.call("uuid_generator", {"count": 1})
+
+    asyncio.run(scenario())
+    assert calls.count("hash_generator") == 1
+    assert calls.count("uuid_generator") == 3
+    assert registry.cache.hits == 5
+    assert registry.cache.misses == 1
+
+
+def test_large_arguments_skip_the_cache(registry, monkeypatch):
+    monkeypatch.setattr(config, "CACHE_MAX_ARGUMENT_CHARS", 100)
+    keys = []
+    monkeypatch.setattr("utils.registry.cache_key", lambda *args: keys.append(args) or cache_key(*args))
+
+    async def scenario():
+        for _ in range(2):
+            await registry.call("hash_generator", {"input": "a" * 101})
+            await registry.call("hash_generator", {"input": "a" * 100})
+
+    asyncio.run(scenario())
+    assert keys == [("hash_generator", {"input": "a" * 100})] * 2
+    assert (registry.cache.hits, registry.cache.misses) == (1, 1)
+
+
+def test_clock_dependent_tools_have_ttl():
+    assert TOOLS["jwt_decoder"]["cache"]["ttl"] is not None
+    assert TOOLS["timestamp_tool"]["cache"]["ttl"] is not None
+    assert "cache" not in TOOLS["uuid_generator"]
+    assert "cache" not in TOOLS["http_tester"]
@@ -0,0 +1,75 @@
+"""
+Executor tests for DevKit Max
+Checks that large tool inputs are offloaded and give the same results
+"""
+
+import asyncio
+import json
+import threading
+
+from utils import executor
+from tools.base64_tool import encode_base64
+from tools.hash_generator import compute_hash
+from tools.json_formatter import format_json
+from tools.sql_formatter import format_sql
+
+
+def current_thread_name(_size):
+    return threading.current_thread().name
+
+
+def test_small_input_runs_inline():
+    assert not executor.should_offload("hash_generator", 10)
+    result = asyncio.run(executor.run_tool_work("hash_generator", 10, current_thread_name, 10))
+    assert result == threading.current_thread().name
+
+
+def test_large_input_uses_thread_pool():
+    size = 1024 * 1024
+    assert executor.should_offload("hash_generator", size)
+    result = asyncio.run(executor.run_tool_work("hash_generator", size, current_thread_name, size))
+    assert result.startswith("devkit-worker")
+
+
+def test_tools_without_policy_never_offload():
+    assert not executor.should_offload("uuid_generator", 10 ** 9)
+
+
+def test_process_pool_matches_inline():
+    document = json.dumps({"items": [{"id": i, "name": f"item-{i}"} for i in range(5000)]})
+    sql = "select id, name from users where id = 1 and name = 'x';\n" * 500
+    text = "x" * (2 * 1024 * 1024)
+
+    async def scenario():
+        return await asyncio.gather(
+            executor.run_tool_work("json_formatter", len(document), format_json, document, 2, True),
+            executor.run_tool_work("sql_formatter", len(sql), format_sql, sql, 2, "upper"),
+            executor.run_tool_work("base64_tool", len(text), encode_base64, text, False),
+            executor.run_tool_work("hash_generator", len(text), compute_hash, text, "sha256", "hex"),
+        )
+
+    try:
+        results = asyncio.run(scenario())
+    finally:
+        executor.shutdown_pools()
+
+    assert results[0] == format_json(document, 2, True)
+    assert results[1] == format_sql(sql, 2, "upper")
+    assert results[2] == encode_base64(text, False)
+    assert results[3] == compute_hash(text, "sha256", "hex")
+
+
+def test_invalid_json_error_survives_process_pool():
+    bad = "[" + "1," * 40000 + "oops]"
+
+    async def scenario():
+        return await executor.run_tool_work("json_formatter", len(bad), format_json, bad, 2, False)
+
+    try:
+        asyncio.run(scenario())
+    except json.JSONDecodeError as e:
+        assert e.colno == len(bad) - 4
+    else:
+        raise AssertionError("expected JSONDecodeError")
+    finally:
+        executor.shutdown_pools()
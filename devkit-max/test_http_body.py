@@ -0,0 +1,57 @@
+"""
+Streaming body tests for DevKit Max
+Checks http_tester's bounded preview, streaming hash and max_bytes abort
+"""
+
+import hashlib
+import json
+import tracemalloc
+
+from utils.http_body import BodyRead
+
+MB = 1024 * 1024
+
+
+def test_large_body_is_counted_and_hashed_without_buffering(http_stub, tool_text):
+    size = 20 * MB
+    tracemalloc.start()
+    reply = json.loads(tool_text("http_tester", {
+        "method": "GET", "url": f"{http_stub}/bytes/{size}",
+        "body_hash": "sha256", "output": "structured",
+    }))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result = reply["result"]
+
+    assert result["size_bytes"] == size
+    assert result["body_hash"] == {"algorithm": "sha256", "hex": hashlib.sha256(b"x" * size).hexdigest()}
+    assert result["body_complete"] is False and result["truncated"] is True
+    assert result["body"] == "x" * 2000
+    assert peak < 4 * MB
+
+
+def test_max_bytes_aborts_the_download(http_stub, tool_text):
+    reply = tool_text("http_tester", {
+        "method": "GET", "url": f"{http_stub}/bytes/{50 * MB}",
+        "max_bytes": 100_000, "preview_bytes": 1000, "body_hash": "md5",
+    })
+
+    assert "**Size:** 97.66 KB (⛔ stopped at max_bytes=100,000)" in reply
+    assert f"**Hash of bytes read (MD5):** `{hashlib.md5(b'x' * 100_000).hexdigest()}`" in reply
+
+
+def test_small_json_body_is_still_pretty_printed(http_stub, tool_text):
+    reply = tool_text("http_tester", {"method": "GET", "url": f"{http_stub}/json/64"})
+
+    assert '```json\n[\n  {\n    "id": 1' in reply
+    assert "Full body" not in reply
+
+
+def test_prefix_decoding_drops_a_split_character():
+    read = BodyRead()
+    read.prefix += "héllo".encode("utf-8")[:2]
+    read.complete = False
+    assert read.text("utf-8") == "h"
+
+    read.complete = True
+    assert read.text("utf-8") == "h�"
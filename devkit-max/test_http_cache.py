@@ -0,0 +1,171 @@
+"""
+HTTP response cache tests for DevKit Max
+Covers hits without network I/O, revalidation, persistence and LRU bounds
+"""
+
+import json
+
+import httpx
+import pytest
+
+from benchmarks.stub_server import StubServer
+from utils import http_cache
+from utils.http_cache import HttpCache
+
+
+@pytest.fixture
+def stub():
+    with StubServer() as server:
+        yield server
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    fresh = HttpCache(1024 * 1024)
+    monkeypatch.setattr(http_cache, "_cache", fresh)
+    return fresh
+
+
+@pytest.fixture
+def call_all(tool_text):
+    """call_all(calls): the structured http_tester replies to calls, made in order"""
+    return lambda calls: [json.loads(tool_text("http_tester", arguments)) for arguments in calls]
+
+
+def get(url, **extra):
+    return dict({"method": "GET", "url": url, "cache": True, "output": "structured"}, **extra)
+
+
+def test_fresh_entries_are_served_without_network_io(stub, cache, call_all):
+    url = f"{stub.url}/cache/60"
+    first, second, head = call_all([get(url), get(url), get(url, method="HEAD")])
+
+    assert [r["meta"]["cache"] for r in (first, second, head)] == ["miss", "hit", "hit"]
+    assert second["result"]["body"] == first["result"]["body"] == '{"version": 1}\n'
+    assert second["meta"]["timing_ms"] == {}
+    assert head["result"]["body"] == ""
+    assert len(stub.requests) == 1
+    assert cache.stats()["hits"] == 2
+
+
+def test_stale_entries_are_revalidated_with_validators(stub, cache, call_all):
+    url = f"{stub.url}/cache/0"
+    first, second = call_all([get(url), get(url)])
+
+    assert second["meta"]["cache"] == "revalidated"
+    assert second["result"]["status"] == 200
+    assert second["result"]["body"] == first["result"]["body"]
+    assert stub.requests[1][2].get("If-None-Match") == '"v1"'
+
+
+def test_cache_is_opt_in_and_unsafe_methods_invalidate(stub, cache, call_all):
+    url = f"{stub.url}/cache/60"
+    plain, cached, post, after = call_all([
+        {"method": "GET", "url": url, "output": "structured"},
+        get(url),
+        {"method": "POST", "url": url, "body": "{}", "output": "structured"},
+        get(url),
+    ])
+
+    assert plain["meta"]["cache"] is None
+    assert cached["meta"]["cache"] == "miss"
+    assert after["meta"]["cache"] == "miss"
+    assert len(stub.requests) == 4
+
+
+def response(headers, body=b"hello", status=200):
+    return httpx.Response(status, headers=headers, content=body)
+
+
+def test_freshness_rules_and_lru_bound():
+    now = [1_000_000.0]
+    cache = HttpCache(max_bytes=2000, clock=lambda: now[0])
+
+    assert cache.store("http://a/no-store", {}, response({"Cache-Control": "no-store"}), b"x") is None
+    assert cache.store("http://a/plain", {}, response({}), b"x") is None
+    entry = cache.store("http://a/1", {}, response({"Cache-Control": "max-age=10"}), b"a" * 800)
+    assert entry.is_fresh(now[0])
+    now[0] += 11
+    assert not entry.is_fresh(now[0])
+
+    varied = cache.store("http://a/v", {"Accept": "text/html"},
+                         response({"Cache-Control": "max-age=10", "Vary": "Accept"}), b"v")
+    assert cache.lookup("http://a/v", {"accept": "text/html"}) is varied
+    assert cache.lookup("http://a/v", {"Accept": "application/json"}) is None
+
+    cache.store("http://a/2", {}, response({"ETag": '"e"'}), b"b" * 800)
+    cache.store("http://a/3", {}, response({"ETag": '"e"'}), b"c" * 800)
+    assert cache.lookup("http://a/1", {}) is None
+    assert cache.stats()["evictions"] >= 1
+    assert cache.current_bytes <= 2000
+
+
+def test_authorized_responses_are_only_stored_when_public():
+    cache = HttpCache(1024 * 1024)
+    authorized = {"Authorization": "Bearer alice"}
+    assert cache.store("http://a/me", authorized, response({"Cache-Control": "max-age=60"}), b"alice") is None
+    assert cache.lookup("http://a/me", {"Authorization": "Bearer bob"}) is None
+    assert cache.lookup("http://a/me", {}) is None
+
+    shared = cache.store("http://a/doc", authorized, response({"Cache-Control": "public, max-age=60"}), b"doc")
+    assert cache.lookup("http://a/doc", {}) is shared
+
+
+def test_private_responses_are_not_stored():
+    cache = HttpCache(1024 * 1024)
+    alice = {"Cookie": "session=alice"}
+    private = response({"Cache-Control": "private, max-age=600", "Set-Cookie": "session=alice"}, b"alice")
+    assert cache.store("http://a/me", alice, private, b"alice") is None
+    assert cache.lookup("http://a/me", {"Cookie": "session=bob"}) is None
+
+
+def test_s_maxage_wins_over_max_age():
+    now = [1_000_000.0]
+    cache = HttpCache(1024 * 1024, clock=lambda: now[0])
+    entry = cache.store("http://a/1", {}, response({"Cache-Control": "max-age=600, s-maxage=10"}), b"a")
+    assert entry.lifetime == 10
+    now[0] += 11
+    assert not entry.is_fresh(now[0])
+
+
+def test_set_cookie_is_not_stored():
+    cache = HttpCache(1024 * 1024)
+    stored = response({"Cache-Control": "max-age=60", "Set-Cookie": "session=alice", "ETag": '"e"'}, b"doc")
+    entry = cache.store("http://a/doc", {"Cookie": "session=alice"}, stored, b"doc")
+    assert entry.header("set-cookie") is None
+    assert entry.header("etag") == '"e"'
+    assert "set-cookie" not in cache.lookup("http://a/doc", {}).to_response("GET").headers
+
+    not_modified = httpx.Response(304, headers={"Set-Cookie": "session=bob", "Cache-Control": "max-age=60"})
+    assert cache.freshen(entry, not_modified).header("set-cookie") is None
+
+
+def test_request_no_store_and_no_cache_are_honored(stub, cache, call_all):
+    url = f"{stub.url}/cache/60"
+    assert cache.store(url, {"Cache-Control": "no-store"}, response({"Cache-Control": "max-age=60"}), b"x") is None
+
+    first, refetched, hit = call_all([
+        get(url), get(url, headers={"Cache-Control": "no-cache"}), get(url)
+    ])
+    assert [r["meta"]["cache"] for r in (first, refetched, hit)] == ["miss", "revalidated", "hit"]
+    assert stub.requests[1][2].get("If-None-Match") == '"v1"'
+
+    nothing_stored = call_all([get(f"{stub.url}/cache/30", headers={"Cache-Control": "no-store"})])
+    assert nothing_stored[0]["meta"]["cache"] == "miss"
+    assert cache.lookup(f"{stub.url}/cache/30", {}) is None
+
+
+def test_entries_persist_across_restarts(tmp_path):
+    now = [1_000_000.0]
+    first = HttpCache(1024 * 1024, directory=str(tmp_path), clock=lambda: now[0])
+    first.store("http://a/x", {}, response({"Cache-Control": "max-age=100", "ETag": '"e"'}), b"saved")
+
+    now[0] += 30
+    second = HttpCache(1024 * 1024, directory=str(tmp_path), clock=lambda: now[0])
+    entry = second.lookup("http://a/x", {})
+    assert entry.body == b"saved"
+    assert entry.is_fresh(now[0]) and 29 <= entry.age(now[0]) <= 31
+    assert entry.validators == {"If-None-Match": '"e"'}
+
+    second.invalidate("http://a/x")
+    assert HttpCache(1024 * 1024, directory=str(tmp_path)).lookup("http://a/x", {}) is None
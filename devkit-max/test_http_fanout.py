@@ -0,0 +1,94 @@
+"""
+Fan-out tests for DevKit Max
+Runs http_tester fan-out against several local stub servers
+"""
+
+import asyncio
+import json
+import time
+from contextlib import ExitStack
+
+import pytest
+from mcp.shared.memory import create_connected_server_and_client_session
+
+import server
+from benchmarks.stub_server import StubServer
+from utils import http_pool
+
+
+@pytest.fixture
+def stubs():
+    with ExitStack() as stack:
+        yield [stack.enter_context(StubServer()) for _ in range(3)]
+
+
+def test_fanout_returns_one_row_per_request_in_order(stubs, tool_text):
+    requests = []
+    for stub in stubs:
+        requests += [f"{stub.url}/bytes/{100 * (i + 1)}" for i in range(10)]
+    requests.append({"url": f"{stubs[0].url}/echo", "method": "POST", "body": '{"a": 1}'})
+    requests.append("ftp://example.com/file")
+
+    reply = json.loads(tool_text("http_tester", {"method": "GET", "requests": requests, "output": "structured", "mode": "fanout"}))
+    rows = reply["result"]
+
+    assert len(rows) == 32
+    assert [row["size_bytes"] for row in rows[:10]] == [100 * (i + 1) for i in range(10)]
+    assert all(row["status"] == 200 for row in rows[:31])
+    assert rows[30]["method"] == "POST"
+    assert rows[31]["error"] == "invalid_url"
+    assert reply["meta"]["hosts"] == 3
+
+
+def test_malformed_urls_fail_only_their_own_row(stubs, tool_text):
+    requests = [f"{stubs[0].url}/ping", "http://[::1", "http://a\x01b/", "ftp://x"]
+    reply = json.loads(tool_text("http_tester", {"method": "GET", "requests": requests, "output": "structured", "mode": "fanout"}))
+    rows = reply["result"]
+
+    assert [row["url"] for row in rows] == requests
+    assert rows[0]["status"] == 200 and rows[0]["error"] is None
+    assert [row["error"] for row in rows[1:]] == ["invalid_url"] * 3
+    assert reply["meta"]["hosts"] == 1
+
+
+def test_per_host_limit_serializes_one_host_but_not_others(stubs, tool_text):
+    one_host = [f"{stubs[0].url}/delay/200"] * 3
+    three_hosts = [f"{stub.url}/delay/200" for stub in stubs]
+
+    start = time.perf_counter()
+    tool_text("http_tester", {"method": "GET", "requests": one_host, "per_host_limit": 1, "mode": "fanout"})
+    serial = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reply = tool_text("http_tester", {"method": "GET", "requests": three_hosts, "per_host_limit": 1, "mode": "fanout"})
+    parallel = time.perf_counter() - start
+
+    assert serial >= 0.6
+    assert parallel < 0.5
+    assert "**✅ 3 ok | ⚠️ 0 non-2xx | ❌ 0 failed**" in reply
+    assert "| 1 | ✅ 200 | GET |" in reply
+
+
+def test_partial_results_stream_as_progress_notifications(stubs):
+    server.load_tools()
+    requests = [f"{stub.url}/ping" for stub in stubs] * 2
+    updates = []
+
+    async def on_progress(progress, total, message):
+        updates.append((progress, total, message))
+
+    async def scenario():
+        try:
+            async with create_connected_server_and_client_session(server.server) as client:
+                return await client.call_tool(
+                    "http_tester",
+                    {"method": "GET", "mode": "fanout", "requests": requests},
+                    progress_callback=on_progress
+                )
+        finally:
+            await http_pool.close_clients()
+
+    result = asyncio.run(scenario())
+    assert not result.isError
+    assert [(progress, total) for progress, total, _ in updates] == [(i, 6) for i in range(1, 7)]
+    assert all(message.startswith("200 GET http://127.0.0.1:") for _, _, message in updates)
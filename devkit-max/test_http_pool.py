@@ -0,0 +1,46 @@
+"""
+HTTP client pool tests for DevKit Max
+Checks keep-alive reuse in http_tester and pool lifecycle
+"""
+
+import asyncio
+import json
+
+from utils import http_pool
+
+
+def test_second_request_reuses_the_connection(http_stub, registry):
+    arguments = {"method": "GET", "url": f"{http_stub}/json/64", "output": "structured"}
+
+    async def scenario():
+        try:
+            first = await registry.call("http_tester", arguments)
+            second = await registry.call("http_tester", arguments)
+            markdown = await registry.call("http_tester", {"method": "GET", "url": f"{http_stub}/ping"})
+        finally:
+            await http_pool.close_clients()
+        return first, second, markdown
+
+    first, second, markdown = asyncio.run(scenario())
+    first_meta = json.loads(first["content"][0]["text"])["meta"]
+    second_meta = json.loads(second["content"][0]["text"])["meta"]
+    assert first_meta["connection_reused"] is False
+    assert second_meta["connection_reused"] is True
+    assert second_meta["http_version"] == "HTTP/1.1"
+    assert "🔁 Reused connection (HTTP/1.1)" in markdown["content"][0]["text"]
+
+
+def test_clients_are_keyed_by_settings_and_closed_on_shutdown():
+    async def scenario():
+        default = http_pool.get_client()
+        assert http_pool.get_client(10, True, False) is default
+        assert http_pool.get_client(5) is not default
+        assert http_pool.get_client(10, verify=False) is not default
+
+        await http_pool.close_clients()
+        assert default.is_closed
+        fresh = http_pool.get_client()
+        assert fresh is not default
+        await http_pool.close_clients()
+
+    asyncio.run(scenario())
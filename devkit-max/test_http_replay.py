@@ -0,0 +1,116 @@
+"""
+Replay tests for DevKit Max
+Replays JSON collections and HAR files against the local stub server
+"""
+
+import json
+
+import pytest
+
+from utils import config, replay
+
+
+def collection(base_url):
+    return {
+        "variables": {"base": base_url},
+        "requests": [
+            {"name": "slow-a", "url": "{{base}}/delay/300", "assert": {"status": 200}},
+            {"name": "slow-b", "url": "{{base}}/delay/300"},
+            {
+                "name": "login",
+                "method": "POST",
+                "url": "{{base}}/login-xyz",
+                "body": '{"user": "dev"}',
+                "extract": {"session": "$.path"},
+                "assert": {"json": {"$.method": "POST"}},
+            },
+            {
+                "name": "profile",
+                "url": "{{base}}/echo?session={{session}}",
+                "assert": {"body_contains": "login-xyz", "status": 200},
+            },
+            {"name": "broken", "url": "{{base}}/ping", "assert": {"status": 201}},
+        ],
+    }
+
+
+def test_dependent_requests_wait_and_independent_ones_overlap(http_stub, tool_text):
+    reply = json.loads(tool_text("http_tester", {"method": "GET", "mode": "replay", "collection": collection(http_stub), "output": "structured"}))
+    rows = {row["name"]: row for row in reply["result"]}
+    meta = reply["meta"]
+
+    assert rows["profile"]["url"] == f"{http_stub}/echo?session=/login-xyz"
+    assert rows["profile"]["start_ms"] >= rows["login"]["start_ms"] + rows["login"]["latency_ms"] - 1
+    assert rows["profile"]["ok"] and rows["login"]["ok"] and rows["slow-a"]["ok"]
+    assert rows["broken"]["failures"] == ["status 200 != 201"]
+    # Both 300ms requests run side by side: wall time tracks the critical path, not the sum
+    assert meta["sum_ms"] >= 600
+    assert meta["wall_ms"] < meta["critical_path_ms"] + 200 < meta["sum_ms"]
+
+
+def test_failed_dependency_skips_dependents_in_markdown(http_stub, tool_text):
+    reply = tool_text("http_tester", {"method": "GET", "mode": "replay", "collection": {
+        "requests": [
+            {"name": "token", "url": f"{http_stub}/ping", "extract": {"token": "$.missing"}},
+            {"name": "use", "url": f"{http_stub}/echo", "headers": {"Authorization": "Bearer {{token}}"}},
+        ],
+    }})
+
+    assert "**✅ 0 passed | ❌ 1 failed | ⏭️ 1 skipped**" in reply
+    assert "could not extract token from $.missing" in reply
+    assert "⏭️ skipped: token failed" in reply
+
+
+def test_steps_read_variables_from_the_step_they_depend_on(http_stub, tool_text):
+    # "first" and "second" both extract id; "first" finishes last, but "use"
+    # still reads the id of "second", the latest earlier step extracting it
+    reply = json.loads(tool_text("http_tester", {"method": "GET", "mode": "replay", "output": "structured", "collection": {
+        "requests": [
+            {"name": "slow", "url": f"{http_stub}/delay/200"},
+            {"name": "first", "url": f"{http_stub}/echo/first", "depends_on": ["slow"], "extract": {"id": "$.path"}},
+            {"name": "second", "url": f"{http_stub}/echo/second", "extract": {"id": "$.path"}},
+            {"name": "use", "url": f"{http_stub}/echo?id={{{{id}}}}", "depends_on": ["first"]},
+        ],
+    }}))
+    rows = {row["name"]: row for row in reply["result"]}
+    assert rows["second"]["start_ms"] + rows["second"]["latency_ms"] < rows["first"]["start_ms"]
+    assert rows["use"]["url"] == f"{http_stub}/echo?id=/echo/second"
+
+
+def test_har_file_replays_with_recorded_statuses(http_stub, tmp_path, monkeypatch, tool_text):
+    monkeypatch.setattr(config, "ALLOWED_ROOTS", [str(tmp_path)])
+    har = {"log": {"entries": [
+        {
+            "request": {"method": "GET", "url": f"{http_stub}/json/100",
+                        "headers": [{"name": "Accept", "value": "application/json"}, {"name": ":path", "value": "/"}]},
+            "response": {"status": 200},
+        },
+        {
+            "request": {"method": "POST", "url": f"{http_stub}/echo", "headers": [],
+                        "postData": {"mimeType": "application/json", "text": '{"a": 1}'}},
+            "response": {"status": 200},
+        },
+    ]}}
+    path = tmp_path / "session.har"
+    path.write_text(json.dumps(har))
+
+    reply = json.loads(tool_text("http_tester", {"method": "GET", "mode": "replay", "collection_path": str(path), "output": "structured"}))
+    assert [row["ok"] for row in reply["result"]] == [True, True]
+    assert reply["result"][1]["method"] == "POST"
+
+
+def test_collection_files_must_be_under_an_allowed_root(tmp_path, monkeypatch, tool_text):
+    monkeypatch.setattr(config, "ALLOWED_ROOTS", [str(tmp_path / "allowed")])
+    path = tmp_path / "collection.json"
+    path.write_text(json.dumps({"requests": []}))
+    reply = json.loads(tool_text("http_tester", {"method": "GET", "mode": "replay", "collection_path": str(path), "output": "structured"}))
+    assert reply["error"] == f"{path} is outside the allowed directories"
+
+
+def test_collection_errors_are_reported_before_sending():
+    with pytest.raises(ValueError, match="variable 'token' is not defined"):
+        replay.load_collection({"requests": [{"url": "http://x/{{token}}"}]})
+    with pytest.raises(ValueError, match="must name an earlier request"):
+        replay.load_collection({"requests": [{"name": "a", "url": "http://x", "depends_on": ["b"]},
+                                             {"name": "b", "url": "http://x"}]})
+    assert replay.extract_value({"a": [{"b": 1}]}, "$.a[0].b") == 1
@@ -0,0 +1,51 @@
+"""
+Phase timing tests for DevKit Max
+Checks http_tester's per-phase breakdown for new and reused connections
+"""
+
+import asyncio
+import json
+
+from utils import http_pool
+from utils.http_timing import PHASES, PhaseTimer
+
+
+def test_phases_cover_the_request_and_skip_connect_on_reuse(http_stub, registry):
+    arguments = {"method": "GET", "url": f"{http_stub}/delay/50", "output": "structured"}
+
+    async def scenario():
+        try:
+            first = await registry.call("http_tester", arguments)
+            second = await registry.call("http_tester", arguments)
+            markdown = await registry.call("http_tester", {"method": "GET", "url": f"{http_stub}/ping"})
+        finally:
+            await http_pool.close_clients()
+        return first, second, markdown
+
+    first, second, markdown = asyncio.run(scenario())
+    first_meta = json.loads(first["content"][0]["text"])["meta"]
+    second_meta = json.loads(second["content"][0]["text"])["meta"]
+
+    assert list(first_meta["timing_ms"]) == ["queue", "connect", "send", "wait", "download"]
+    assert "connect" not in second_meta["timing_ms"]
+    # The stub sleeps 50ms before answering: that is server time, not transfer time
+    assert second_meta["timing_ms"]["wait"] >= 50
+    assert second_meta["timing_ms"]["download"] < 50
+    total = sum(second_meta["timing_ms"].values())
+    assert total <= second_meta["response_time_ms"] + 0.01
+    assert "**Timing:** queue" in markdown["content"][0]["text"]
+
+
+def test_phase_names_are_shared_across_http_versions():
+    timer = PhaseTimer()
+
+    async def scenario():
+        for event in ["http2.send_request_headers.started", "http2.send_request_body.complete",
+                      "http2.receive_response_headers.complete"]:
+            await timer.trace(event, {})
+
+    asyncio.run(scenario())
+    timer.finish()
+    assert set(timer.phases_ns()) == {"queue", "send", "wait", "download"}
+    assert set(timer.phases_ns()) <= set(PHASES)
+    assert timer.reused
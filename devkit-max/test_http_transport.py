@@ -0,0 +1,69 @@
+"""
+HTTP transport tests for DevKit Max
+Runs server.py --transport http and talks to it with several MCP clients
+"""
+
+import asyncio
+
+from benchmarks import http_load
+from benchmarks.http_load import HttpServerProcess
+
+
+def _released():
+    """An already-set start event, so clients call as soon as they connect"""
+    event = asyncio.Event()
+    event.set()
+    return event
+
+
+def test_many_clients_share_one_server():
+    async def scenario(url):
+        clients = [
+            http_load.run_client(url, "hash_generator", {"input": f"client {i}"}, 5, _released())
+            for i in range(6)
+        ]
+        return await asyncio.gather(*clients)
+
+    with HttpServerProcess() as server:
+        per_client = asyncio.run(scenario(server.url))
+
+    assert [len(latencies) for latencies in per_client] == [5] * 6
+    # SIGINT shuts the server down cleanly and runs its cleanup
+    assert server.returncode == 0
+    assert "HTTP transport stopped" in server.stderr
+
+
+def test_max_concurrency_queues_excess_requests(http_stub):
+    arguments = {"method": "GET", "url": f"{http_stub}/delay/400"}
+
+    async def scenario(url):
+        # Import http_tester in the server before anything is timed
+        await http_load.run_client(url, "http_tester", arguments, 1, _released())
+        start = asyncio.Event()
+        clients = [
+            asyncio.create_task(http_load.run_client(url, "http_tester", arguments, 1, start))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(1.0)
+        start.set()
+        per_client = await asyncio.gather(*clients)
+        # Slowest call in ms; with one slot it waits for the other call to finish
+        return max(latency for latencies in per_client for latency in latencies)
+
+    with HttpServerProcess(max_concurrency=1) as server:
+        serial = asyncio.run(scenario(server.url))
+    with HttpServerProcess(max_concurrency=4) as server:
+        parallel = asyncio.run(scenario(server.url))
+
+    assert serial >= 2 * 400 * 0.95
+    assert parallel < serial * 0.75
+
+
+def test_load_test_reports_each_client_level():
+    rows = http_load.main(["--clients", "1,3", "--calls", "3"])
+
+    assert [row["clients"] for row in rows] == [1, 3]
+    assert [row["calls"] for row in rows] == [3, 9]
+    for row in rows:
+        assert row["calls_per_sec"] > 0
+        assert row["p50_ms"] <= row["p99_ms"]
@@ -0,0 +1,68 @@
+"""
+JSON backend tests for DevKit Max
+Checks that the orjson backend gives exactly the stdlib's output and errors
+"""
+
+import json
+
+import pytest
+
+from utils import json_backend
+
+DOCUMENTS = [
+    '{"b": [1, 2.5, -0.0, 1e16, 1.5e-7, 0.00001, 10.00001, 123456.789e3], "a": {"é": "😀\\u007f\\u001f"}}',
+    '[18446744073709551615, -9223372036854775808, 18446744073709551616, -9223372036854775809]',
+    '{"id": "1234567890123456789012345", "ratio": 0.0012345678901234567}',
+    '{"note": "1e16, 0.00001]", "when": "2024-01-01T00:00:00Z", "color": "3e4f5a"}',
+    '[NaN, Infinity, -Infinity, 1e400]',
+    '["\\ud800"]',
+    '{"a": 1, "b": 2, "a": 3}',
+    "[" * 300 + "]" * 300,
+    '{"empty": {}, "list": [], "nested": [[], {}]}',
+]
+
+INVALID = ["", "[1,]", '{"a" 1}', "[1 x]", '"ab', '{"a":[1,{"b":nul}]}', "[NaN,]"]
+
+
+def expected(document, indent, sort_keys, compact, ensure_ascii):
+    return json.dumps(
+        json.loads(document),
+        indent=indent if indent > 0 and not compact else None,
+        separators=(",", ":") if compact else None,
+        sort_keys=sort_keys,
+        ensure_ascii=ensure_ascii
+    )
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        monkeypatch.setattr(json_backend, "orjson", __import__("orjson"))
+    else:
+        monkeypatch.setattr(json_backend, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_output_matches_stdlib(backend, document):
+    for indent in (0, 2, 4):
+        for sort_keys in (False, True):
+            for compact in (False, True):
+                for ensure_ascii in (False, True):
+                    value, formatted = json_backend.reformat(document, indent, sort_keys, compact, ensure_ascii)
+                    assert formatted == expected(document, indent, sort_keys, compact, ensure_ascii)
+    assert json.dumps(value) == json.dumps(json.loads(document))
+
+
+@pytest.mark.parametrize("document", INVALID)
+def test_errors_match_stdlib(backend, document):
+    with pytest.raises(json.JSONDecodeError) as stdlib_error:
+        json.loads(document)
+    with pytest.raises(json.JSONDecodeError) as backend_error:
+        json_backend.loads(document)
+    assert (backend_error.value.msg, backend_error.value.pos) == (stdlib_error.value.msg, stdlib_error.value.pos)
+
+
+def test_backend_name(backend):
+    assert json_backend.name() == backend
@@ -0,0 +1,175 @@
+"""
+JSON diff tests for DevKit Max
+Checks that json_diff's patches turn the old document into the new one and skip unchanged subtrees
+"""
+
+import copy
+import json
+import random
+
+import pytest
+
+from utils.json_diff import Differ, diff
+
+
+def apply_patch(document, ops):
+    """Apply add/remove/replace/move operations (RFC 6902) to a copy of document"""
+    document = copy.deepcopy(document)
+
+    def locate(path):
+        tokens = [token.replace("~1", "/").replace("~0", "~") for token in path.split("/")[1:]]
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        return parent, tokens[-1]
+
+    def take(path):
+        parent, token = locate(path)
+        return parent.pop(int(token) if isinstance(parent, list) else token)
+
+    def put(path, value):
+        parent, token = locate(path)
+        if isinstance(parent, list):
+            parent.insert(len(parent) if token == "-" else int(token), value)
+        else:
+            parent[token] = value
+
+    for op in ops:
+        if op["path"] == "":
+            document = copy.deepcopy(op["value"])
+        elif op["op"] == "remove":
+            take(op["path"])
+        elif op["op"] == "add":
+            put(op["path"], copy.deepcopy(op["value"]))
+        elif op["op"] == "replace":
+            take(op["path"])
+            put(op["path"], copy.deepcopy(op["value"]))
+        elif op["op"] == "move":
+            put(op["path"], take(op["from"]))
+    return document
+
+
+def canonical(value):
+    return json.dumps(value, sort_keys=True)
+
+
+def test_objects():
+    old = {"a": 1, "b": {"c": [1, 2]}, "gone": None}
+    new = {"b": {"c": [1, 2]}, "a": 2, "new": "x"}
+    assert diff(old, new) == [
+        {"op": "remove", "path": "/gone"},
+        {"op": "replace", "path": "/a", "value": 2},
+        {"op": "add", "path": "/new", "value": "x"},
+    ]
+
+
+def test_key_order_is_ignored_but_types_are_not():
+    assert diff({"a": 1, "b": [True]}, {"b": [True], "a": 1}) == []
+    assert diff({"a": 1}, {"a": True}) == [{"op": "replace", "path": "/a", "value": True}]
+    assert diff([1], [1.0]) == [{"op": "replace", "path": "/0", "value": 1.0}]
+    assert diff(float("nan"), float("nan")) == []
+
+
+def test_pointer_tokens_are_escaped():
+    assert diff({"a/b": {"~c": 1}}, {"a/b": {"~c": 2}}) == [{"op": "replace", "path": "/a~1b/~0c", "value": 2}]
+
+
+def test_one_insertion_and_one_deletion_are_two_operations():
+    old = [{"n": n} for n in range(1000)]
+    new = old[:10] + [{"n": "inserted"}] + old[10:990] + old[991:]
+    assert diff(old, new) == [
+        {"op": "add", "path": "/10", "value": {"n": "inserted"}},
+        {"op": "remove", "path": "/991"},
+    ]
+
+
+def test_array_key_matches_elements_and_reports_moves():
+    old = {"users": [{"id": 1, "role": "dev"}, {"id": 2, "role": "ops"}, {"id": 3, "role": "qa"}]}
+    new = {"users": [{"id": 3, "role": "qa"}, {"id": 1, "role": "lead"}, {"id": 4, "role": "new"}]}
+    ops = diff(old, new, "id")
+    assert [op["op"] for op in ops] == ["remove", "move", "replace", "add"]
+    assert apply_patch(old, ops) == new
+    # Without the key, the changed user is a different element, replaced whole
+    assert {"op": "add", "path": "/users/1", "value": {"id": 1, "role": "lead"}} in diff(old, new)
+
+
+def test_array_key_falls_back_to_positions_without_distinct_keys():
+    old = [{"id": 1, "v": 1}, {"id": 1, "v": 2}]
+    new = [{"id": 1, "v": 1}, {"id": 1, "v": 3}]
+    assert diff(old, new, "id") == [{"op": "replace", "path": "/1/v", "value": 3}]
+
+
+def test_unchanged_subtrees_are_not_descended(monkeypatch):
+    old = {"items": [{"id": n, "tags": ["a", "b"], "meta": {"n": n}} for n in range(2000)], "version": 1}
+    new = copy.deepcopy(old)
+    new["items"][1500]["meta"]["n"] = -1
+    visited = []
+    original = Differ.compare_objects
+    monkeypatch.setattr(Differ, "compare_objects", lambda self, a, b, path: visited.append(path) or original(self, a, b, path))
+    assert diff(old, new) == [{"op": "replace", "path": "/items/1500/meta/n", "value": -1}]
+    assert visited == ["", "/items/1500", "/items/1500/meta"]
+
+
+def random_value(rng, depth=0):
+    if depth > 3 or rng.random() < 0.3:
+        return rng.choice([0, 1, 1.0, True, False, None, "a", "b/c", "~x"])
+    if rng.random() < 0.4:
+        return {rng.choice("abcde"): random_value(rng, depth + 1) for _ in range(rng.randrange(5))}
+    if rng.random() < 0.5:
+        return [{"id": key, "v": random_value(rng, depth + 1)} for key in rng.sample(range(10), rng.randrange(8))]
+    return [random_value(rng, depth + 1) for _ in range(rng.randrange(6))]
+
+
+def mutated(rng, value, depth=0):
+    if isinstance(value, dict):
+        value = {key: mutated(rng, item, depth + 1) for key, item in value.items() if rng.random() > 0.15}
+        if rng.random() < 0.2:
+            value[rng.choice("abcdefg")] = random_value(rng, depth + 1)
+    elif isinstance(value, list):
+        value = [mutated(rng, item, depth + 1) if rng.random() < 0.4 else item for item in value]
+        if rng.random() < 0.3:
+            rng.shuffle(value)
+        if value and rng.random() < 0.2:
+            value.pop(rng.randrange(len(value)))
+        if rng.random() < 0.2:
+            value.insert(rng.randrange(len(value) + 1), {"id": rng.randrange(20), "v": 1})
+    elif rng.random() < 0.3:
+        value = random_value(rng, depth)
+    return value
+
+
+@pytest.mark.parametrize("array_key", [None, "id"])
+def test_patches_round_trip(array_key):
+    rng = random.Random(5)
+    for _ in range(2000):
+        old = random_value(rng)
+        new = mutated(rng, old)
+        ops = diff(old, new, array_key)
+        assert canonical(apply_patch(old, json.loads(json.dumps(ops)))) == canonical(new)
+
+
+def test_tool_lists_changes(tool_text):
+    text = tool_text("json_diff", {"old": '{"a": 1, "b": [1, 2]}', "new": '{"a": 1, "b": [1, 3]}'})
+    assert text.startswith("🔀 1 changes (1 replace)")
+    assert '"path": "/b/1"' in text
+
+
+def test_tool_identical_documents(tool_text):
+    text = tool_text("json_diff", {"old": '{"a": [1]}', "new": '{ "a" : [1] }'})
+    assert text == "✅ Documents are identical"
+
+
+def test_tool_structured(tool_text):
+    reply = json.loads(tool_text("json_diff", {
+        "old": '[{"id": 1}, {"id": 2}]', "new": '[{"id": 2}, {"id": 1}]', "array_key": "id", "output": "structured"
+    }))
+    assert reply["result"] == [{"op": "move", "from": "/1", "path": "/0"}]
+    assert reply["meta"] == {"changes": 1, "move": 1}
+
+
+def test_tool_names_the_invalid_document(tool_text):
+    text = tool_text("json_diff", {"old": "{}", "new": '{"a": }'})
+    assert text.startswith("❌ Invalid JSON in `new`")
+    assert "Line 1, Column 7" in text
+    reply = json.loads(tool_text("json_diff", {"old": "[1,", "new": "[]", "output": "structured"}))
+    assert reply["meta"]["document"] == "old"
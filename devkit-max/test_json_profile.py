@@ -0,0 +1,139 @@
+"""
+JSON profile tests for DevKit Max
+Checks the single-pass statistics, their error locations and json_formatter's profile mode
+"""
+
+import json
+import tracemalloc
+
+import pytest
+
+from utils import json_profile
+from utils.json_profile import profile
+from utils.json_query import run_query
+
+DOCUMENT = {
+    "users": [
+        {"id": n, "name": "n" * n, "tags": ["a", "b"][:n % 3], "x y": None, "score": 1.5}
+        for n in range(10)
+    ],
+    "ok": True,
+    "café": "ü\n",
+}
+
+
+def test_statistics():
+    report = profile(json.dumps(DOCUMENT), top=3)
+    assert report["max_depth"] == 4
+    assert report["values"] == 1 + 1 + 10 * 6 + 9 + 1 + 1
+    assert report["types"] == {"string": 20, "object": 11, "array": 11, "integer": 10, "null": 10, "number": 10, "boolean": 1}
+    paths = report["paths"]
+    assert list(paths)[:3] == ["$", "$.users", "$.users[*]"]
+    assert paths["$"]["keys"] == {"users": 1, "ok": 1, "café": 1}
+    assert paths["$.users"]["array_length"] == [10, 10]
+    assert paths["$.users[*]"]["keys"] == {"id": 10, "name": 10, "tags": 10, "x y": 10, "score": 10}
+    assert paths["$.users[*].tags"]["array_length"] == [0, 2]
+    assert paths["$.users[*].tags[*]"]["count"] == 9
+    assert paths["$.users[*].name"]["string_length"] == [0, 9]
+    assert paths["$.users[*]['x y']"]["types"] == {"null": 10}
+    # Lengths are in characters, after unescaping
+    assert paths["$['café']"]["string_length"] == [2, 2]
+    assert report["strings"]["histogram"]["0"] == 1
+    assert sum(report["strings"]["histogram"].values()) == report["strings"]["count"] == 20
+
+
+def test_largest_subtrees_are_measured_in_bytes():
+    text = json.dumps(DOCUMENT)
+    largest = profile(text, top=3)["largest"]
+    assert [entry["path"] for entry in largest] == ["$.users", "$.users[8]", "$.users[5]"]
+    for entry in largest:
+        (value,) = run_query(text, entry["path"], False)
+        assert entry["bytes"] == len(json.dumps(value))
+
+
+def test_scalars_and_empty_containers():
+    assert profile("5")["max_depth"] == 0
+    assert profile("5")["paths"] == {"$": {"count": 1, "types": {"integer": 1}}}
+    assert profile(" [] ")["paths"]["$"]["array_length"] == [0, 0]
+    assert profile("[1e3, 1.0, -0, NaN]")["types"] == {"number": 3, "array": 1, "integer": 1}
+
+
+def test_text_and_bytes_agree():
+    text = json.dumps(DOCUMENT, ensure_ascii=False, indent=2)
+    assert profile(text) == profile(text.encode("utf-8")) == profile(memoryview(text.encode("utf-8")))
+
+
+def test_profile_paths_are_queries():
+    text = json.dumps(DOCUMENT)
+    for path, stats in profile(text)["paths"].items():
+        assert len(run_query(text, path, False)) == stats["count"], path
+
+
+@pytest.mark.parametrize("document", [
+    "", "[1,]", '{"a" 1}', "[1 2]", '"abc', '["a\\x"]', '{"\\q": 1}', '["é\\u12"]', '{"a":1}}',
+    '[1,\n"\x01"]', "[\n  {\"é\": tru}\n]", "{]", "[}", '{"a": 1,}', "[1] 2",
+    "9.65071135 782408e-09", "[1 2.5]", '{"a" 1e5}',
+])
+def test_errors_match_the_json_module(document):
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(document)
+    with pytest.raises(json.JSONDecodeError) as error:
+        profile(document)
+    assert (error.value.msg, error.value.lineno, error.value.colno, error.value.pos) == (
+        expected.value.msg, expected.value.lineno, expected.value.colno, expected.value.pos
+    )
+
+
+def test_sampling_keeps_array_lengths_exact():
+    document = {"rows": [{"n": n, "inner": [n] * (n % 4)} for n in range(100)]}
+    document["rows"][57]["inner"] = [0] * 50
+    report = profile(json.dumps(document), sample=10)
+    assert report["sample"] == {"every": 10, "skipped": 90}
+    assert report["paths"]["$.rows"]["array_length"] == [100, 100]
+    assert report["paths"]["$.rows[*]"]["count"] == 10
+    # Nested arrays inside a sampled element are profiled in full
+    assert report["paths"]["$.rows[*].inner[*]"]["count"] == sum(n % 4 for n in range(0, 100, 10))
+    assert report["max_depth"] == 4
+    # Skipped elements still compete for the largest subtrees
+    assert report["largest"][1]["path"] == "$.rows[57]"
+
+
+def test_paths_are_capped(monkeypatch):
+    monkeypatch.setattr(json_profile, "MAX_PATHS", 5)
+    report = profile(json.dumps({f"k{n}": [n] for n in range(10)}))
+    assert len(report["paths"]) == 5
+    assert report["values"] == 21
+    assert report["untracked_values"] == 16
+
+
+def test_memory_does_not_grow_with_the_document():
+    document = json.dumps([{"id": n, "name": f"user-{n}", "tags": ["a", "b"]} for n in range(20000)]).encode()
+    tracemalloc.start()
+    try:
+        profile(document)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak < len(document) / 10
+
+
+def test_tool_markdown(tool_text):
+    text = tool_text("json_formatter", {"json_string": json.dumps(DOCUMENT), "mode": "profile", "top": 2})
+    assert text.startswith("📊 Profile: ")
+    assert "max depth 4" in text
+    assert "| `$.users` | 1 | array 1 | array length 10 |" in text
+    assert "| `$.users[*].name` | 10 | string 10 | string length 0–9 |" in text
+    assert "**Largest subtrees:**\n- `$.users`: " in text
+
+
+def test_tool_structured(tool_text):
+    reply = json.loads(tool_text("json_formatter", {
+        "json_string": "[[1], [2, 3]]", "mode": "profile", "sample": 2, "output": "structured"
+    }))
+    assert reply["result"]["paths"]["$"]["array_length"] == [2, 2]
+    assert reply["result"]["sample"] == {"every": 2, "skipped": 1}
+
+
+def test_tool_rejects_query_in_profile_mode(tool_text):
+    text = tool_text("json_formatter", {"json_string": "[]", "mode": "profile", "query": "$[0]"})
+    assert text == "❌ Error: query and schema are not supported in profile mode"
@@ -0,0 +1,110 @@
+"""
+JSON query tests for DevKit Max
+Checks JSONPath/jq evaluation, the streaming scan against the parsed tree, and json_formatter's query argument
+"""
+
+import json
+import tracemalloc
+
+import pytest
+
+from utils import config, json_query
+from utils.json_query import QueryError, compile_query, run_query
+
+STORE = {
+    "store": {
+        "book": [
+            {"category": "reference", "author": "Nigel Rees", "title": "Sayings", "price": 8.95},
+            {"category": "fiction", "author": "Evelyn Waugh", "title": "Sword", "price": 12.99},
+            {"category": "fiction", "author": "Herman Melville", "title": "Moby Dick", "isbn": "0-553", "price": 8.99},
+            {"category": "fiction", "author": "Tolkien", "title": "LOTR", "isbn": "0-395", "price": 22.99},
+        ],
+        "bicycle": {"color": "red", "price": 19.95},
+    },
+    "n": [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+}
+
+QUERIES = {
+    "$.store.book[*].author": ["Nigel Rees", "Evelyn Waugh", "Herman Melville", "Tolkien"],
+    "$..price": [8.95, 12.99, 8.99, 22.99, 19.95],
+    "$.store.book[-1].title": ["LOTR"],
+    "$.store.book[0,2].title": ["Sayings", "Moby Dick"],
+    "$.n[1:8:3]": [1, 4, 7],
+    "$.n[::-1]": [9, 8, 7, 6, 5, 4, 3, 2, 1, 0],
+    "$.store.book[?(@.isbn)].title": ["Moby Dick", "LOTR"],
+    "$.store.book[?(@.price > 10 && @.category == 'fiction')].title": ["Sword", "LOTR"],
+    "$.store.book[?(!@.isbn)].title": ["Sayings", "Sword"],
+    "$['store']['bicycle']['color']": ["red"],
+    ".store.book[].title": ["Sayings", "Sword", "Moby Dick", "LOTR"],
+    ".store.book[] | select(.price < 10 and .isbn) | .title": ["Moby Dick"],
+    ".n[] | select(. > 7)": [8, 9],
+    ".n[2:5]": [2, 3, 4],
+    "$.missing": [],
+    "$.n[100]": [],
+}
+
+
+@pytest.mark.parametrize("query, expected", QUERIES.items())
+def test_queries_on_the_parsed_tree(query, expected):
+    assert compile_query(query).evaluate(STORE) == expected
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_streaming_matches_the_tree(monkeypatch, query):
+    # Walk every container instead of decoding the small ones outright
+    monkeypatch.setattr(json_query, "DECODE_BYTES", 0)
+    compiled = compile_query(query)
+    if not compiled.streamable:
+        pytest.skip("evaluated on the parsed tree")
+    for indent in (None, 1):
+        assert compiled.stream(json.dumps(STORE, indent=indent)) == compiled.evaluate(STORE)
+
+
+def test_compiled_queries_are_cached_by_string():
+    compile_query.cache_clear()
+    first = compile_query("$.store.book[*].title")
+    assert compile_query("$.store.book[*].title") is first
+    assert compile_query.cache_info().hits == 1
+
+
+@pytest.mark.parametrize("query", ["store", "$.[", "$[?(@.a <)]", "$.a[1:2:0]", "$.a b", ".a | select(.b"])
+def test_bad_queries_raise(query):
+    with pytest.raises(QueryError):
+        compile_query(query)
+
+
+def test_streaming_does_not_decode_skipped_subtrees():
+    blob = json.dumps(list(range(200_000)))
+    text = f'{{"blob": {blob}, "meta": {{"count": 3}}}}'
+    tracemalloc.start()
+    try:
+        assert run_query(text, "$.meta.count", stream=True) == [3]
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    # Decoding the list alone would take several MB
+    assert peak < 256 * 1024
+
+
+def test_streaming_reports_invalid_json_on_the_path():
+    with pytest.raises(json.JSONDecodeError):
+        run_query('{"a": [1, 2', "$.a[1]", stream=True)
+
+
+@pytest.mark.parametrize("min_bytes", [0, 1024 * 1024])
+def test_tool_formats_only_the_matches(monkeypatch, min_bytes, tool_text):
+    monkeypatch.setattr(config, "JSON_STREAM_MIN_BYTES", min_bytes)
+    text = tool_text("json_formatter", {"json_string": json.dumps(STORE), "query": "$.store.book[?(@.price < 10)].title"})
+    assert text.startswith("🔎 2 matches for `$.store.book[?(@.price < 10)].title`")
+    assert '[\n  "Sayings",\n  "Moby Dick"\n]' in text
+
+
+def test_tool_structured_query(tool_text):
+    reply = json.loads(tool_text("json_formatter", {"json_string": json.dumps(STORE), "query": ".store.bicycle", "output": "structured"}))
+    assert reply["result"] == [{"color": "red", "price": 19.95}]
+    assert reply["meta"] == {"valid": True, "summary": "1 matches", "query": ".store.bicycle"}
+
+
+def test_tool_reports_bad_queries(tool_text):
+    text = tool_text("json_formatter", {"json_string": json.dumps(STORE), "query": "$.store["})
+    assert text.startswith("❌ Error:")
@@ -0,0 +1,167 @@
+"""
+JSON Schema tests for DevKit Max
+Checks the compiled validators against jsonschema and json_formatter's schema option
+"""
+
+import json
+
+import pytest
+from jsonschema import validators
+
+from utils import config, json_schema
+from utils.json_schema import SchemaError, compile_schema, load_schema
+from utils.local_files import PathNotAllowed
+
+ORDER = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "required": ["id", "lines"],
+    "properties": {
+        "id": {"type": "integer", "minimum": 1},
+        "email": {"type": "string", "pattern": "^[^@]+@[^@]+$"},
+        "status": {"enum": ["open", "paid"]},
+        "lines": {"type": "array", "minItems": 1, "items": {"$ref": "#/$defs/line"}},
+    },
+    "additionalProperties": False,
+    "$defs": {
+        "line": {
+            "type": "object",
+            "required": ["sku", "qty"],
+            "properties": {
+                "sku": {"type": "string", "minLength": 3},
+                "qty": {"type": "integer", "exclusiveMinimum": 0},
+                "tags": {"type": "array", "items": {"type": "string"}, "uniqueItems": True},
+            },
+        }
+    },
+}
+
+INSTANCES = [
+    {"id": 1, "lines": [{"sku": "abc", "qty": 1}]},
+    {"id": 0, "status": "lost", "lines": []},
+    {"id": 2.0, "email": "x", "lines": [{"sku": "ab", "qty": 0, "tags": ["a", "a"]}, {"qty": True}], "note": 1},
+    {"lines": [{"sku": "abc", "qty": 2, "tags": ["a", "b"]}] * 3},
+    [],
+    "order",
+]
+
+RECURSIVE = {
+    "type": "object",
+    "properties": {"name": {"type": "string"}, "children": {"type": "array", "items": {"$ref": "#"}}},
+    "required": ["name"],
+}
+
+COMBINATORS = {
+    "oneOf": [{"type": "integer", "multipleOf": 3}, {"type": "number", "multipleOf": 0.5}],
+    "not": {"const": 9},
+    "if": {"type": "integer"}, "then": {"maximum": 100}, "else": {"minimum": 0.5},
+}
+
+
+@pytest.mark.parametrize("schema, instances", [
+    (ORDER, INSTANCES),
+    (RECURSIVE, [{"name": "a", "children": [{"name": "b", "children": [{"children": []}]}]}, {"name": 1}]),
+    (COMBINATORS, [3, 1.5, 6.0, 9, 0.25, 300, 1.0, True, "x"]),
+])
+def test_validity_matches_jsonschema(schema, instances):
+    reference = validators.validator_for(schema)(schema)
+    validator = compile_schema(schema)
+    assert validator.compiled
+    for instance in instances:
+        assert (validator.violations(instance)[1] == 0) == reference.is_valid(instance), instance
+
+
+def test_every_violation_has_its_pointer():
+    violations, count = compile_schema(ORDER).violations(INSTANCES[2])
+    paths = [violation["path"] for violation in violations]
+    # 2.0 is an integer as far as JSON Schema is concerned
+    assert count == len(violations) == 7
+    assert sorted(paths) == [
+        "/email", "/lines/0/qty", "/lines/0/sku", "/lines/0/tags/1", "/lines/1", "/lines/1/qty", "/note",
+    ]
+    assert {"path": "/lines/1/qty", "message": "expected integer, got boolean"} in violations
+    assert {"path": "/lines/1", "message": 'missing required property "sku"'} in violations
+
+
+def test_reports_are_capped_but_counted():
+    violations, count = compile_schema({"items": {"type": "string"}}).violations(list(range(250)))
+    assert count == 250
+    assert len(violations) == json_schema.MAX_REPORTED_VIOLATIONS
+    assert violations[-1]["path"] == f"/{json_schema.MAX_REPORTED_VIOLATIONS - 1}"
+
+
+def test_pointer_tokens_are_escaped():
+    violations, _ = compile_schema({"additionalProperties": {"type": "null"}}).violations({"a/b~c": 1})
+    assert violations == [{"path": "/a~1b~0c", "message": "expected null, got integer"}]
+
+
+def test_validators_are_cached_by_schema_content():
+    first = compile_schema({"type": "string", "minLength": 2})
+    assert compile_schema(json.loads('{"minLength": 2, "type": "string"}')) is first
+    assert compile_schema({"type": "string", "minLength": 3}) is not first
+
+
+def test_keywords_without_a_compiled_form_use_jsonschema():
+    schema = {"properties": {"a": {"type": "integer"}}, "unevaluatedProperties": False}
+    validator = compile_schema(schema)
+    assert not validator.compiled
+    violations, count = validator.violations({"a": "x", "b": 1})
+    assert count == 2
+    assert {violation["path"] for violation in violations} == {"/a", ""}
+
+
+def test_invalid_schemas_are_rejected(tmp_path, monkeypatch):
+    with pytest.raises(SchemaError, match="invalid schema"):
+        compile_schema({"type": "strnig"})
+    with pytest.raises(SchemaError, match="not valid JSON"):
+        load_schema('{"type": ')
+    monkeypatch.setattr(config, "ALLOWED_ROOTS", [str(tmp_path)])
+    with pytest.raises(ValueError, match="does not exist"):
+        load_schema(schema_path=str(tmp_path / "schema.json"))
+
+
+def test_schema_files_must_be_under_an_allowed_root(tmp_path, monkeypatch):
+    (tmp_path / "schema.json").write_text("{}")
+    monkeypatch.setattr(config, "ALLOWED_ROOTS", [])
+    with pytest.raises(PathNotAllowed, match="DEVKIT_ALLOWED_ROOTS"):
+        load_schema(schema_path=str(tmp_path / "schema.json"))
+    monkeypatch.setattr(config, "ALLOWED_ROOTS", [str(tmp_path / "allowed")])
+    with pytest.raises(PathNotAllowed, match="outside the allowed directories"):
+        load_schema(schema_path=str(tmp_path / "schema.json"))
+
+
+def test_tool_lists_violations(call_tool):
+    document = json.dumps(INSTANCES[1])
+    reply = call_tool("json_formatter", {"json_string": document, "schema": ORDER})
+    text = reply["content"][0]["text"]
+    assert text.startswith("✅ Valid JSON (3 keys)\n**Schema:** ❌ 3 violations")
+    assert "- `/id`: 0 is less than the minimum of 1" in text
+    assert '- `/status`: not one of ["open", "paid"]' in text
+    assert "- `/lines`: fewer than 1 items" in text
+
+
+def test_tool_structured_schema_result(call_tool):
+    reply = call_tool("json_formatter", {
+        "json_string": json.dumps(INSTANCES[0]), "schema": json.dumps(ORDER), "output": "structured"
+    })
+    reply = json.loads(reply["content"][0]["text"])
+    assert reply["result"] == INSTANCES[0]
+    assert reply["meta"] == {"valid": True, "summary": "2 keys", "schema_valid": True, "violations": 0, "errors": []}
+
+
+def test_tool_reads_schema_files_without_caching_them(tmp_path, monkeypatch, tool_text):
+    monkeypatch.setattr(config, "ALLOWED_ROOTS", [str(tmp_path)])
+    path = tmp_path / "schema.json"
+    path.write_text(json.dumps({"type": "array"}))
+    arguments = {"json_string": "[1, 2]", "schema_path": str(path)}
+    assert "**Schema:** ✅ valid" in tool_text("json_formatter", arguments)
+
+    path.write_text(json.dumps({"type": "object"}))
+    text = tool_text("json_formatter", arguments)
+    assert "- `(root)`: expected object, got array" in text
+
+
+def test_tool_validates_query_input_as_a_whole(call_tool):
+    reply = call_tool("json_formatter", {"json_string": json.dumps(INSTANCES[2]), "schema": ORDER, "query": "$.lines[*].qty"})
+    text = reply["content"][0]["text"]
+    assert text.startswith("🔎 2 matches for `$.lines[*].qty`\n**Schema:** ❌ 7 violations")
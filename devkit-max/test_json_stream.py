@@ -0,0 +1,89 @@
+"""
+Streaming JSON formatter tests for DevKit Max
+Checks the re-indenter against json.dumps output and json.loads errors
+"""
+
+import json
+import tracemalloc
+
+import pytest
+
+from utils import config
+from utils.json_stream import NotStreamable, reindent
+
+DOCUMENTS = [
+    '{"a": [1, 2, {"b": null}], "c": {}, "d": [], "e": [[]], "f": {"g": {"h": true}}}',
+    '[1.0e5, -0.0, -0, 1E-7, 1e400, -1e400, NaN, Infinity, -Infinity, 12345678901234567890]',
+    '"\\/\\u00e9\\ud800 \\" \\\\ \\t é"',
+    '{"k\\u0065y": "va\\nlue", "\\u00e9": "\\u0001"}',
+    ' \t\r\n[ ]\n',
+    'false',
+    '{"nested": [[[[[[{"deep": [1, "two", 3.25]}]]]]]]}',
+]
+
+LAYOUTS = [(2, False), (4, False), (1, False), (0, False), (None, False), (2, True)]
+
+
+def expected(document, indent, compact):
+    return json.dumps(
+        json.loads(document),
+        indent=indent if indent and not compact else None,
+        separators=(",", ":") if compact else None,
+        ensure_ascii=False
+    )
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_output_matches_json_dumps(document):
+    for indent, compact in LAYOUTS:
+        formatted, _ = reindent(document, indent, compact)
+        assert formatted == expected(document, indent, compact), (indent, compact)
+
+
+@pytest.mark.parametrize("document", [
+    "", "  ", "[", "{", "[1", '{"a"', "[1,]", '{"a":1,}', "[1 x]", "01", "[01]", "[1.]", "[-]", "tru",
+    "[1]x", '{"a" 1}', "[1}", '{"a":1]', '{"a":}', "{1:2}", "[,1]", "[1,,2]", '"ab', '["a\\x"]',
+    '["a\x01"]', '"\\u12"', '{"a":[1,{"b":nul}]}',
+    # Numbers whose last matched group is the fraction or exponent
+    "9.65071135 782408e-09", "[1 2.5]", '{"a" 1e5}', "[1 2.5e3]",
+    # Misplaced strings with bad escapes fail on their position, not the escape
+    '[1 "\\u12"]', '{"a" "\\x"}', '1 "\\q"',
+])
+def test_errors_match_json_loads(document):
+    with pytest.raises(json.JSONDecodeError) as tree_error:
+        json.loads(document)
+    with pytest.raises(json.JSONDecodeError) as stream_error:
+        reindent(document, 2)
+    assert (stream_error.value.msg, stream_error.value.pos) == (tree_error.value.msg, tree_error.value.pos)
+
+
+def test_summary_counts_top_level_members():
+    assert reindent('{"a": 1, "b": [1, 2, 3]}')[1] == "2 keys"
+    assert reindent("[1, [2, 3], {}]")[1] == "3 items"
+    assert reindent("[]")[1] == "0 items"
+    assert reindent('"x"')[1] == "scalar value"
+
+
+def test_duplicate_keys_are_left_to_the_tree_path(monkeypatch, tool_text):
+    with pytest.raises(NotStreamable):
+        reindent('{"a": 1, "a": 2}')
+
+    monkeypatch.setattr(config, "JSON_STREAM_MIN_BYTES", 0)
+    text = tool_text("json_formatter", {"json_string": '{"a": 1, "b": 2, "a": 3}'})
+    assert '"a": 3,\n  "b": 2' in text
+
+
+def test_memory_does_not_scale_with_parsed_objects():
+    row = json.dumps({"id": 1, "name": "row", "tags": ["a", "b"], "score": 0.5})
+    document = "[" + ",".join([row] * 20000) + "]"
+
+    tracemalloc.start()
+    try:
+        formatted, summary = reindent(document, 2)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert summary == "20000 items"
+    # Output twice over (chunks + joined result) plus small change; the parsed tree alone is several times that
+    assert peak < 2 * len(formatted) + 1024 * 1024
@@ -0,0 +1,54 @@
+"""
+Load mode tests for DevKit Max
+Runs http_tester load tests against the local stub server
+"""
+
+import json
+
+import httpx
+
+from utils import load_runner
+
+
+def test_load_mode_counts_every_request(http_stub, tool_text):
+    reply = json.loads(tool_text("http_tester", {
+        "method": "GET", "url": f"{http_stub}/bytes/1000",
+        "concurrency": 8, "total_requests": 200, "output": "structured", "mode": "load",
+    }))
+    summary = reply["result"]
+
+    assert summary["requests"] == summary["responses"] == 200
+    assert summary["status_codes"] == {"200": 200}
+    assert summary["error_categories"] == {}
+    assert summary["bytes_received"] == 200 * 1000
+    latency = summary["latency_ms"]
+    assert 0 < latency["min"] <= latency["p50"] <= latency["p90"] <= latency["p99"] <= latency["max"]
+    assert reply["meta"]["concurrency"] == 8
+    phases = summary["phases_ms"]
+    assert {"queue", "send", "wait", "download"} <= set(phases)
+    assert phases["wait"]["count"] == 200
+    assert phases["wait"]["p50"] <= phases["wait"]["p99"]
+
+
+def test_rps_target_paces_requests_for_the_duration(http_stub, tool_text):
+    summary = json.loads(tool_text("http_tester", {
+        "method": "GET", "url": f"{http_stub}/ping",
+        "concurrency": 4, "duration_seconds": 1.0, "rps": 50, "output": "structured", "mode": "load",
+    }))["result"]
+
+    assert 45 <= summary["requests"] <= 51
+    assert 40 <= summary["rps"] <= 55
+
+
+def test_failed_requests_are_categorized(tool_text):
+    reply = tool_text("http_tester", {"method": "GET", "url": "http://127.0.0.1:9/", "total_requests": 5, "concurrency": 2, "mode": "load"})
+
+    assert "**Errors:** connect × 5" in reply
+    assert "**Status codes:** none" in reply
+
+
+def test_error_categories():
+    assert load_runner.error_category(httpx.ReadTimeout("slow")) == "read_timeout"
+    assert load_runner.error_category(httpx.PoolTimeout("busy")) == "pool_timeout"
+    assert load_runner.error_category(httpx.RemoteProtocolError("bad")) == "protocol"
+    assert load_runner.error_category(ValueError("x")) == "ValueError"
@@ -0,0 +1,119 @@
+"""
+Local file input tests for DevKit Max
+Checks the allowed-root rules and that path input matches inline input for every tool that takes it
+"""
+
+import hashlib
+import json
+import os
+
+import pytest
+
+from utils import config, local_files
+from utils.local_files import PathNotAllowed, read_chunks, resolve
+
+
+@pytest.fixture
+def root(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "ALLOWED_ROOTS", [str(tmp_path / "allowed")])
+    (tmp_path / "allowed").mkdir()
+    return tmp_path / "allowed"
+
+
+def test_file_input_is_disabled_without_roots(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "ALLOWED_ROOTS", [])
+    (tmp_path / "a.txt").write_text("a")
+    with pytest.raises(PathNotAllowed, match="DEVKIT_ALLOWED_ROOTS"):
+        resolve(str(tmp_path / "a.txt"))
+
+
+def test_paths_must_stay_under_a_root(root):
+    (root / "a.txt").write_text("a")
+    (root.parent / "secret.txt").write_text("s")
+    (root / "link.txt").symlink_to(root.parent / "secret.txt")
+    assert resolve(str(root / "a.txt")) == os.path.realpath(root / "a.txt")
+    for path in [root.parent / "secret.txt", root / ".." / "secret.txt", root / "link.txt"]:
+        with pytest.raises(PathNotAllowed, match="outside the allowed directories"):
+            resolve(str(path))
+    # A sibling sharing the root's name as a prefix is not under it
+    (root.parent / "allowed-not").mkdir()
+    (root.parent / "allowed-not" / "b.txt").write_text("b")
+    with pytest.raises(PathNotAllowed):
+        resolve(str(root.parent / "allowed-not" / "b.txt"))
+    with pytest.raises(ValueError, match="is not a file"):
+        resolve(str(root))
+    with pytest.raises(ValueError, match="does not exist"):
+        resolve(str(root / "missing.txt"))
+
+
+def test_chunks_cover_the_file(root):
+    path = root / "data.bin"
+    path.write_bytes(bytes(range(256)) * 10)
+    assert b"".join(bytes(chunk) for chunk in read_chunks(str(path), 1000)) == path.read_bytes()
+
+
+def test_hash_file(root, tool_text):
+    path = root / "data.bin"
+    path.write_bytes(os.urandom(100_000))
+    text = tool_text("hash_generator", {"path": str(path), "algorithm": "sha512", "output": "structured"})
+    reply = json.loads(text)
+    assert reply["result"] == hashlib.sha512(path.read_bytes()).hexdigest()
+    assert reply["meta"]["input_length"] == 100_000
+
+
+@pytest.mark.parametrize("url_safe", [False, True])
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 100, 1001])
+def test_base64_file_matches_inline(root, monkeypatch, url_safe, size, tool_text):
+    # Small chunks, so most sizes span several of them
+    monkeypatch.setattr(local_files, "CHUNK_BYTES", 12)
+    monkeypatch.setattr("tools.base64_tool.CHUNK_BYTES", 12)
+    data = bytes((n * 7) % 120 + 1 for n in range(size))
+    path = root / "data.txt"
+    path.write_bytes(data)
+    encoded = json.loads(tool_text("base64_tool", {
+        "operation": "encode", "path": str(path), "url_safe": url_safe, "output": "structured"
+    }))["result"]
+    assert encoded == json.loads(tool_text("base64_tool", {
+        "operation": "encode", "input": data.decode(), "url_safe": url_safe, "output": "structured"
+    }))["result"]
+
+    (root / "encoded.txt").write_text(encoded + "\n")
+    decoded = json.loads(tool_text("base64_tool", {
+        "operation": "decode", "path": str(root / "encoded.txt"), "url_safe": url_safe, "output": "structured"
+    }))["result"]
+    assert decoded == data.decode()
+
+
+def test_json_formatter_file(root, tool_text):
+    path = root / "doc.json"
+    document = {"items": [{"id": n, "name": f"é{n}"} for n in range(5)]}
+    path.write_text(json.dumps(document), encoding="utf-8")
+    assert tool_text("json_formatter", {"path": str(path)}) == tool_text("json_formatter", {"json_string": json.dumps(document)})
+    text = tool_text("json_formatter", {"path": str(path), "mode": "profile"})
+    assert "| `$.items` | 1 | array 1 | array length 5 |" in text
+    text = tool_text("json_formatter", {"path": str(path), "query": "$.items[-1].id"})
+    assert text.startswith("🔎 1 matches")
+
+
+def test_json_formatter_file_errors_name_the_file(root, tool_text):
+    path = root / "bad.json"
+    path.write_text('{\n  "a": }')
+    text = tool_text("json_formatter", {"path": str(path)})
+    assert text.endswith(f"**Location:** `{path}` line 2, column 8")
+    assert tool_text("json_formatter", {"path": str(path), "mode": "profile"}) == text
+
+
+def test_file_results_are_not_cached(root, call_tool):
+    path = root / "a.txt"
+    path.write_text("one")
+    first = call_tool("hash_generator", {"path": str(path)})
+    path.write_text("two")
+    second = call_tool("hash_generator", {"path": str(path)})
+    assert first != second
+
+
+def test_input_and_path_are_exclusive(root, tool_text):
+    (root / "a.txt").write_text("a")
+    assert tool_text("hash_generator", {}) == "❌ Error: input or path is required"
+    text = tool_text("base64_tool", {"operation": "encode", "input": "a", "path": str(root / "a.txt")})
+    assert text == "❌ Error: pass either input or path, not both"
@@ -0,0 +1,120 @@
+"""
+Metrics tests for DevKit Max
+Covers histograms, the stats tool, Prometheus output and per-call overhead
+"""
+
+import asyncio
+import time
+
+from utils.metrics import BUCKET_BOUNDS_NS, Histogram, Metrics, geometric_bounds
+
+# Budget for recording one call (timers, size estimate, histogram update)
+OVERHEAD_BUDGET_NS = 10_000
+
+
+def test_histogram_percentiles_use_bucket_bounds():
+    hist = Histogram()
+    for _ in range(90):
+        hist.observe(40_000)          # 50µs bucket
+    for _ in range(9):
+        hist.observe(3_000_000)       # 5ms bucket
+    hist.observe(7_000_000_000)       # 10s bucket, capped at max
+
+    assert hist.percentile(0.50) == 50_000
+    assert hist.percentile(0.90) == 50_000
+    assert hist.percentile(0.99) == 5_000_000
+    assert hist.percentile(1.0) == 7_000_000_000
+    assert hist.count == 100
+    assert len(hist.counts) == len(BUCKET_BOUNDS_NS) + 1
+
+
+def test_registry_records_calls_errors_and_sizes(registry):
+
+    async def scenario():
+        await registry.call("hash_generator", {"input": "hello"})
+        await registry.call("hash_generator", {"input": "hello"})
+        await registry.call("base64_tool", {"operation": "decode", "input": "abc"})
+        try:
+            await registry.call("hash_generator", {})
+        except Exception:
+            pass
+
+    asyncio.run(scenario())
+    stats = {row["tool"]: row for row in registry.metrics.summary()}
+
+    assert stats["hash_generator"]["calls"] == 3
+    assert stats["hash_generator"]["errors"] == 1
+    assert stats["hash_generator"]["input_bytes"] == 10
+    assert stats["hash_generator"]["output_bytes"] > 0
+    assert stats["base64_tool"]["errors"] == 1
+    assert stats["hash_generator"]["p99_ms"] >= stats["hash_generator"]["p50_ms"]
+
+
+def test_stats_tool_reports_and_resets(registry):
+
+    async def scenario():
+        await registry.call("uuid_generator", {"count": 3})
+        first = await registry.call("devkit_stats", {"reset": True})
+        second = await registry.call("devkit_stats", {"tool": "uuid_generator"})
+        return first["content"][0]["text"], second["content"][0]["text"]
+
+    first, second = asyncio.run(scenario())
+    assert "| uuid_generator | 1 | 0 |" in first
+    assert "**Result cache:**" in first
+    assert "🔄 Metrics reset" in first
+    assert "No calls recorded yet." in second
+
+
+def test_prometheus_text_format(tmp_path):
+    metrics = Metrics()
+    metrics.record("json_formatter", 2_000_000, 1_000_000, 100, 200, False)
+    metrics.record("json_formatter", 30_000, 20_000, 100, 200, True)
+
+    path = tmp_path / "metrics.prom"
+    metrics.write_prometheus(str(path), {"hits": 1, "misses": 2, "evictions": 0, "expirations": 0, "bytes": 10})
+    text = path.read_text()
+
+    assert '# TYPE devkit_tool_duration_seconds histogram' in text
+    assert 'devkit_tool_duration_seconds_bucket{tool="json_formatter",le="5e-05"} 1' in text
+    assert 'devkit_tool_duration_seconds_bucket{tool="json_formatter",le="+Inf"} 2' in text
+    assert 'devkit_tool_duration_seconds_count{tool="json_formatter"} 2' in text
+    assert 'devkit_tool_errors_total{tool="json_formatter"} 1' in text
+    assert 'devkit_cache_misses_total 2' in text
+
+
+def test_recording_overhead_is_a_few_microseconds(registry):
+    result = {"content": [{"type": "text", "text": "ok"}]}
+
+    async def instant(name, arguments):
+        return result
+
+    registry.handlers["uuid_generator"] = instant
+    arguments = {"count": 1, "version": "v4"}
+    iterations = 20_000
+
+    async def timed(call):
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            await call("uuid_generator", arguments)
+        return (time.perf_counter_ns() - start) / iterations
+
+    async def scenario():
+        bare = await timed(registry._dispatch)
+        measured = await timed(registry.call)
+        return measured - bare
+
+    overhead_ns = min(asyncio.run(scenario()) for _ in range(3))
+    print(f"\n⏱️ metrics overhead per call: {overhead_ns / 1000:.2f}µs")
+    assert overhead_ns < OVERHEAD_BUDGET_NS
+
+
+def test_fine_histogram_tracks_min_and_resolves_within_ratio():
+    bounds = geometric_bounds(10_000, 10_000_000_000, 1.02)
+    hist = Histogram(bounds)
+    for ms in range(1, 101):
+        hist.observe(ms * 1_000_000)
+
+    assert hist.min == 1_000_000 and hist.max == 100_000_000
+    assert 50_000_000 <= hist.percentile(0.50) <= 51_000_000
+    assert 99_000_000 <= hist.percentile(0.99) <= 100_000_000
+    assert 1_000_000 <= hist.percentile(0.0) <= 1_020_000
@@ -0,0 +1,67 @@
+"""
+JSON Lines tests for DevKit Max
+Checks json_formatter's ndjson mode: per-line errors, layouts and parallel chunks
+"""
+
+import asyncio
+import json
+
+from utils import executor
+from utils.ndjson import MAX_REPORTED_ERRORS, format_ndjson, format_ndjson_parallel, iter_chunks
+
+LINES = '{"a": 1}\n\n[1,2]\n{"b": tru}\r\n"text"\n{"c": {"d": null}}\n{oops\n'
+
+
+def test_bad_lines_are_reported_by_number_without_stopping(tool_text):
+    text = tool_text("json_formatter", {"json_string": LINES, "mode": "ndjson", "compact": True})
+    assert text.startswith("⚠️ 4 valid records, 2 invalid lines")
+    assert '{"a":1}\n[1,2]\n"text"\n{"c":{"d":null}}' in text
+    assert "- Line 4, Column 7: Expecting value" in text
+    assert "- Line 7, Column 2: Expecting property name enclosed in double quotes" in text
+
+
+def test_records_are_pretty_printed_by_default(tool_text):
+    text = tool_text("json_formatter", {"json_string": LINES, "mode": "ndjson", "sort_keys": True})
+    assert '{\n  "c": {\n    "d": null\n  }\n}' in text
+
+
+def test_structured_reply_is_an_array_of_records(tool_text):
+    reply = json.loads(tool_text("json_formatter", {"json_string": LINES, "mode": "ndjson", "output": "structured"}))
+    assert reply["result"] == [{"a": 1}, [1, 2], "text", {"c": {"d": None}}]
+    assert reply["meta"]["valid"] is False
+    assert reply["meta"]["records"] == 4 and reply["meta"]["invalid"] == 2
+    assert [e["line"] for e in reply["meta"]["errors"]] == [4, 7]
+
+
+def test_error_list_is_bounded():
+    report = format_ndjson("x\n" * (MAX_REPORTED_ERRORS + 50), 2, False)
+    assert report.invalid == MAX_REPORTED_ERRORS + 50
+    assert len(report.errors) == MAX_REPORTED_ERRORS
+    assert report.errors[-1]["line"] == MAX_REPORTED_ERRORS
+
+
+def test_chunks_end_on_line_boundaries():
+    chunks = list(iter_chunks(LINES * 3, chunk_bytes=10))
+    assert "".join(chunk for _, chunk in chunks) == LINES * 3
+    assert all(chunk.endswith("\n") for _, chunk in chunks)
+    assert [first for first, _ in chunks][:3] == [1, 4, 5]
+
+
+def test_parallel_matches_serial():
+    text = "".join(
+        f'{{"id": {i}, "tags": ["x", "y"]}}\n' if i % 97 else "not json\n"
+        for i in range(1, 3000)
+    )
+    serial = format_ndjson(text, 0, False, compact=True)
+
+    async def scenario():
+        try:
+            return await format_ndjson_parallel(text, 0, False, compact=True, chunk_bytes=4096)
+        finally:
+            executor.shutdown_pools()
+
+    parallel = asyncio.run(scenario())
+    assert parallel.formatted("\n") == serial.formatted("\n")
+    assert (parallel.records, parallel.invalid) == (serial.records, serial.invalid)
+    assert parallel.errors == serial.errors
+    assert parallel.errors[0] == {"line": 97, "column": 1, "error": "Expecting value"}
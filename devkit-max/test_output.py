@@ -0,0 +1,101 @@
+"""
+Structured output tests for DevKit Max
+Every tool answers output="structured" with one compact {result, meta} object
+"""
+
+import json
+
+from test_server import tool_calls
+
+
+def call(call_tool, tool, arguments):
+    result = call_tool(tool, arguments)
+    assert len(result["content"]) == 1
+    return json.loads(result["content"][0]["text"])
+
+
+def test_every_tool_supports_structured_output(http_stub, call_tool):
+    for tool, (arguments, _) in tool_calls(http_stub).items():
+        reply = call(call_tool, tool, dict(arguments, output="structured"))
+        assert set(reply) == {"result", "meta"}, tool
+
+
+def test_structured_results_are_plain_values(call_tool):
+    text = "Hello World"
+
+    reply = call(call_tool, "base64_tool", {"operation": "encode", "input": text, "output": "structured"})
+    assert reply["result"] == "SGVsbG8gV29ybGQ="
+    assert reply["meta"] == {"operation": "encode", "url_safe": False, "input_length": 11, "output_length": 16}
+
+    reply = call(call_tool, "hash_generator", {"input": "hello", "algorithm": "md5", "output": "structured"})
+    assert reply["result"] == "5d41402abc4b2a76b9719d911017c592"
+
+    reply = call(call_tool, "json_formatter", {"json_string": '{"b": [1, 2], "a": null}', "sort_keys": True,
+                                              "output": "structured"})
+    assert reply["result"] == {"a": None, "b": [1, 2]}
+    assert reply["meta"] == {"valid": True, "summary": "2 keys"}
+
+    reply = call(call_tool, "uuid_generator", {"count": 3, "output": "structured"})
+    assert len(reply["result"]) == 3
+
+    reply = call(call_tool, "color_converter", {"color": "red", "to_format": "hex", "output": "structured"})
+    assert reply["result"] == {"hex": "#FF0000"}
+
+
+def test_structured_output_has_no_duplication(call_tool):
+    text = "x" * 100_000
+    result = call_tool("base64_tool", {"operation": "encode", "input": text, "output": "structured"})
+    markdown = call_tool("base64_tool", {"operation": "encode", "input": text})
+
+    encoded_length = len(json.loads(result["content"][0]["text"])["result"])
+    assert len(result["content"][0]["text"]) < encoded_length + 200
+    assert len(markdown["content"][0]["text"]) > 2 * encoded_length
+
+
+def test_structured_errors(registry, call_tool):
+
+    reply = call(call_tool, "json_formatter", {"json_string": '{"a": }', "output": "structured"})
+    assert reply["error"] == "Expecting value"
+    assert reply["meta"] == {"valid": False, "line": 1, "column": 7, "position": 6}
+
+    reply = call(call_tool, "base64_tool", {"operation": "decode", "input": "abc", "output": "structured"})
+    assert reply["error"].startswith("Failed to decode Base64")
+
+    call_tool("devkit_stats", {})
+    stats = {row["tool"]: row for row in registry.metrics.summary()}
+    assert stats["json_formatter"]["errors"] == 1
+    assert stats["base64_tool"]["errors"] == 1
+
+
+def test_batch_embeds_structured_items(call_tool):
+    reply = call(call_tool, "devkit_batch", {
+        "output": "structured",
+        "calls": [
+            {"tool": "hash_generator", "arguments": {"input": "a", "output": "structured"}},
+            {"tool": "uuid_generator", "arguments": {}},
+            {"tool": "nope"},
+        ],
+    })
+    first, second, third = reply["result"]
+    assert first["ok"] and first["meta"]["algorithm"] == "sha256"
+    assert second["ok"] and second["text"].startswith("Generated 1 UUIDv4")
+    assert third == {"tool": "nope", "ok": False, "error": "Unknown tool: nope"}
+    assert reply["meta"] == {"calls": 3, "succeeded": 2, "failed": 1}
+
+
+def test_batch_counts_handled_failures(call_tool):
+    calls = [
+        {"tool": "base64_tool", "arguments": {"operation": "decode", "input": "abc", "output": "structured"}},
+        {"tool": "hash_generator", "arguments": {"input": "a"}},
+        {"tool": "json_formatter", "arguments": {"json_string": "{"}},
+    ]
+    reply = call(call_tool, "devkit_batch", {"output": "structured", "calls": calls})
+    first, second, third = reply["result"]
+    assert first["ok"] is False and first["error"].startswith("Failed to decode Base64")
+    assert second["ok"] is True
+    assert third["ok"] is False and third["text"].startswith("❌ Invalid JSON")
+    assert reply["meta"] == {"calls": 3, "succeeded": 1, "failed": 2}
+
+    text = call_tool("devkit_batch", {"calls": calls})["content"][0]["text"]
+    assert "**Calls:** 3 | ✅ 1 succeeded | ❌ 2 failed" in text
+    assert "### 3. ❌ json_formatter\n❌ Invalid JSON" in text
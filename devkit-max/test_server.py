@@ -0,0 +1,102 @@
+"""
+Server tests for DevKit Max
+Exercises every tool through the real MCP request path
+"""
+
+import asyncio
+
+from mcp.shared.memory import create_connected_server_and_client_session
+
+import server
+
+
+SAMPLE_JWT = (
+    "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9."
+    "eyJzdWIiOiIxMjM0NTY3ODkwIiwibmFtZSI6IkpvaG4gRG9lIiwiaWF0IjoxNTE2MjM5MDIyfQ."
+    "SflKxwRJSMeKKF2QT4fwpMeJf36POk6yJV_adQssw5c"
+)
+
+
+def tool_calls(base_url):
+    return {
+        "base64_tool": ({"operation": "encode", "input": "Hello World"}, "SGVsbG8gV29ybGQ="),
+        "devkit_batch": ({"calls": [{"tool": "uuid_generator"}]}, "✅ 1 succeeded"),
+        "devkit_stats": ({}, "DevKit Stats"),
+        "color_converter": ({"color": "#FF5733"}, "rgb(255, 87, 51)"),
+        "hash_generator": ({"input": "hello"}, "2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824"),
+        "http_tester": ({"method": "GET", "url": f"{base_url}/ping"}, "(200)"),
+        "json_diff": ({"old": '{"a": 1}', "new": '{"a": 2}'}, '"op": "replace"'),
+        "json_formatter": ({"json_string": '{"b":1,"a":2}', "sort_keys": True}, '"a": 2'),
+        "jwt_decoder": ({"token": SAMPLE_JWT}, "John Doe"),
+        "sql_formatter": ({"sql": "select id from users where id = 1"}, "SELECT"),
+        "timestamp_tool": ({"input": "1672531200"}, "2023-01-01T00:00:00+00:00"),
+        "uuid_generator": ({"count": 2}, "Generated 2 UUIDv4"),
+    }
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_registry_indexes_every_tool():
+    server.load_tools()
+    assert sorted(server.registry.modules) == sorted(tool_calls("").keys())
+    assert [t.name for t in server.registry.tools] == list(server.registry.modules)
+
+
+def test_warm_up_imports_every_tool():
+    server.load_tools()
+    server.registry.warm_up()
+    assert sorted(server.registry.handlers) == sorted(server.registry.modules)
+
+
+def test_every_tool_reachable_through_mcp(http_stub):
+    server.load_tools()
+    calls = tool_calls(http_stub)
+
+    async def scenario():
+        async with create_connected_server_and_client_session(server.server) as client:
+            listed = await client.list_tools()
+            assert sorted(t.name for t in listed.tools) == sorted(calls)
+
+            for name, (arguments, expected) in calls.items():
+                result = await client.call_tool(name, arguments)
+                assert not result.isError, name
+                assert expected in result.content[0].text, name
+
+    run(scenario())
+
+
+def test_unknown_tool_is_an_error():
+    server.load_tools()
+
+    async def scenario():
+        async with create_connected_server_and_client_session(server.server) as client:
+            result = await client.call_tool("no_such_tool", {})
+            assert result.isError
+            assert "Unknown tool" in result.content[0].text
+
+    run(scenario())
+
+
+def test_batch_runs_calls_in_order_with_per_item_errors():
+    server.load_tools()
+    inputs = [f"value-{i}" for i in range(40)]
+    calls = [{"tool": "hash_generator", "arguments": {"input": text}} for text in inputs]
+    calls.insert(5, {"tool": "no_such_tool"})
+    calls.insert(10, {"tool": "hash_generator", "arguments": {}})
+    calls.insert(15, {"tool": "devkit_batch", "arguments": {"calls": []}})
+
+    async def scenario():
+        async with create_connected_server_and_client_session(server.server) as client:
+            result = await client.call_tool("devkit_batch", {"calls": calls, "parallelism": 4})
+            return result.content[0].text
+
+    text = run(scenario())
+    assert "**Calls:** 43 | ✅ 40 succeeded | ❌ 3 failed" in text
+    assert "### 6. ❌ no_such_tool\n**Error:** Unknown tool: no_such_tool" in text
+    assert "### 11. ❌ hash_generator\n**Error:** Input validation error" in text
+    assert "### 16. ❌ devkit_batch\n**Error:** devkit_batch cannot be nested" in text
+
+    positions = [text.index(f"**Input:** {value}\n") for value in inputs]
+    assert positions == sorted(positions)
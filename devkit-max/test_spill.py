@@ -0,0 +1,157 @@
+"""
+Spill store tests for DevKit Max
+Covers range reads from memory and disk, eviction, concurrent readers and
+the MCP resource round trip
+"""
+
+import asyncio
+import json
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from mcp.shared.exceptions import McpError
+from mcp.shared.memory import create_connected_server_and_client_session
+
+import server
+from utils import spill
+from utils.spill import SpillStore, parse_uri, spill_large_result
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+# Mixed-width characters so character and byte offsets differ
+SAMPLE = "".join(f"{i:06d}-é€😀\n" for i in range(40_000))
+
+
+def make_store(tmp_path, **overrides):
+    options = dict(memory_bytes=10 ** 9, max_bytes=10 ** 10, max_age=3600, directory=str(tmp_path))
+    options.update(overrides)
+    return SpillStore(**options)
+
+
+def test_ranges_from_memory_and_disk_match(tmp_path):
+    store = make_store(tmp_path, memory_bytes=1)
+    on_disk = store.put(SAMPLE, "disk")
+    assert on_disk.path and os.path.exists(on_disk.path)
+
+    for offset, length in [(0, 10), (65_530, 20), (123_457, 70_000), (len(SAMPLE) - 5, 100), (len(SAMPLE), 10)]:
+        text, _ = store.read(on_disk.id, offset, length)
+        assert text == SAMPLE[offset:offset + length]
+
+    whole, _ = store.read(on_disk.id)
+    assert whole == SAMPLE
+
+
+def test_memory_budget_spills_oldest_first(tmp_path):
+    store = make_store(tmp_path, memory_bytes=250)
+    first = store.put("a" * 100)
+    second = store.put("b" * 100)
+    third = store.put("c" * 100)
+
+    assert first.path is not None
+    assert second.text is not None and third.text is not None
+    assert store.stats()["bytes_in_memory"] == 200
+    assert store.read(first.id, 95, 10)[0] == "a" * 5
+
+
+def test_eviction_by_total_bytes_and_age(tmp_path):
+    clock = FakeClock()
+    store = make_store(tmp_path, memory_bytes=100, max_bytes=300, max_age=60, clock=clock)
+    entries = [store.put(str(i) * 100) for i in range(4)]
+
+    assert store.get(entries[0].id) is None
+    assert not os.path.exists(entries[0].path)
+    assert store.stats()["bytes_total"] == 300
+
+    clock.now = 61
+    assert store.list() == []
+    assert os.listdir(tmp_path) == []
+    assert store.stats()["evictions"] == 4
+
+
+def test_concurrent_readers(tmp_path):
+    store = make_store(tmp_path, memory_bytes=len(SAMPLE.encode()) + 10)
+    ids = [store.put(SAMPLE, f"copy {i}").id for i in range(3)]
+    assert sum(1 for e in store.list() if e.path) == 2
+
+    rng = random.Random(7)
+    requests = [
+        (rng.choice(ids), rng.randrange(len(SAMPLE)), rng.randrange(1, 100_000))
+        for _ in range(300)
+    ]
+
+    def read(request):
+        entry_id, offset, length = request
+        return store.read(entry_id, offset, length)[0] == SAMPLE[offset:offset + length]
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        assert all(pool.map(read, requests))
+
+
+def test_small_results_stay_inline():
+    result = {"content": [{"type": "text", "text": "small"}]}
+    assert spill_large_result(result, "t", structured=False, limit=100) is result
+
+
+def test_parse_uri():
+    assert parse_uri("devkit://results/abc123?offset=10&length=5") == ("abc123", 10, 5)
+    assert parse_uri("devkit://results/abc123") == ("abc123", 0, None)
+
+
+def test_large_result_round_trip_through_resources(http_stub):
+    server.load_tools()
+    document = json.dumps([{"id": i, "name": f"item {i}"} for i in range(30_000)])
+
+    async def scenario():
+        async with create_connected_server_and_client_session(server.server) as client:
+            result = await client.call_tool("json_formatter", {"json_string": document, "output": "structured"})
+            reply = json.loads(result.content[0].text)
+            uri = reply["resource"]["uri"]
+
+            listed = await client.list_resources()
+            assert uri in [str(r.uri) for r in listed.resources]
+
+            chunks = []
+            offset = 0
+            while offset < reply["resource"]["chars"]:
+                read = await client.read_resource(f"{uri}?offset={offset}&length=200000")
+                chunks.append(read.contents[0].text)
+                offset += 200_000
+
+            body = await client.call_tool("http_tester", {"method": "GET", "url": f"{http_stub}/bytes/5000"})
+            body_uri = body.content[0].text.split("**Full body:** `")[1].split("`")[0]
+            body_read = await client.read_resource(body_uri)
+            return reply, "".join(chunks), body_read.contents[0].text
+
+    reply, full, body_text = asyncio.run(scenario())
+    assert reply["meta"] == {"spilled": True}
+    assert json.loads(full)["result"] == json.loads(document)
+    assert body_text == "x" * 5000
+
+
+def test_results_are_scoped_to_the_session_that_stored_them():
+    server.load_tools()
+    document = json.dumps(list(range(100_000)))
+
+    async def scenario():
+        async with create_connected_server_and_client_session(server.server) as owner, \
+                create_connected_server_and_client_session(server.server) as other:
+            result = await owner.call_tool("json_formatter", {"json_string": document, "output": "structured"})
+            uri = json.loads(result.content[0].text)["resource"]["uri"]
+
+            assert uri in [str(r.uri) for r in (await owner.list_resources()).resources]
+            assert uri not in [str(r.uri) for r in (await other.list_resources()).resources]
+            assert uri not in [entry.uri for entry in spill.store.list()]
+            with pytest.raises(McpError, match="Result expired or unknown"):
+                await other.read_resource(uri)
+            return (await owner.read_resource(uri)).contents[0].text
+
+    assert json.loads(asyncio.run(scenario()))["result"] == json.loads(document)
@@ -0,0 +1,72 @@
+"""
+Startup tests for DevKit Max
+Checks that list_tools needs no tool imports and records cold-start time
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+from tools.manifest import TOOLS
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Generous ceiling for process start -> first JSON-RPC response; mostly the mcp import
+STARTUP_BUDGET_SECONDS = 5.0
+
+
+def send(proc, message):
+    proc.stdin.write(json.dumps(message) + "\n")
+    proc.stdin.flush()
+
+
+def test_list_tools_imports_no_tool_module():
+    code = (
+        "import asyncio, sys, server\n"
+        "server.load_tools()\n"
+        "tools = asyncio.run(server.handle_list_tools())\n"
+        "print(len(tools), sorted(m for m in sys.modules if m.startswith('tools.')))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=HERE, capture_output=True, text=True, check=True
+    ).stdout.strip()
+    assert out == f"{len(TOOLS)} ['tools.manifest']"
+
+
+def test_startup_budget():
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "server.py"],
+        cwd=HERE,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    try:
+        send(proc, {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "clientInfo": {"name": "startup-test", "version": "0"},
+            },
+        })
+        first = json.loads(proc.stdout.readline())
+        elapsed = time.perf_counter() - start
+
+        send(proc, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+        send(proc, {"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        listed = json.loads(proc.stdout.readline())
+    finally:
+        proc.stdin.close()
+        proc.wait(timeout=10)
+
+    print(f"\n⏱️ process start -> initialize reply: {elapsed * 1000:.0f}ms")
+    assert first["id"] == 1 and "result" in first
+    assert len(listed["result"]["tools"]) == len(TOOLS)
+    assert elapsed < STARTUP_BUDGET_SECONDS
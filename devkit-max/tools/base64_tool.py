@@ -4,59 +4,96 @@ Bidirectional Base64 conversion with URL-safe support
 """
 
 import base64
+import binascii
+import os
 from mcp.server import Server
 
+from tools.manifest import get_schema
+from utils.executor import run_tool_work
+from utils.local_files import CHUNK_BYTES, input_path, mapped, read_text
+from utils.output import is_structured, structured_error, structured_result
+
+
+def encode_base64(input_text: str, url_safe: bool) -> str:
+    """Encode text to (optionally URL-safe, unpadded) Base64"""
+    if url_safe:
+        return base64.urlsafe_b64encode(input_text.encode()).decode().rstrip("=")
+    return base64.b64encode(input_text.encode()).decode()
+
+
+def decode_base64(input_text: str, url_safe: bool) -> str:
+    """Decode Base64 to text, restoring stripped padding for URL-safe input"""
+    if url_safe:
+        # Add padding if needed
+        padding = 4 - len(input_text) % 4
+        padded = input_text if padding == 4 else input_text + "=" * padding
+        return base64.urlsafe_b64decode(padded).decode()
+    return base64.b64decode(input_text).decode()
+
+
+def encode_base64_file(path: str, url_safe: bool) -> str:
+    """Encode a file to Base64 from memoryview slices of its mapping"""
+    encode = base64.urlsafe_b64encode if url_safe else base64.b64encode
+    with mapped(path) as buffer, memoryview(buffer) as view:
+        # CHUNK_BYTES is a multiple of 3, so only the last chunk can be padded
+        encoded = b"".join(encode(view[start:start + CHUNK_BYTES]) for start in range(0, len(view), CHUNK_BYTES))
+    if url_safe:
+        return encoded.decode().rstrip("=")
+    return encoded.decode()
+
+
+def decode_base64_file(path: str, url_safe: bool) -> str:
+    """Decode a Base64 file to text; the standard alphabet is decoded straight from the mapping"""
+    if url_safe:
+        return decode_base64(read_text(path).strip(), url_safe)
+    with mapped(path) as buffer:
+        return binascii.a2b_base64(buffer).decode()
+
 
 def register_tool(server: Server):
     """Register Base64 tool with the server"""
     
     @server.list_tools()
     async def handle_list_tools():
-        return [{
-            "name": "base64_tool",
-            "description": "Encode or decode Base64 strings with optional URL-safe formatting",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "operation": {
-                        "type": "string",
-                        "description": "Operation to perform",
-                        "enum": ["encode", "decode"],
-                        "default": "encode"
-                    },
-                    "input": {
-                        "type": "string",
-                        "description": "Text to encode or Base64 to decode"
-                    },
-                    "url_safe": {
-                        "type": "boolean",
-                        "description": "Use URL-safe Base64 encoding (replaces + with -, / with _)",
-                        "default": False
-                    }
-                },
-                "required": ["operation", "input"]
-            }
-        }]
+        return [get_schema("base64_tool")]
     
     @server.call_tool()
     async def handle_call_tool(name: str, arguments: dict):
         if name == "base64_tool":
             try:
                 operation = arguments["operation"]
-                input_text = arguments["input"]
+                path = input_path(arguments, "input")
                 url_safe = arguments.get("url_safe", False)
                 
+                # Files are read in the worker, by path; their length is counted in bytes
+                if path:
+                    input_length = os.path.getsize(path)
+                    work = (path, url_safe)
+                    source = f"{input_length} bytes from `{path}`"
+                    meta = {"path": path}
+                else:
+                    input_length = len(arguments["input"])
+                    work = (arguments["input"], url_safe)
+                    source = f"{input_length} chars"
+                    meta = {}
+                
                 if operation == "encode":
                     # Encode to Base64
-                    if url_safe:
-                        encoded = base64.urlsafe_b64encode(input_text.encode()).decode().rstrip("=")
-                    else:
-                        encoded = base64.b64encode(input_text.encode()).decode()
+                    encoded = await run_tool_work(
+                        "base64_tool", input_length,
+                        encode_base64_file if path else encode_base64, *work
+                    )
+                    
+                    if is_structured(arguments):
+                        return structured_result(
+                            encoded, operation="encode", url_safe=url_safe,
+                            input_length=input_length, output_length=len(encoded), **meta
+                        )
                     
                     return {
                         "content": [{
                             "type": "text",
-                            "text": f"""✅ Encoded to Base64 ({len(input_text)} chars → {len(encoded)} chars)
+                            "text": f"""✅ Encoded to Base64 ({source} → {len(encoded)} chars)
 
 ```
 {encoded}
@@ -69,18 +106,21 @@ def register_tool(server: Server):
                 else:  # decode
                     # Decode from Base64
                     try:
-                        if url_safe:
-                            # Add padding if needed
-                            padding = 4 - len(input_text) % 4
-                            padded = input_text if padding == 4 else input_text + "=" * padding
-                            decoded = base64.urlsafe_b64decode(padded).decode()
-                        else:
-                            decoded = base64.b64decode(input_text).decode()
+                        decoded = await run_tool_work(
+                            "base64_tool", input_length,
+                            decode_base64_file if path else decode_base64, *work
+                        )
+                        
+                        if is_structured(arguments):
+                            return structured_result(
+                                decoded, operation="decode", url_safe=url_safe,
+                                input_length=input_length, output_length=len(decoded), **meta
+                            )
                         
                         return {
                             "content": [{
                                 "type": "text",
-                                "text": f"""✅ Decoded from Base64 ({len(input_text)} chars → {len(decoded)} chars)
+                                "text": f"""✅ Decoded from Base64 ({source} → {len(decoded)} chars)
 
 ```
 {decoded}
@@ -91,6 +131,9 @@ def register_tool(server: Server):
                         }
                     
                     except Exception as e:
+                        if is_structured(arguments):
+                            return structured_error(f"Failed to decode Base64: {str(e)}", operation="decode")
+                        
                         return {
                             "content": [{
                                 "type": "text",
@@ -106,6 +149,9 @@ def register_tool(server: Server):
                         }
             
             except Exception as e:
+                if is_structured(arguments):
+                    return structured_error(str(e))
+                
                 return {
                     "content": [{
                         "type": "text",
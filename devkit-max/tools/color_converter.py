@@ -8,6 +8,9 @@ import colorsys
 import math
 from mcp.server import Server
 
+from tools.manifest import get_schema
+from utils.output import is_structured, structured_error, structured_result
+
 
 # CSS color names dictionary
 CSS_COLORS = {
@@ -29,32 +32,7 @@ def register_tool(server: Server):
     
     @server.list_tools()
     async def handle_list_tools():
-        return [{
-            "name": "color_converter",
-            "description": "Convert between color formats (HEX, RGB, HSL, CSS names) with visual preview",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "color": {
-                        "type": "string",
-                        "description": "Color input in any format"
-                    },
-                    "from_format": {
-                        "type": "string",
-                        "description": "Input format",
-                        "enum": ["auto", "hex", "rgb", "hsl", "name"],
-                        "default": "auto"
-                    },
-                    "to_format": {
-                        "type": "string",
-                        "description": "Output format",
-                        "enum": ["all", "hex", "rgb", "hsl", "name"],
-                        "default": "all"
-                    }
-                },
-                "required": ["color"]
-            }
-        }]
+        return [get_schema("color_converter")]
     
     @server.call_tool()
     async def handle_call_tool(name: str, arguments: dict):
@@ -90,6 +68,9 @@ def register_tool(server: Server):
                     elif re.match(r'^hsl\(', color_input):
                         from_format = "hsl"
                     else:
+                        if is_structured(arguments):
+                            return structured_error(f"Unknown color format: '{color_input}'")
+                        
                         return {
                             "content": [{
                                 "type": "text",
@@ -158,6 +139,17 @@ Try formats:
                 h, l, s = colorsys.rgb_to_hls(r/255.0, g/255.0, b/255.0)
                 hsl_str = f"hsl({int(h*360)}, {int(s*100)}%, {int(l*100)}%)"
                 
+                if is_structured(arguments):
+                    formats = {
+                        "hex": hex_color.upper(),
+                        "rgb": rgb_str,
+                        "hsl": hsl_str,
+                        "name": color_name
+                    }
+                    if to_format != "all":
+                        formats = {to_format: formats[to_format]}
+                    return structured_result(formats, input=color_input, rgb=[r, g, b])
+                
                 # Build response
                 color_block = "████████"
                 
@@ -190,6 +182,9 @@ Try formats:
                 }
             
             except Exception as e:
+                if is_structured(arguments):
+                    return structured_error(str(e))
+                
                 return {
                     "content": [{
                         "type": "text",
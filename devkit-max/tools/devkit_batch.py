@@ -0,0 +1,94 @@
+"""
+Batch Tool
+Run many DevKit tool calls in one round trip
+"""
+
+import asyncio
+import json
+from mcp.server import Server
+
+from tools.manifest import get_schema
+from utils import config
+from utils.metrics import is_error_result
+from utils.output import is_structured, structured_error, structured_result
+
+
+def register_tool(server: Server):
+    """
+    Register the batch meta-tool.
+
+    `server` is the ToolRegistry when loaded by server.py; batched calls go
+    through its `call()` so every tool handler is reused as-is.
+    """
+    registry = server
+    
+    @server.list_tools()
+    async def handle_list_tools():
+        return [get_schema("devkit_batch")]
+    
+    @server.call_tool()
+    async def handle_call_tool(name: str, arguments: dict):
+        if name == "devkit_batch":
+            try:
+                calls = arguments["calls"]
+                parallelism = arguments.get("parallelism") or config.BATCH_PARALLELISM
+                limit = asyncio.Semaphore(max(1, parallelism))
+                
+                async def run_one(call: dict):
+                    """(tool, ok, text, raised): handled failures keep the tool's own reply text"""
+                    tool = call.get("tool", "")
+                    tool_args = call.get("arguments") or {}
+                    async with limit:
+                        try:
+                            if tool == "devkit_batch":
+                                raise ValueError("devkit_batch cannot be nested")
+                            registry.validate(tool, tool_args)
+                            result = await registry.call(tool, tool_args)
+                            text = "\n".join(block["text"] for block in result.get("content", []))
+                            return tool, not is_error_result(result), text, False
+                        except Exception as e:
+                            return tool, False, str(e), True
+                
+                results = await asyncio.gather(*(run_one(call) for call in calls))
+                
+                succeeded = sum(1 for _, ok, _, _ in results if ok)
+                failed = len(results) - succeeded
+                
+                if is_structured(arguments):
+                    items = []
+                    for call, (tool, ok, text, raised) in zip(calls, results):
+                        if raised:
+                            items.append({"tool": tool, "ok": False, "error": text})
+                        elif is_structured(call.get("arguments") or {}):
+                            # Embed the inner JSON object rather than an escaped string
+                            items.append({"tool": tool, "ok": ok, **json.loads(text)})
+                        else:
+                            items.append({"tool": tool, "ok": ok, "text": text})
+                    return structured_result(items, calls=len(results), succeeded=succeeded, failed=failed)
+                
+                response = f"## 📦 Batch Results\n\n"
+                response += f"**Calls:** {len(results)} | ✅ {succeeded} succeeded | ❌ {failed} failed\n"
+                
+                for i, (tool, ok, text, raised) in enumerate(results, 1):
+                    if not raised:
+                        response += f"\n### {i}. {'✅' if ok else '❌'} {tool}\n{text}\n"
+                    else:
+                        response += f"\n### {i}. ❌ {tool}\n**Error:** {text}\n"
+                
+                return {
+                    "content": [{
+                        "type": "text",
+                        "text": response
+                    }]
+                }
+            
+            except Exception as e:
+                if is_structured(arguments):
+                    return structured_error(str(e))
+                
+                return {
+                    "content": [{
+                        "type": "text",
+                        "text": f"❌ Error: {str(e)}"
+                    }]
+                }
@@ -0,0 +1,94 @@
+"""
+Stats Tool
+Report per-tool latency percentiles and counters recorded by the server
+"""
+
+from mcp.server import Server
+
+from tools.manifest import get_schema
+from utils.output import is_structured, structured_error, structured_result
+
+
+def format_bytes(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+def register_tool(server: Server):
+    """
+    Register the stats meta-tool.
+
+    `server` is the ToolRegistry when loaded by server.py; its metrics and
+    result cache are what this tool reports.
+    """
+    registry = server
+    
+    @server.list_tools()
+    async def handle_list_tools():
+        return [get_schema("devkit_stats")]
+    
+    @server.call_tool()
+    async def handle_call_tool(name: str, arguments: dict):
+        if name == "devkit_stats":
+            try:
+                only_tool = arguments.get("tool")
+                reset = arguments.get("reset", False)
+                
+                rows = registry.metrics.summary()
+                if only_tool:
+                    rows = [row for row in rows if row["tool"] == only_tool]
+                
+                cache = registry.cache.stats()
+                
+                if is_structured(arguments):
+                    if reset:
+                        registry.metrics.reset()
+                    return structured_result({"tools": rows, "cache": cache}, reset=reset)
+                
+                response = "## 📊 DevKit Stats\n\n"
+                
+                if rows:
+                    response += "| Tool | Calls | Errors | p50 ms | p90 ms | p99 ms | Max ms | CPU p50 ms | In | Out |\n"
+                    response += "|------|------:|-------:|-------:|-------:|-------:|-------:|-----------:|---:|----:|\n"
+                    for row in rows:
+                        response += (
+                            f"| {row['tool']} | {row['calls']} | {row['errors']} "
+                            f"| {row['p50_ms']:.3f} | {row['p90_ms']:.3f} | {row['p99_ms']:.3f} "
+                            f"| {row['max_ms']:.3f} | {row['cpu_p50_ms']:.3f} "
+                            f"| {format_bytes(row['input_bytes'])} | {format_bytes(row['output_bytes'])} |\n"
+                        )
+                    response += "\nPercentiles are bucket upper bounds; CPU time is measured on the event loop thread.\n"
+                else:
+                    response += "No calls recorded yet.\n"
+                
+                lookups = cache["hits"] + cache["misses"]
+                hit_rate = cache["hits"] / lookups * 100 if lookups else 0
+                response += f"\n**Result cache:** {cache['entries']} entries, "
+                response += f"{format_bytes(cache['bytes'])} / {format_bytes(cache['max_bytes'])}\n"
+                response += f"• Hits: {cache['hits']} ({hit_rate:.1f}%) | Misses: {cache['misses']} "
+                response += f"| Evictions: {cache['evictions']} | Expired: {cache['expirations']}\n"
+                
+                if reset:
+                    registry.metrics.reset()
+                    response += "\n🔄 Metrics reset"
+                
+                return {
+                    "content": [{
+                        "type": "text",
+                        "text": response
+                    }]
+                }
+            
+            except Exception as e:
+                if is_structured(arguments):
+                    return structured_error(str(e))
+                
+                return {
+                    "content": [{
+                        "type": "text",
+                        "text": f"❌ Error: {str(e)}"
+                    }]
+                }
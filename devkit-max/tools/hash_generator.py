@@ -5,70 +5,99 @@ Generate cryptographic hashes (MD5, SHA1, SHA256, SHA512)
 
 import hashlib
 import base64
+import os
 from mcp.server import Server
 
+from tools.manifest import get_schema
+from utils.executor import run_tool_work
+from utils.local_files import input_path, read_chunks
+from utils.output import is_structured, structured_error, structured_result
+
+
+def new_hash(algorithm: str):
+    """(algorithm actually used, empty hash object); unknown names fall back to sha256"""
+    # Select hash algorithm
+    if algorithm == "md5":
+        hash_obj = hashlib.md5()
+    elif algorithm == "sha1":
+        hash_obj = hashlib.sha1()
+    elif algorithm == "sha256":
+        hash_obj = hashlib.sha256()
+    elif algorithm == "sha512":
+        hash_obj = hashlib.sha512()
+    else:
+        algorithm = "sha256"
+        hash_obj = hashlib.sha256()
+    return algorithm, hash_obj
+
+
+def encode_digest(hash_obj, encoding: str) -> str:
+    if encoding == "hex":
+        return hash_obj.hexdigest()
+    # base64
+    return base64.b64encode(hash_obj.digest()).decode()
+
+
+def compute_hash(input_text: str, algorithm: str, encoding: str):
+    """Hash text; returns (algorithm actually used, encoded digest)"""
+    algorithm, hash_obj = new_hash(algorithm)
+    hash_obj.update(input_text.encode())
+    return algorithm, encode_digest(hash_obj, encoding)
+
+
+def hash_file(path: str, algorithm: str, encoding: str):
+    """Hash a file chunk by chunk, without reading it into memory; returns (algorithm, encoded digest)"""
+    algorithm, hash_obj = new_hash(algorithm)
+    for chunk in read_chunks(path):
+        hash_obj.update(chunk)
+    return algorithm, encode_digest(hash_obj, encoding)
+
 
 def register_tool(server: Server):
     """Register hash generator tool with the server"""
     
     @server.list_tools()
     async def handle_list_tools():
-        return [{
-            "name": "hash_generator",
-            "description": "Generate cryptographic hashes (MD5, SHA1, SHA256, SHA512)",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "input": {
-                        "type": "string",
-                        "description": "Text to hash"
-                    },
-                    "algorithm": {
-                        "type": "string",
-                        "description": "Hash algorithm to use",
-                        "enum": ["md5", "sha1", "sha256", "sha512"],
-                        "default": "sha256"
-                    },
-                    "encoding": {
-                        "type": "string",
-                        "description": "Output encoding format",
-                        "enum": ["hex", "base64"],
-                        "default": "hex"
-                    }
-                },
-                "required": ["input"]
-            }
-        }]
+        return [get_schema("hash_generator")]
     
     @server.call_tool()
     async def handle_call_tool(name: str, arguments: dict):
         if name == "hash_generator":
             try:
-                input_text = arguments["input"]
+                path = input_path(arguments, "input")
                 algorithm = arguments.get("algorithm", "sha256").lower()
                 encoding = arguments.get("encoding", "hex")
                 
-                # Select hash algorithm
-                if algorithm == "md5":
-                    hash_obj = hashlib.md5()
-                elif algorithm == "sha1":
-                    hash_obj = hashlib.sha1()
-                elif algorithm == "sha256":
-                    hash_obj = hashlib.sha256()
-                elif algorithm == "sha512":
-                    hash_obj = hashlib.sha512()
+                # Hash large inputs in a worker thread (hashlib releases the GIL)
+                if path:
+                    size = os.path.getsize(path)
+                    algorithm, result = await run_tool_work(
+                        "hash_generator", size,
+                        hash_file, path, algorithm, encoding
+                    )
                 else:
-                    algorithm = "sha256"
-                    hash_obj = hashlib.sha256()
+                    input_text = arguments["input"]
+                    algorithm, result = await run_tool_work(
+                        "hash_generator", len(input_text),
+                        compute_hash, input_text, algorithm, encoding
+                    )
                 
-                # Compute hash
-                hash_obj.update(input_text.encode())
+                if is_structured(arguments):
+                    if path:
+                        return structured_result(
+                            result, algorithm=algorithm, encoding=encoding, path=path, input_length=size
+                        )
+                    return structured_result(
+                        result, algorithm=algorithm, encoding=encoding, input_length=len(input_text)
+                    )
                 
-                # Encode output
-                if encoding == "hex":
-                    result = hash_obj.hexdigest()
-                else:  # base64
-                    result = base64.b64encode(hash_obj.digest()).decode()
+                if path:
+                    source = f"**File:** `{path}`\n**Input Length:** {size} bytes"
+                else:
+                    source = (
+                        f"**Input:** {input_text[:50]}{'...' if len(input_text) > 50 else ''}\n"
+                        f"**Input Length:** {len(input_text)} chars"
+                    )
                 
                 return {
                     "content": [{
@@ -77,8 +106,7 @@ def register_tool(server: Server):
 
 **Algorithm:** {algorithm.upper()}
 **Encoding:** {encoding}
-**Input:** {input_text[:50]}{'...' if len(input_text) > 50 else ''}
-**Input Length:** {len(input_text)} chars
+{source}
 
 ```
 {result}
@@ -89,6 +117,9 @@ def register_tool(server: Server):
                 }
             
             except Exception as e:
+                if is_structured(arguments):
+                    return structured_error(str(e))
+                
                 return {
                     "content": [{
                         "type": "text",
@@ -4,67 +4,209 @@ Make HTTP requests and inspect responses
 """
 
 import httpx
-import json
 import time
 import asyncio
 from mcp.server import Server
 
+from tools.manifest import get_schema
+from utils import config, fanout, http_cache, http_pool, json_backend, load_runner, replay, spill
+from utils.http_body import read_body
+from utils.http_timing import PHASES, PhaseTimer
+from utils.output import is_structured, structured_error, structured_result
+from utils.progress import report_progress
+
+
+def render_load_report(method: str, url: str, summary: dict, concurrency: int, target_rps) -> str:
+    """Markdown for a load-mode run"""
+    latency = summary["latency_ms"]
+    achieved = f"{summary['rps']:,.1f} req/s"
+    if target_rps:
+        achieved += f" (target {target_rps:g})"
+    statuses = ", ".join(f"{code} × {n:,}" for code, n in summary["status_codes"].items()) or "none"
+    errors = ", ".join(f"{kind} × {n:,}" for kind, n in summary["error_categories"].items()) or "none"
+    phases = "**Phases (ms, p50 / p90 / p99):**\n" + "\n".join(
+        f"• {phase}: {row['p50']:.2f} / {row['p90']:.2f} / {row['p99']:.2f}"
+        for phase, row in summary["phases_ms"].items()
+    )
+    status_emoji = "✅" if not summary["errors"] and all(
+        code.startswith("2") for code in summary["status_codes"]
+    ) else "⚠️"
+    
+    return f"""{status_emoji} **Load test: {method} {url}**
+
+**Requests:** {summary['requests']:,} in {summary['duration_s']:.2f}s | **Achieved:** {achieved} | **Concurrency:** {concurrency}
+
+**Latency (ms):**
+• min: {latency['min']:.2f}
+• p50: {latency['p50']:.2f}
+• p90: {latency['p90']:.2f}
+• p99: {latency['p99']:.2f}
+• max: {latency['max']:.2f}
+
+{phases}
+
+**Status codes:** {statuses}
+**Errors:** {errors}
+**Transferred:** {summary['bytes_received'] / 1024:.2f} KB received, {summary['bytes_sent'] / 1024:.2f} KB sent"""
+
+
+def render_fanout_table(rows: list, total_ms: float, hosts: int) -> str:
+    """Markdown table for a fan-out run: one line per request"""
+    ok = sum(1 for row in rows if row["status"] is not None and 200 <= row["status"] < 300)
+    failed = sum(1 for row in rows if row["error"] is not None)
+    other = len(rows) - ok - failed
+    
+    lines = [
+        f"## 🌐 Fan-out: {len(rows)} requests to {hosts} host{'s' if hosts != 1 else ''}",
+        "",
+        f"**✅ {ok} ok | ⚠️ {other} non-2xx | ❌ {failed} failed** | ⏱️ {total_ms:.0f}ms total",
+        "",
+        "| # | Status | Method | URL | Latency | Size |",
+        "|---|--------|--------|-----|---------|------|",
+    ]
+    for i, row in enumerate(rows, 1):
+        if row["error"] is not None:
+            status = f"❌ {row['error']}"
+        else:
+            status = f"{'✅' if 200 <= row['status'] < 300 else '⚠️'} {row['status']}"
+        latency = f"{row['latency_ms']:.1f}ms" if row["latency_ms"] is not None else "-"
+        lines.append(
+            f"| {i} | {status} | {row['method']} | {row['url']} | {latency} | {row['size_bytes'] / 1024:.1f} KB |"
+        )
+    return "\n".join(lines)
+
+
+def render_replay_report(rows: list, timing: dict) -> str:
+    """Markdown timing and assertion report for a replayed collection"""
+    passed = sum(1 for row in rows if row["ok"])
+    skipped = sum(1 for row in rows if row["skipped"])
+    failed = len(rows) - passed - skipped
+    
+    lines = [
+        f"## 🔁 Replay: {len(rows)} requests",
+        "",
+        f"**✅ {passed} passed | ❌ {failed} failed | ⏭️ {skipped} skipped**",
+        f"⏱️ {timing['wall_ms']:.0f}ms wall | {timing['critical_path_ms']:.0f}ms critical path | "
+        f"{timing['sum_ms']:.0f}ms if run one by one",
+        "",
+        "| # | Request | Status | Start | Latency | Result |",
+        "|---|---------|--------|-------|---------|--------|",
+    ]
+    for i, row in enumerate(rows, 1):
+        if row["ok"]:
+            result = "✅ pass"
+        elif row["skipped"]:
+            result = f"⏭️ {row['error']}"
+        elif row["error"]:
+            result = f"❌ {row['error']}"
+        else:
+            result = "❌ " + "; ".join(row["failures"])
+        start = f"+{row['start_ms']:.0f}ms" if row["start_ms"] is not None else "-"
+        latency = f"{row['latency_ms']:.1f}ms" if row["latency_ms"] is not None else "-"
+        lines.append(
+            f"| {i} | {row['name']} | {row['status'] or '-'} | {start} | {latency} | {result} |"
+        )
+    return "\n".join(lines)
+
 
 def register_tool(server: Server):
     """Register HTTP tester tool with the server"""
     
     @server.list_tools()
     async def handle_list_tools():
-        return [{
-            "name": "http_tester",
-            "description": "Make HTTP requests (GET, POST, PUT, DELETE, PATCH) and inspect responses",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "method": {
-                        "type": "string",
-                        "description": "HTTP method",
-                        "enum": ["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD"],
-                        "default": "GET"
-                    },
-                    "url": {
-                        "type": "string",
-                        "description": "Full URL with protocol (http:// or https://)"
-                    },
-                    "headers": {
-                        "type": "object",
-                        "description": "Request headers as JSON object",
-                        "default": {}
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "Request body (for POST, PUT, PATCH)",
-                        "default": ""
-                    },
-                    "timeout": {
-                        "type": "integer",
-                        "description": "Timeout in seconds",
-                        "default": 10,
-                        "minimum": 1,
-                        "maximum": 60
-                    }
-                },
-                "required": ["method", "url"]
-            }
-        }]
+        return [get_schema("http_tester")]
     
     @server.call_tool()
     async def handle_call_tool(name: str, arguments: dict):
         if name == "http_tester":
             try:
-                method = arguments["method"].upper()
-                url = arguments["url"]
+                method = arguments.get("method", "GET").upper()
+                url = arguments.get("url", "")
                 headers = arguments.get("headers", {})
                 body = arguments.get("body", "")
                 timeout = arguments.get("timeout", 10)
+                verify = arguments.get("verify", True)
+                http2 = arguments.get("http2", False)
+                
+                if arguments.get("mode") == "replay":
+                    collection = arguments.get("collection")
+                    if collection is None and arguments.get("collection_path"):
+                        collection = await asyncio.to_thread(replay.read_collection, arguments["collection_path"])
+                    if not isinstance(collection, dict):
+                        raise ValueError("Replay mode needs a collection object or a collection_path to a HAR/JSON file")
+                    steps, variables = replay.load_collection(collection)
+                    
+                    started = time.perf_counter_ns()
+                    rows = await replay.run_replay(
+                        http_pool.get_client(timeout, verify, http2),
+                        steps,
+                        variables,
+                        min(arguments.get("concurrency", 10), config.HTTP_POOL_MAX_CONNECTIONS),
+                        arguments.get("preview_bytes", config.HTTP_PREVIEW_BYTES)
+                    )
+                    timing = {
+                        "wall_ms": round((time.perf_counter_ns() - started) / 1e6, 2),
+                        "critical_path_ms": replay.critical_path_ms(steps, rows),
+                        "sum_ms": round(sum(row["latency_ms"] or 0 for row in rows), 2),
+                    }
+                    
+                    if is_structured(arguments):
+                        return structured_result(rows, **timing)
+                    
+                    return {
+                        "content": [{
+                            "type": "text",
+                            "text": render_replay_report(rows, timing)
+                        }]
+                    }
+                
+                if arguments.get("mode") == "fanout":
+                    specs = [
+                        fanout.normalize_spec(spec, {"method": method, "headers": headers})
+                        for spec in arguments.get("requests", [])
+                    ]
+                    concurrency = min(arguments.get("concurrency", 10), config.HTTP_POOL_MAX_CONNECTIONS)
+                    per_host_limit = arguments.get("per_host_limit", 6)
+                    done = 0
+                    
+                    async def on_result(index, row):
+                        nonlocal done
+                        done += 1
+                        outcome = row["status"] if row["error"] is None else row["error"]
+                        await report_progress(
+                            done, len(specs),
+                            f"{outcome} {row['method']} {row['url']} {row['latency_ms'] or 0:.0f}ms"
+                        )
+                    
+                    started = time.perf_counter_ns()
+                    rows = await fanout.run_fanout(
+                        http_pool.get_client(timeout, verify, http2),
+                        specs,
+                        concurrency,
+                        per_host_limit,
+                        on_result=on_result
+                    )
+                    total_ms = round((time.perf_counter_ns() - started) / 1e6, 2)
+                    hosts = len({fanout.host_of(row["url"]) for row in rows} - {None})
+                    
+                    if is_structured(arguments):
+                        return structured_result(
+                            rows,
+                            total_ms=total_ms, hosts=hosts, concurrency=concurrency, per_host_limit=per_host_limit
+                        )
+                    
+                    return {
+                        "content": [{
+                            "type": "text",
+                            "text": render_fanout_table(rows, total_ms, hosts)
+                        }]
+                    }
                 
                 # Validate URL
                 if not url.startswith(('http://', 'https://')):
+                    if is_structured(arguments):
+                        return structured_error("Invalid URL: must start with http:// or https://", url=url)
+                    
                     return {
                         "content": [{
                             "type": "text",
@@ -80,32 +222,137 @@ You provided: `{url}`"""
                 if body and 'content-type' not in [k.lower() for k in request_headers.keys()]:
                     request_headers['Content-Type'] = 'application/json'
                 
-                # Make request
-                start_time = time.time()
+                if arguments.get("mode", "single") == "load":
+                    concurrency = min(arguments.get("concurrency", 10), config.HTTP_POOL_MAX_CONNECTIONS)
+                    target_rps = arguments.get("rps")
+                    report = await load_runner.run_load(
+                        http_pool.get_client(timeout, verify, http2),
+                        method,
+                        url,
+                        request_headers,
+                        body.encode() if body else None,
+                        concurrency,
+                        total_requests=arguments.get("total_requests"),
+                        duration=arguments.get("duration_seconds"),
+                        rps=target_rps
+                    )
+                    summary = report.summary()
+                    
+                    if is_structured(arguments):
+                        return structured_result(
+                            summary,
+                            method=method, url=url, concurrency=concurrency, target_rps=target_rps
+                        )
+                    
+                    return {
+                        "content": [{
+                            "type": "text",
+                            "text": render_load_report(method, url, summary, concurrency, target_rps)
+                        }]
+                    }
+                
+                read_options = {
+                    "keep_bytes": arguments.get("preview_bytes", config.HTTP_PREVIEW_BYTES),
+                    "max_bytes": arguments.get("max_bytes"),
+                    "hash_algorithm": arguments.get("body_hash")
+                }
+                
+                # Opt-in response cache: fresh entries are served without touching the network
+                cache = None
+                if arguments.get("cache") and method in ("GET", "HEAD"):
+                    cache = await asyncio.to_thread(http_cache.get_cache)
+                cached = cache.lookup(url, request_headers) if cache else None
+                cache_status = None
+                if cached is not None and cached.is_fresh(cache.clock(), request_headers):
+                    cache_status = "hit"
+                elif cached is not None:
+                    request_headers = {**request_headers, **cached.validators}
                 
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    response = await client.request(
-                        method=method,
-                        url=url,
+                timer = PhaseTimer()
+                if cache_status == "hit":
+                    response = cached.to_response(method)
+                    body_read = await read_body(response, **read_options)
+                else:
+                    # Make request on the shared keep-alive client, streaming the body
+                    client = http_pool.get_client(timeout, verify, http2)
+                    async with client.stream(
+                        method,
+                        url,
                         headers=request_headers,
-                        content=body if body else None
-                    )
+                        content=body if body else None,
+                        extensions={"trace": timer.trace}
+                    ) as response:
+                        body_read = await read_body(response, **read_options)
+                    
+                    if cache is not None and response.status_code == 304 and cached is not None:
+                        cache_status = "revalidated"
+                        cached = await asyncio.to_thread(cache.freshen, cached, response)
+                        response = cached.to_response(method)
+                        body_read = await read_body(response, **read_options)
+                    elif cache is not None:
+                        cache_status = "miss"
+                        if method == "GET" and body_read.complete:
+                            await asyncio.to_thread(
+                                cache.store, url, request_headers, response, bytes(body_read.prefix)
+                            )
+                    elif method not in ("GET", "HEAD") and response.status_code < 400:
+                        # Unsafe methods make any cached copy of the URL stale
+                        stale = http_cache.existing_cache()
+                        if stale is not None:
+                            await asyncio.to_thread(stale.invalidate, url)
                 
-                end_time = time.time()
-                response_time = int((end_time - start_time) * 1000)
+                if cache_status:
+                    cache.record(cache_status)
+                timer.finish()
+                response_time = round(timer.total_ns / 1e6, 2)
+                timing = timer.phases_ms()
+                
+                response_body = body_read.text(response.encoding)
+                content_type = response.headers.get('content-type', '').lower()
+                
+                # Keep bodies too long for the reply readable as a resource
+                body_resource = None
+                if len(response_body) > 2000:
+                    body_resource = spill.store.put(
+                        response_body,
+                        label=f"{method} {url}",
+                        mime_type=content_type.split(';')[0] or "text/plain",
+                        owner=spill.session.get()
+                    ).uri
+                
+                body_digest = None
+                if body_read.digest:
+                    body_digest = {"algorithm": arguments["body_hash"], "hex": body_read.digest}
+                
+                if is_structured(arguments):
+                    return structured_result(
+                        {
+                            "status": response.status_code,
+                            "headers": {
+                                key: value for key, value in response.headers.items()
+                                if key.lower() != 'set-cookie'
+                            },
+                            "body": response_body[:2000],
+                            "truncated": len(response_body) > 2000 or not body_read.complete,
+                            "body_resource": body_resource,
+                            "body_complete": body_read.complete,
+                            "aborted": body_read.aborted,
+                            "body_hash": body_digest,
+                            "size_bytes": body_read.total_bytes
+                        },
+                        method=method, url=url, response_time_ms=response_time,
+                        connection_reused=timer.reused, http_version=response.http_version,
+                        timing_ms=timing, cache=cache_status
+                    )
                 
                 # Parse response
                 status_emoji = "✅" if 200 <= response.status_code < 300 else "⚠️" if 300 <= response.status_code < 400 else "❌"
                 
-                response_body = response.text
-                content_type = response.headers.get('content-type', '').lower()
-                
                 # Format body for display
                 formatted_body = response_body
-                if 'application/json' in content_type:
+                if 'application/json' in content_type and body_read.complete:
                     try:
-                        json_data = json.loads(response_body)
-                        formatted_body = json.dumps(json_data, indent=2)
+                        _, formatted_body = json_backend.reformat(response_body, 2, ensure_ascii=True)
                         language = "json"
                     except:
                         language = "text"
@@ -118,7 +365,19 @@ You provided: `{url}`"""
                 
                 # Build response text
                 response_text = f"{status_emoji} **{method} {url}** ({response.status_code})\n"
-                response_text += f"⏱️ {response_time}ms\n\n"
+                connection_label = "🔁 Reused connection" if timer.reused else "🆕 New connection"
+                if cache_status == "hit":
+                    connection_label = f"💾 Cache hit (age {cached.age(cache.clock()):.0f}s)"
+                elif cache_status == "revalidated":
+                    connection_label = f"🔄 Cache revalidated (304) | {connection_label}"
+                elif cache_status == "miss":
+                    connection_label = f"⬇️ Cache miss | {connection_label}"
+                response_text += f"⏱️ {response_time}ms | {connection_label} ({response.http_version})\n"
+                if timing:
+                    response_text += "**Timing:** " + " | ".join(
+                        f"{phase} {timing[phase]:.2f}ms" for phase in PHASES if phase in timing
+                    ) + "\n"
+                response_text += "\n"
                 
                 # Headers section
                 response_text += "**Response Headers:**\n"
@@ -129,15 +388,23 @@ You provided: `{url}`"""
                 response_text += f"\n**Response Body:**\n"
                 
                 # Truncate very large responses
-                if len(formatted_body) > 2000:
+                if len(formatted_body) > 2000 or not body_read.complete:
                     preview = formatted_body[:2000]
                     response_text += f"```{language}\n{preview}\n... [truncated]\n```"
                 else:
                     response_text += f"```{language}\n{formatted_body}\n```"
                 
                 # Size info
-                size_kb = len(response_body) / 1024
+                size_kb = body_read.total_bytes / 1024
                 response_text += f"\n**Size:** {size_kb:.2f} KB"
+                if body_read.aborted:
+                    response_text += f" (⛔ stopped at max_bytes={arguments['max_bytes']:,})"
+                if body_digest:
+                    label = "Hash of bytes read" if body_read.aborted else "Body hash"
+                    response_text += f"\n**{label} ({body_digest['algorithm'].upper()}):** `{body_digest['hex']}`"
+                if body_resource:
+                    label = "Full body" if body_read.complete else f"First {len(body_read.prefix) / 1024:.0f} KB"
+                    response_text += f"\n**{label}:** `{body_resource}` (read with `resources/read`)"
                 
                 return {
                     "content": [{
@@ -147,6 +414,9 @@ You provided: `{url}`"""
                 }
             
             except httpx.TimeoutException:
+                if is_structured(arguments):
+                    return structured_error(f"Request timed out after {arguments.get('timeout', 10)} seconds")
+                
                 return {
                     "content": [{
                         "type": "text",
@@ -154,6 +424,9 @@ You provided: `{url}`"""
                     }]
                 }
             except httpx.ConnectError:
+                if is_structured(arguments):
+                    return structured_error("Connection failed")
+                
                 return {
                     "content": [{
                         "type": "text",
@@ -161,6 +434,9 @@ You provided: `{url}`"""
                     }]
                 }
             except Exception as e:
+                if is_structured(arguments):
+                    return structured_error(str(e))
+                
                 return {
                     "content": [{
                         "type": "text",
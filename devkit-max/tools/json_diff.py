@@ -0,0 +1,115 @@
+"""
+JSON Diff Tool
+Compares two JSON documents and lists the changes as JSON Patch operations
+"""
+
+import json
+from collections import Counter
+from mcp.server import Server
+
+from tools.manifest import get_schema
+from utils import json_backend
+from utils.executor import run_tool_work
+from utils.json_diff import diff
+from utils.output import is_structured, structured_error, structured_result
+
+
+class DocumentError(ValueError):
+    """One of the two documents failed to parse (picklable without the document text)"""
+
+    def __init__(self, document: str, message: str, line: int, column: int):
+        super().__init__(document, message, line, column)
+        self.document = document
+        self.message = message
+        self.line = line
+        self.column = column
+
+
+def parse_document(label: str, text: str):
+    try:
+        return json_backend.loads(text)
+    except json.JSONDecodeError as e:
+        raise DocumentError(label, e.msg, e.lineno, e.colno)
+
+
+def diff_json(old_json: str, new_json: str, array_key: str = None):
+    """Parse both documents and diff them; returns the JSON Patch operations"""
+    old = parse_document("old", old_json)
+    if new_json == old_json:
+        return []
+    
+    return diff(old, parse_document("new", new_json), array_key)
+
+
+def register_tool(server: Server):
+    """Register JSON diff tool with the server"""
+    
+    @server.list_tools()
+    async def handle_list_tools():
+        return [get_schema("json_diff")]
+    
+    @server.call_tool()
+    async def handle_call_tool(name: str, arguments: dict):
+        if name == "json_diff":
+            try:
+                old_json = arguments["old"]
+                new_json = arguments["new"]
+                array_key = arguments.get("array_key") or None
+                
+                # Parse and diff, in a worker process for large documents
+                ops = await run_tool_work(
+                    "json_diff", len(old_json) + len(new_json),
+                    diff_json, old_json, new_json, array_key
+                )
+                
+                counts = Counter(op["op"] for op in ops)
+                
+                if is_structured(arguments):
+                    return structured_result(ops, changes=len(ops), **counts)
+                
+                if not ops:
+                    return {
+                        "content": [{
+                            "type": "text",
+                            "text": "✅ Documents are identical"
+                        }]
+                    }
+                
+                summary = ", ".join(f"{count} {op}" for op, count in sorted(counts.items()))
+                return {
+                    "content": [{
+                        "type": "text",
+                        "text": f"""🔀 {len(ops)} changes ({summary})
+
+```json
+{json.dumps(ops, indent=2, ensure_ascii=False)}
+```"""
+                    }]
+                }
+            
+            except DocumentError as e:
+                if is_structured(arguments):
+                    return structured_error(
+                        e.message, document=e.document, line=e.line, column=e.column
+                    )
+                
+                return {
+                    "content": [{
+                        "type": "text",
+                        "text": f"""❌ Invalid JSON in `{e.document}`
+
+**Error:** {e.message}
+**Location:** Line {e.line}, Column {e.column}"""
+                    }]
+                }
+            
+            except Exception as e:
+                if is_structured(arguments):
+                    return structured_error(str(e))
+                
+                return {
+                    "content": [{
+                        "type": "text",
+                        "text": f"❌ Error: {str(e)}"
+                    }]
+                }
@@ -3,80 +3,270 @@ JSON Formatter/Validator Tool
 Cleans, validates, and prettifies JSON data
 """
 
+import asyncio
 import json
+import os
 from mcp.server import Server
 
+from tools.manifest import get_schema
+from utils import config, json_backend
+from utils.executor import run_tool_work
+from utils.json_profile import profile
+from utils.json_query import compile_query, run_query
+from utils.json_schema import compile_schema, load_schema
+from utils.json_stream import NotStreamable, reindent
+from utils.local_files import input_path, read_text, with_buffer, with_text
+from utils.ndjson import format_ndjson, format_ndjson_parallel
+from utils.output import is_structured, structured_error, structured_raw, structured_result
+
+
+def dump_matches(matches: list, indent: int, sort_keys: bool, compact: bool) -> str:
+    return json.dumps(
+        matches,
+        indent=indent if indent > 0 and not compact else None,
+        separators=(",", ":") if compact else None,
+        sort_keys=sort_keys,
+        ensure_ascii=False
+    )
+
+
+def describe(data) -> str:
+    if isinstance(data, dict):
+        return f"{len(data)} keys"
+    if isinstance(data, list):
+        return f"{len(data)} items"
+    return "scalar value"
+
+
+def format_json(json_string: str, indent: int, sort_keys: bool, compact: bool = False, query: str = None):
+    """Parse and re-serialize JSON (re-indented as a stream when large and unsorted); returns (formatted, item count summary)"""
+    if query:
+        # Large documents are scanned as text and only the matches are decoded
+        matches = run_query(json_string, query, stream=len(json_string) >= config.JSON_STREAM_MIN_BYTES)
+        return dump_matches(matches, indent, sort_keys, compact), f"{len(matches)} matches"
+    
+    if not sort_keys and len(json_string) >= config.JSON_STREAM_MIN_BYTES:
+        try:
+            return reindent(json_string, indent, compact)
+        except NotStreamable:
+            pass
+    
+    data, formatted = json_backend.reformat(json_string, indent, sort_keys, compact)
+    return formatted, describe(data)
+
+
+def validate_json(json_string: str, schema, indent: int, sort_keys: bool, compact: bool = False, query: str = None):
+    """
+    Parse once, check the document against a JSON Schema, then format it (or
+    its query matches); returns (formatted, summary, violations, violation count)
+    """
+    validator = compile_schema(schema)
+    if query:
+        data = json_backend.loads(json_string)
+        matches = compile_query(query).evaluate(data)
+        formatted, summary = dump_matches(matches, indent, sort_keys, compact), f"{len(matches)} matches"
+    else:
+        data, formatted = json_backend.reformat(json_string, indent, sort_keys, compact)
+        summary = describe(data)
+    violations, violation_count = validator.violations(data)
+    return formatted, summary, violations, violation_count
+
+
+def text_work(json_string: str, path: str, func, *args) -> tuple:
+    """run_tool_work arguments for func(document text, *args), reading a file inside the worker"""
+    if path:
+        return (with_text, path, func, *args)
+    return (func, json_string, *args)
+
+
+# Paths listed in the markdown profile; structured output has all of them
+PROFILE_ROWS = 50
+
+
+def profile_text(report: dict) -> str:
+    """Markdown summary of a utils.json_profile report"""
+    text = f"📊 Profile: {report['bytes']} bytes, {report['values']} values, max depth {report['max_depth']}"
+    if "sample" in report:
+        text += f"\n**Sampled:** 1 in {report['sample']['every']} array elements ({report['sample']['skipped']} skipped)"
+    
+    text += "\n\n**Types:** " + ", ".join(f"{kind} {count}" for kind, count in report["types"].items())
+    strings = report["strings"]
+    if strings["count"]:
+        text += f"\n**Strings:** {strings['count']}, mean length {strings['mean_length']} (" + ", ".join(
+            f"{label}: {count}" for label, count in strings["histogram"].items() if count
+        ) + ")"
+    
+    text += "\n\n| Path | Count | Types | Details |\n|------|-------|-------|---------|"
+    for path, stats in list(report["paths"].items())[:PROFILE_ROWS]:
+        details = []
+        if "keys" in stats:
+            keys = sorted(stats["keys"].items(), key=lambda item: -item[1])
+            more = " ..." if len(keys) > 8 else ""
+            details.append("keys " + ", ".join(f"{key} ×{count}" for key, count in keys[:8]) + more)
+        for name in ("array_length", "string_length"):
+            if name in stats:
+                low, high = stats[name]
+                details.append(f"{name.split('_')[0]} length {low}" + (f"–{high}" if high != low else ""))
+        types = ", ".join(f"{kind} {count}" for kind, count in stats["types"].items())
+        text += f"\n| `{path}` | {stats['count']} | {types} | {'; '.join(details)} |"
+    if len(report["paths"]) > PROFILE_ROWS:
+        text += f"\n\n... and {len(report['paths']) - PROFILE_ROWS} more paths"
+    if "untracked_values" in report:
+        text += f"\n\n{report['untracked_values']} values sit under paths beyond the first 1000 and only count toward the totals"
+    
+    if report["largest"]:
+        text += "\n\n**Largest subtrees:**\n" + "\n".join(
+            f"- `{entry['path']}`: {entry['bytes']} bytes" for entry in report["largest"]
+        )
+    return text
+
+
+async def ndjson_reply(json_string: str, indent: int, sort_keys: bool, compact: bool, parallel: bool, structured: bool):
+    """Format JSON Lines input record by record and build the tool reply"""
+    # Structured replies splice the records into one JSON array
+    separator = "," if structured else "\n"
+    compact = compact or structured
+    if parallel:
+        report = await format_ndjson_parallel(json_string, indent, sort_keys, compact, separator)
+    else:
+        report = await run_tool_work(
+            "json_formatter", len(json_string),
+            format_ndjson, json_string, indent, sort_keys, compact, separator
+        )
+    
+    if structured:
+        return structured_raw(
+            f"[{report.formatted(separator)}]",
+            valid=report.invalid == 0, records=report.records, invalid=report.invalid, errors=report.errors
+        )
+    
+    if report.invalid == 0:
+        text = f"✅ {report.records} valid records (JSON Lines)"
+    else:
+        icon = "⚠️" if report.records else "❌"
+        text = f"{icon} {report.records} valid records, {report.invalid} invalid lines (JSON Lines)"
+    
+    if report.records:
+        text += f"\n\n```json\n{report.formatted(separator)}\n```"
+    
+    if report.errors:
+        text += "\n\n**Invalid lines:**\n" + "\n".join(
+            f"- Line {e['line']}, Column {e['column']}: {e['error']}" for e in report.errors
+        )
+        if report.invalid > len(report.errors):
+            text += f"\n- ... and {report.invalid - len(report.errors)} more"
+    
+    return {"content": [{"type": "text", "text": text}]}
+
 
 def register_tool(server: Server):
     """Register JSON formatter tool with the server"""
     
     @server.list_tools()
     async def handle_list_tools():
-        return [{
-            "name": "json_formatter",
-            "description": "Format and validate JSON with pretty printing, optional key sorting",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "json_string": {
-                        "type": "string",
-                        "description": "Raw JSON string to format"
-                    },
-                    "indent": {
-                        "type": "integer",
-                        "description": "Indentation spaces",
-                        "default": 2,
-                        "minimum": 0
-                    },
-                    "sort_keys": {
-                        "type": "boolean",
-                        "description": "Sort dictionary keys alphabetically",
-                        "default": False
-                    }
-                },
-                "required": ["json_string"]
-            }
-        }]
+        return [get_schema("json_formatter")]
     
     @server.call_tool()
     async def handle_call_tool(name: str, arguments: dict):
         if name == "json_formatter":
             try:
-                json_string = arguments["json_string"]
+                path = input_path(arguments, "json_string")
+                json_string = arguments.get("json_string")
+                size = os.path.getsize(path) if path else len(json_string)
                 indent = arguments.get("indent", 2)
                 sort_keys = arguments.get("sort_keys", False)
+                compact = arguments.get("compact", False)
+                
+                query = arguments.get("query")
+                schema = arguments.get("schema")
+                schema_path = arguments.get("schema_path")
+                validating = schema is not None or bool(schema_path)
+                
+                structured = is_structured(arguments)
                 
-                # Parse JSON
-                data = json.loads(json_string)
+                mode = arguments.get("mode", "document")
+                if mode == "profile":
+                    if query or validating:
+                        raise ValueError("query and schema are not supported in profile mode")
+                    # Files are profiled straight from their mapping
+                    top, sample = arguments.get("top", 10), arguments.get("sample", 1)
+                    if path:
+                        report = await run_tool_work("json_formatter", size, with_buffer, path, profile, top, sample)
+                    else:
+                        report = await run_tool_work("json_formatter", size, profile, json_string, top, sample)
+                    if structured:
+                        return structured_result(report)
+                    return {"content": [{"type": "text", "text": profile_text(report)}]}
                 
-                # Format with options
-                formatted = json.dumps(
-                    data,
-                    indent=indent if indent > 0 else None,
-                    sort_keys=sort_keys,
-                    ensure_ascii=False
-                )
+                if mode == "ndjson":
+                    if query:
+                        raise ValueError("query is not supported in ndjson mode")
+                    if validating:
+                        raise ValueError("schema is not supported in ndjson mode")
+                    if path:
+                        json_string = await asyncio.to_thread(read_text, path)
+                    return await ndjson_reply(
+                        json_string, indent, sort_keys, compact, arguments.get("parallel", False), structured
+                    )
                 
-                # Count elements for summary
-                if isinstance(data, dict):
-                    item_count = f"{len(data)} keys"
-                elif isinstance(data, list):
-                    item_count = f"{len(data)} items"
+                # Parse and format, in a worker process for large documents
+                if validating:
+                    schema = await asyncio.to_thread(load_schema, schema, schema_path)
+                    formatted, item_count, violations, violation_count = await run_tool_work(
+                        "json_formatter", size, *text_work(
+                            json_string, path, validate_json, schema,
+                            indent, sort_keys, compact or structured, query
+                        )
+                    )
                 else:
-                    item_count = "scalar value"
+                    formatted, item_count = await run_tool_work(
+                        "json_formatter", size,
+                        *text_work(json_string, path, format_json, indent, sort_keys, compact or structured, query)
+                    )
                 
-                return {
-                    "content": [{
-                        "type": "text",
-                        "text": f"""✅ Valid JSON ({item_count})
-
-```json
-{formatted}
-```"""
-                    }]
-                }
+                if structured:
+                    # The document itself, compact, spliced in without re-escaping
+                    meta = {"summary": item_count}
+                    if query:
+                        meta["query"] = query
+                    if validating:
+                        meta.update(schema_valid=violation_count == 0, violations=violation_count, errors=violations)
+                    return structured_raw(formatted, valid=True, **meta)
+                
+                text = f"🔎 {item_count} for `{query}`" if query else f"✅ Valid JSON ({item_count})"
+                if validating:
+                    text += "\n**Schema:** " + (
+                        f"❌ {violation_count} violations" if violation_count else "✅ valid"
+                    )
+                
+                text += f"\n\n```json\n{formatted}\n```"
+                
+                if validating and violations:
+                    text += "\n\n**Schema violations:**\n" + "\n".join(
+                        f"- `{v['path'] or '(root)'}`: {v['message']}" for v in violations
+                    )
+                    if violation_count > len(violations):
+                        text += f"\n- ... and {violation_count - len(violations)} more"
+                
+                return {"content": [{"type": "text", "text": text}]}
             
             except json.JSONDecodeError as e:
+                if is_structured(arguments):
+                    return structured_error(
+                        e.msg, valid=False, line=e.lineno, column=e.colno, position=e.pos
+                    )
+                
+                if arguments.get("path"):
+                    return {
+                        "content": [{
+                            "type": "text",
+                            "text": f"""❌ Invalid JSON
+
+**Error:** {e.msg}
+**Location:** `{arguments['path']}` line {e.lineno}, column {e.colno}"""
+                        }]
+                    }
+                
                 return {
                     "content": [{
                         "type": "text",
@@ -93,6 +283,9 @@ def register_tool(server: Server):
                 }
             
             except Exception as e:
+                if is_structured(arguments):
+                    return structured_error(str(e))
+                
                 return {
                     "content": [{
                         "type": "text",
@@ -8,31 +8,16 @@ import base64
 from datetime import datetime, timezone
 from mcp.server import Server
 
+from tools.manifest import get_schema
+from utils.output import is_structured, structured_error, structured_result
+
 
 def register_tool(server: Server):
     """Register JWT decoder tool with the server"""
     
     @server.list_tools()
     async def handle_list_tools():
-        return [{
-            "name": "jwt_decoder",
-            "description": "Decode and inspect JWT tokens without verifying signature",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "token": {
-                        "type": "string",
-                        "description": "JWT token to decode"
-                    },
-                    "verify_signature": {
-                        "type": "boolean",
-                        "description": "Check token format (not cryptographic verification)",
-                        "default": False
-                    }
-                },
-                "required": ["token"]
-            }
-        }]
+        return [get_schema("jwt_decoder")]
     
     @server.call_tool()
     async def handle_call_tool(name: str, arguments: dict):
@@ -43,6 +28,11 @@ def register_tool(server: Server):
                 # Split token into parts
                 parts = token.split(".")
                 if len(parts) != 3:
+                    if is_structured(arguments):
+                        return structured_error(
+                            f"Invalid JWT format: expected 3 parts separated by dots, got {len(parts)}"
+                        )
+                    
                     return {
                         "content": [{
                             "type": "text",
@@ -72,6 +62,16 @@ Expected 3 parts separated by dots, got {len(parts)}
                 payload = decode_part(parts[1])
                 signature = parts[2][:20] + "..." if len(parts[2]) > 20 else parts[2]
                 
+                if is_structured(arguments):
+                    meta = {"signature_verified": False}
+                    if "exp" in payload and isinstance(payload["exp"], (int, float)):
+                        exp_time = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+                        meta["expires_at"] = exp_time.isoformat()
+                        meta["expired"] = exp_time < datetime.now(timezone.utc)
+                    return structured_result(
+                        {"header": header, "payload": payload, "signature": parts[2]}, **meta
+                    )
+                
                 # Build response
                 response = "## 🔐 JWT Decoded\n\n"
                 
@@ -116,6 +116,9 @@ Expected 3 parts separated by dots, got {len(parts)}
                 }
             
             except Exception as e:
+                if is_structured(arguments):
+                    return structured_error(f"Error decoding JWT: {str(e)}")
+                
                 return {
                     "content": [{
                         "type": "text",
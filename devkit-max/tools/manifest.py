@@ -0,0 +1,624 @@
+"""
+Tool Manifest
+Static names, schemas and module paths for every tool, so list_tools can be
+answered without importing any tool module
+
+Tools with CPU-heavy work also declare an execution policy: inputs of at least
+`threshold` characters run in the shared "thread" pool (work that releases the
+GIL, like hashlib) or "process" pool (pure-Python parsing and formatting).
+
+Tools whose output is a pure function of their arguments opt into the result
+cache with a "cache" entry; "ttl" (seconds) bounds entries whose text depends
+on the clock, such as JWT expiry and relative timestamps. Calls that pass an
+argument listed in "bypass" skip the cache, because these arguments name local
+files whose contents can change between calls; so do calls whose arguments
+exceed config.CACHE_MAX_ARGUMENT_CHARS.
+"""
+
+
+TOOLS = {
+    "base64_tool": {
+        "module": "tools.base64_tool",
+        "cache": {"ttl": None, "bypass": ["path"]},
+        "execution": {"pool": "process", "threshold": 1024 * 1024},
+        "schema": {
+            "name": "base64_tool",
+            "description": "Encode or decode Base64 strings with optional URL-safe formatting",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "operation": {
+                        "type": "string",
+                        "description": "Operation to perform",
+                        "enum": ["encode", "decode"],
+                        "default": "encode"
+                    },
+                    "input": {
+                        "type": "string",
+                        "description": "Text to encode or Base64 to decode"
+                    },
+                    "path": {
+                        "type": "string",
+                        "description": "Local file to encode or decode instead of input; must be under one of the DEVKIT_ALLOWED_ROOTS directories"
+                    },
+                    "url_safe": {
+                        "type": "boolean",
+                        "description": "Use URL-safe Base64 encoding (replaces + with -, / with _)",
+                        "default": False
+                    },
+                    "output": {
+                        "type": "string",
+                        "description": "Response format: markdown for people, or structured for a compact {result, meta} JSON object",
+                        "enum": ["markdown", "structured"],
+                        "default": "markdown"
+                    }
+                },
+                "required": ["operation"],
+                "anyOf": [{"required": ["input"]}, {"required": ["path"]}]
+            }
+        }
+    },
+    "color_converter": {
+        "module": "tools.color_converter",
+        "cache": {"ttl": None},
+        "schema": {
+            "name": "color_converter",
+            "description": "Convert between color formats (HEX, RGB, HSL, CSS names) with visual preview",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "color": {
+                        "type": "string",
+                        "description": "Color input in any format"
+                    },
+                    "from_format": {
+                        "type": "string",
+                        "description": "Input format",
+                        "enum": ["auto", "hex", "rgb", "hsl", "name"],
+                        "default": "auto"
+                    },
+                    "to_format": {
+                        "type": "string",
+                        "description": "Output format",
+                        "enum": ["all", "hex", "rgb", "hsl", "name"],
+                        "default": "all"
+                    },
+                    "output": {
+                        "type": "string",
+                        "description": "Response format: markdown for people, or structured for a compact {result, meta} JSON object",
+                        "enum": ["markdown", "structured"],
+                        "default": "markdown"
+                    }
+                },
+                "required": ["color"]
+            }
+        }
+    },
+    "hash_generator": {
+        "module": "tools.hash_generator",
+        "cache": {"ttl": None, "bypass": ["path"]},
+        "execution": {"pool": "thread", "threshold": 256 * 1024},
+        "schema": {
+            "name": "hash_generator",
+            "description": "Generate cryptographic hashes (MD5, SHA1, SHA256, SHA512)",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "input": {
+                        "type": "string",
+                        "description": "Text to hash"
+                    },
+                    "path": {
+                        "type": "string",
+                        "description": "Local file to hash instead of input, read in chunks; must be under one of the DEVKIT_ALLOWED_ROOTS directories"
+                    },
+                    "algorithm": {
+                        "type": "string",
+                        "description": "Hash algorithm to use",
+                        "enum": ["md5", "sha1", "sha256", "sha512"],
+                        "default": "sha256"
+                    },
+                    "encoding": {
+                        "type": "string",
+                        "description": "Output encoding format",
+                        "enum": ["hex", "base64"],
+                        "default": "hex"
+                    },
+                    "output": {
+                        "type": "string",
+                        "description": "Response format: markdown for people, or structured for a compact {result, meta} JSON object",
+                        "enum": ["markdown", "structured"],
+                        "default": "markdown"
+                    }
+                },
+                "anyOf": [{"required": ["input"]}, {"required": ["path"]}]
+            }
+        }
+    },
+    "http_tester": {
+        "module": "tools.http_tester",
+        "schema": {
+            "name": "http_tester",
+            "description": "Make HTTP requests (GET, POST, PUT, DELETE, PATCH) and inspect responses",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "method": {
+                        "type": "string",
+                        "description": "HTTP method",
+                        "enum": ["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD"],
+                        "default": "GET"
+                    },
+                    "url": {
+                        "type": "string",
+                        "description": "Full URL with protocol (http:// or https://); not used in fanout and replay modes"
+                    },
+                    "headers": {
+                        "type": "object",
+                        "description": "Request headers as JSON object",
+                        "default": {}
+                    },
+                    "body": {
+                        "type": "string",
+                        "description": "Request body (for POST, PUT, PATCH)",
+                        "default": ""
+                    },
+                    "timeout": {
+                        "type": "integer",
+                        "description": "Timeout in seconds",
+                        "default": 10,
+                        "minimum": 1,
+                        "maximum": 60
+                    },
+                    "verify": {
+                        "type": "boolean",
+                        "description": "Verify TLS certificates",
+                        "default": True
+                    },
+                    "http2": {
+                        "type": "boolean",
+                        "description": "Negotiate HTTP/2 and multiplex requests over one connection (needs httpx[http2])",
+                        "default": False
+                    },
+                    "preview_bytes": {
+                        "type": "integer",
+                        "description": "Bytes of the response body kept in memory for the preview and body resource; the rest is streamed and counted",
+                        "minimum": 0,
+                        "maximum": 67108864
+                    },
+                    "max_bytes": {
+                        "type": "integer",
+                        "description": "Abort the download once this many body bytes have arrived",
+                        "minimum": 0
+                    },
+                    "body_hash": {
+                        "type": "string",
+                        "description": "Hash the full response body while streaming it",
+                        "enum": ["md5", "sha1", "sha256", "sha512"]
+                    },
+                    "cache": {
+                        "type": "boolean",
+                        "description": "GET/HEAD only: reuse cached responses per Cache-Control, revalidating with ETag/Last-Modified",
+                        "default": False
+                    },
+                    "mode": {
+                        "type": "string",
+                        "description": "single sends one request; load repeats it and reports throughput and latency percentiles; fanout sends every entry of `requests` concurrently; replay runs a HAR file or JSON collection",
+                        "enum": ["single", "load", "fanout", "replay"],
+                        "default": "single"
+                    },
+                    "concurrency": {
+                        "type": "integer",
+                        "description": "Load, fan-out and replay modes: requests in flight at once (capped by the connection pool size)",
+                        "default": 10,
+                        "minimum": 1,
+                        "maximum": 1000
+                    },
+                    "requests": {
+                        "type": "array",
+                        "description": "Fan-out mode: URLs or {url, method, headers, body} objects; method and headers default to the top-level ones",
+                        "maxItems": 1000,
+                        "items": {
+                            "anyOf": [
+                                {"type": "string"},
+                                {
+                                    "type": "object",
+                                    "properties": {
+                                        "url": {"type": "string"},
+                                        "method": {
+                                            "type": "string",
+                                            "enum": ["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD"]
+                                        },
+                                        "headers": {"type": "object"},
+                                        "body": {"type": "string"}
+                                    },
+                                    "required": ["url"]
+                                }
+                            ]
+                        }
+                    },
+                    "collection": {
+                        "type": "object",
+                        "description": "Replay mode: a HAR log or {variables, requests: [{name, method, url, headers, body, extract: {var: \"$.path\" | \"header:Name\"}, assert: {status, max_ms, body_contains, json: {\"$.path\": value}}, depends_on}]}; use {{var}} in url, headers and body"
+                    },
+                    "collection_path": {
+                        "type": "string",
+                        "description": "Replay mode: path of a local HAR or JSON collection file; must be under one of the DEVKIT_ALLOWED_ROOTS directories"
+                    },
+                    "per_host_limit": {
+                        "type": "integer",
+                        "description": "Fan-out mode: requests in flight per host",
+                        "default": 6,
+                        "minimum": 1,
+                        "maximum": 100
+                    },
+                    "total_requests": {
+                        "type": "integer",
+                        "description": "Load mode: number of requests to send (default 100 when no duration is given)",
+                        "minimum": 1,
+                        "maximum": 1000000
+                    },
+                    "duration_seconds": {
+                        "type": "number",
+                        "description": "Load mode: stop after this many seconds",
+                        "exclusiveMinimum": 0,
+                        "maximum": 600
+                    },
+                    "rps": {
+                        "type": "number",
+                        "description": "Load mode: target requests per second (default: as fast as possible)",
+                        "exclusiveMinimum": 0
+                    },
+                    "output": {
+                        "type": "string",
+                        "description": "Response format: markdown for people, or structured for a compact {result, meta} JSON object",
+                        "enum": ["markdown", "structured"],
+                        "default": "markdown"
+                    }
+                },
+                "required": ["method"]
+            }
+        }
+    },
+    "json_diff": {
+        "module": "tools.json_diff",
+        "cache": {"ttl": None},
+        "execution": {"pool": "process", "threshold": 64 * 1024},
+        "schema": {
+            "name": "json_diff",
+            "description": "Compare two JSON documents and list the changes as JSON Patch (RFC 6902) operations",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "old": {
+                        "type": "string",
+                        "description": "Original JSON document"
+                    },
+                    "new": {
+                        "type": "string",
+                        "description": "Changed JSON document"
+                    },
+                    "array_key": {
+                        "type": "string",
+                        "description": "Match elements of arrays of objects by this field (e.g. id) instead of by position; reordering shows up as move operations"
+                    },
+                    "output": {
+                        "type": "string",
+                        "description": "Response format: markdown for people, or structured for a compact {result, meta} JSON object",
+                        "enum": ["markdown", "structured"],
+                        "default": "markdown"
+                    }
+                },
+                "required": ["old", "new"]
+            }
+        }
+    },
+    "json_formatter": {
+        "module": "tools.json_formatter",
+        "cache": {"ttl": None, "bypass": ["path", "schema_path"]},
+        "execution": {"pool": "process", "threshold": 64 * 1024},
+        "schema": {
+            "name": "json_formatter",
+            "description": "Format and validate JSON with pretty printing, optional key sorting",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "json_string": {
+                        "type": "string",
+                        "description": "Raw JSON string to format"
+                    },
+                    "path": {
+                        "type": "string",
+                        "description": "Local JSON file to read instead of json_string (memory-mapped in profile mode); must be under one of the DEVKIT_ALLOWED_ROOTS directories"
+                    },
+                    "indent": {
+                        "type": "integer",
+                        "description": "Indentation spaces",
+                        "default": 2,
+                        "minimum": 0
+                    },
+                    "sort_keys": {
+                        "type": "boolean",
+                        "description": "Sort dictionary keys alphabetically",
+                        "default": False
+                    },
+                    "mode": {
+                        "type": "string",
+                        "description": "document: the input is one JSON value; ndjson: one JSON record per line (JSON Lines), bad lines are reported by number and skipped; profile: statistics about the document (depth, types, keys and lengths per path, largest subtrees) from one streaming pass",
+                        "enum": ["document", "ndjson", "profile"],
+                        "default": "document"
+                    },
+                    "compact": {
+                        "type": "boolean",
+                        "description": "Minimal separators with no newlines; in ndjson mode each record stays on one line",
+                        "default": False
+                    },
+                    "parallel": {
+                        "type": "boolean",
+                        "description": "ndjson mode: parse chunks of lines in worker processes",
+                        "default": False
+                    },
+                    "sample": {
+                        "type": "integer",
+                        "description": "profile mode: only profile every Nth element of the top-level arrays; array lengths stay exact",
+                        "default": 1,
+                        "minimum": 1
+                    },
+                    "top": {
+                        "type": "integer",
+                        "description": "profile mode: how many of the largest subtrees to list",
+                        "default": 10,
+                        "minimum": 0
+                    },
+                    "query": {
+                        "type": "string",
+                        "description": "Only format the matching nodes, returned as a JSON array. JSONPath ($.items[*].id, $..price, $.items[?(@.price > 10)], $.items[0:5]) or a jq-like subset (.items[].id, .items[] | select(.price > 10))"
+                    },
+                    "schema": {
+                        "type": ["object", "boolean", "string"],
+                        "description": "JSON Schema to validate the document against, as an object or as JSON text; every violation is reported with its JSON Pointer path"
+                    },
+                    "schema_path": {
+                        "type": "string",
+                        "description": "Local file holding the JSON Schema, instead of passing it inline; must be under one of the DEVKIT_ALLOWED_ROOTS directories"
+                    },
+                    "output": {
+                        "type": "string",
+                        "description": "Response format: markdown for people, or structured for a compact {result, meta} JSON object",
+                        "enum": ["markdown", "structured"],
+                        "default": "markdown"
+                    }
+                },
+                "anyOf": [{"required": ["json_string"]}, {"required": ["path"]}]
+            }
+        }
+    },
+    "jwt_decoder": {
+        "module": "tools.jwt_decoder",
+        "cache": {"ttl": 60},
+        "schema": {
+            "name": "jwt_decoder",
+            "description": "Decode and inspect JWT tokens without verifying signature",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "token": {
+                        "type": "string",
+                        "description": "JWT token to decode"
+                    },
+                    "verify_signature": {
+                        "type": "boolean",
+                        "description": "Check token format (not cryptographic verification)",
+                        "default": False
+                    },
+                    "output": {
+                        "type": "string",
+                        "description": "Response format: markdown for people, or structured for a compact {result, meta} JSON object",
+                        "enum": ["markdown", "structured"],
+                        "default": "markdown"
+                    }
+                },
+                "required": ["token"]
+            }
+        }
+    },
+    "sql_formatter": {
+        "module": "tools.sql_formatter",
+        "cache": {"ttl": None},
+        "execution": {"pool": "process", "threshold": 16 * 1024},
+        "schema": {
+            "name": "sql_formatter",
+            "description": "Format SQL queries with proper indentation and keyword casing",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "sql": {
+                        "type": "string",
+                        "description": "SQL query to format"
+                    },
+                    "dialect": {
+                        "type": "string",
+                        "description": "SQL dialect",
+                        "enum": ["mysql", "postgresql", "sqlite", "tsql", "generic"],
+                        "default": "generic"
+                    },
+                    "indent_width": {
+                        "type": "integer",
+                        "description": "Spaces per indent level",
+                        "default": 2,
+                        "minimum": 1,
+                        "maximum": 8
+                    },
+                    "keyword_case": {
+                        "type": "string",
+                        "description": "Case for SQL keywords",
+                        "enum": ["upper", "lower", "preserve"],
+                        "default": "upper"
+                    },
+                    "output": {
+                        "type": "string",
+                        "description": "Response format: markdown for people, or structured for a compact {result, meta} JSON object",
+                        "enum": ["markdown", "structured"],
+                        "default": "markdown"
+                    }
+                },
+                "required": ["sql"]
+            }
+        }
+    },
+    "timestamp_tool": {
+        "module": "tools.timestamp_tool",
+        "cache": {"ttl": 1},
+        "schema": {
+            "name": "timestamp_tool",
+            "description": "Convert between timestamp formats (Unix, ISO 8601, human-readable)",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "input": {
+                        "type": "string",
+                        "description": "Time input (Unix timestamp, ISO date, or human date)"
+                    },
+                    "input_format": {
+                        "type": "string",
+                        "description": "Input format hint",
+                        "enum": ["auto", "unix", "iso", "human"],
+                        "default": "auto"
+                    },
+                    "output_format": {
+                        "type": "string",
+                        "description": "Output format preference",
+                        "enum": ["all", "unix", "iso", "human"],
+                        "default": "all"
+                    },
+                    "timezone": {
+                        "type": "string",
+                        "description": "Target timezone (e.g., UTC, America/New_York)",
+                        "default": "UTC"
+                    },
+                    "output": {
+                        "type": "string",
+                        "description": "Response format: markdown for people, or structured for a compact {result, meta} JSON object",
+                        "enum": ["markdown", "structured"],
+                        "default": "markdown"
+                    }
+                },
+                "required": ["input"]
+            }
+        }
+    },
+    "uuid_generator": {
+        "module": "tools.uuid_generator",
+        "schema": {
+            "name": "uuid_generator",
+            "description": "Generate UUIDs (version 1 or 4) with formatting options",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "count": {
+                        "type": "integer",
+                        "description": "Number of UUIDs to generate",
+                        "default": 1,
+                        "minimum": 1,
+                        "maximum": 50
+                    },
+                    "version": {
+                        "type": "string",
+                        "description": "UUID version (v1 or v4)",
+                        "enum": ["v1", "v4"],
+                        "default": "v4"
+                    },
+                    "hyphens": {
+                        "type": "boolean",
+                        "description": "Include hyphens in output",
+                        "default": True
+                    },
+                    "output": {
+                        "type": "string",
+                        "description": "Response format: markdown for people, or structured for a compact {result, meta} JSON object",
+                        "enum": ["markdown", "structured"],
+                        "default": "markdown"
+                    }
+                }
+            }
+        }
+    },
+    "devkit_batch": {
+        "module": "tools.devkit_batch",
+        "schema": {
+            "name": "devkit_batch",
+            "description": "Run many DevKit tool calls in one request, concurrently, with per-call results in order",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "calls": {
+                        "type": "array",
+                        "description": "Tool calls to run",
+                        "minItems": 1,
+                        "maxItems": 500,
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "tool": {
+                                    "type": "string",
+                                    "description": "Name of the DevKit tool to call"
+                                },
+                                "arguments": {
+                                    "type": "object",
+                                    "description": "Arguments for the tool",
+                                    "default": {}
+                                }
+                            },
+                            "required": ["tool"]
+                        }
+                    },
+                    "parallelism": {
+                        "type": "integer",
+                        "description": "Maximum calls running at once (server default if omitted)",
+                        "minimum": 1,
+                        "maximum": 64
+                    },
+                    "output": {
+                        "type": "string",
+                        "description": "Response format: markdown for people, or structured for a compact {result, meta} JSON object",
+                        "enum": ["markdown", "structured"],
+                        "default": "markdown"
+                    }
+                },
+                "required": ["calls"]
+            }
+        }
+    },
+    "devkit_stats": {
+        "module": "tools.devkit_stats",
+        "schema": {
+            "name": "devkit_stats",
+            "description": "Show per-tool call counts, latency percentiles, payload sizes and cache counters for this server",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "tool": {
+                        "type": "string",
+                        "description": "Only show this tool"
+                    },
+                    "reset": {
+                        "type": "boolean",
+                        "description": "Clear all recorded metrics after reporting",
+                        "default": False
+                    },
+                    "output": {
+                        "type": "string",
+                        "description": "Response format: markdown for people, or structured for a compact {result, meta} JSON object",
+                        "enum": ["markdown", "structured"],
+                        "default": "markdown"
+                    }
+                }
+            }
+        }
+    },
+}
+
+
+def get_schema(name: str) -> dict:
+    """Return the MCP tool definition for a tool name"""
+    return TOOLS[name]["schema"]
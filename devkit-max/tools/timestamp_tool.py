@@ -7,43 +7,16 @@ from datetime import datetime, timezone
 from dateutil import parser as date_parser
 from mcp.server import Server
 
+from tools.manifest import get_schema
+from utils.output import is_structured, structured_error, structured_result
+
 
 def register_tool(server: Server):
     """Register timestamp converter tool with the server"""
     
     @server.list_tools()
     async def handle_list_tools():
-        return [{
-            "name": "timestamp_tool",
-            "description": "Convert between timestamp formats (Unix, ISO 8601, human-readable)",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "input": {
-                        "type": "string",
-                        "description": "Time input (Unix timestamp, ISO date, or human date)"
-                    },
-                    "input_format": {
-                        "type": "string",
-                        "description": "Input format hint",
-                        "enum": ["auto", "unix", "iso", "human"],
-                        "default": "auto"
-                    },
-                    "output_format": {
-                        "type": "string",
-                        "description": "Output format preference",
-                        "enum": ["all", "unix", "iso", "human"],
-                        "default": "all"
-                    },
-                    "timezone": {
-                        "type": "string",
-                        "description": "Target timezone (e.g., UTC, America/New_York)",
-                        "default": "UTC"
-                    }
-                },
-                "required": ["input"]
-            }
-        }]
+        return [get_schema("timestamp_tool")]
     
     @server.call_tool()
     async def handle_call_tool(name: str, arguments: dict):
@@ -125,6 +98,17 @@ def register_tool(server: Server):
                         months = int(seconds / 2592000)
                         relative = f"{months} month{'s' if months != 1 else ''} ago"
                 
+                if is_structured(arguments):
+                    conversions = {
+                        "unix": unix_timestamp,
+                        "iso": iso_format,
+                        "human": human_format,
+                        "relative": relative
+                    }
+                    if output_format != "all":
+                        conversions = {output_format: conversions[output_format]}
+                    return structured_result(conversions, input=input_str, input_format=input_format)
+                
                 # Build response
                 if output_format == "all":
                     response = f"""## 🕐 Timestamp Conversion
@@ -153,6 +137,9 @@ def register_tool(server: Server):
                 }
             
             except Exception as e:
+                if is_structured(arguments):
+                    return structured_error(f"Error parsing timestamp: {str(e)}")
+                
                 return {
                     "content": [{
                         "type": "text",
@@ -6,39 +6,16 @@ Generate unique identifiers (UUIDv1 or UUIDv4)
 import uuid
 from mcp.server import Server
 
+from tools.manifest import get_schema
+from utils.output import is_structured, structured_error, structured_result
+
 
 def register_tool(server: Server):
     """Register UUID generator tool with the server"""
     
     @server.list_tools()
     async def handle_list_tools():
-        return [{
-            "name": "uuid_generator",
-            "description": "Generate UUIDs (version 1 or 4) with formatting options",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "count": {
-                        "type": "integer",
-                        "description": "Number of UUIDs to generate",
-                        "default": 1,
-                        "minimum": 1,
-                        "maximum": 50
-                    },
-                    "version": {
-                        "type": "string",
-                        "description": "UUID version (v1 or v4)",
-                        "enum": ["v1", "v4"],
-                        "default": "v4"
-                    },
-                    "hyphens": {
-                        "type": "boolean",
-                        "description": "Include hyphens in output",
-                        "default": True
-                    }
-                }
-            }
-        }]
+        return [get_schema("uuid_generator")]
     
     @server.call_tool()
     async def handle_call_tool(name: str, arguments: dict):
@@ -65,6 +42,9 @@ def register_tool(server: Server):
                     
                     uuids.append(uid)
                 
+                if is_structured(arguments):
+                    return structured_result(uuids, version=version, count=count, hyphens=hyphens)
+                
                 # Format output
                 output_lines = [f"Generated {count} UUID{version}:\n"]
                 for i, uid in enumerate(uuids, 1):
@@ -78,6 +58,9 @@ def register_tool(server: Server):
                 }
             
             except Exception as e:
+                if is_structured(arguments):
+                    return structured_error(str(e))
+                
                 return {
                     "content": [{
                         "type": "text",
@@ -0,0 +1,103 @@
+"""
+Result Cache
+Byte-bounded LRU cache with optional per-entry TTL for deterministic tool results
+"""
+
+import hashlib
+import json
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+
+def cache_key(tool: str, arguments: Dict[str, Any]) -> str:
+    """Canonical hash of a tool call: key order and whitespace do not matter"""
+    canonical = json.dumps(
+        [tool, arguments],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def result_size(result: Dict[str, Any]) -> int:
+    """Approximate memory held by a tool result: its text blocks dominate"""
+    return sum(sys.getsizeof(block.get("text", "")) for block in result.get("content", []))
+
+
+class ResultCache:
+    """
+    LRU cache bounded by the total size of stored results.
+
+    Entries may carry a TTL in seconds for results that depend on the clock;
+    expired entries are dropped when they are next looked up.
+    """
+
+    def __init__(self, max_bytes: int, clock: Callable[[], float] = time.monotonic):
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        # key -> (result, size, expires_at or None), least recently used first
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        result, size, expires_at = entry
+        if expires_at is not None and self.clock() >= expires_at:
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: Dict[str, Any], ttl: Optional[float] = None):
+        size = result_size(result) + sys.getsizeof(key)
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        expires_at = self.clock() + ttl if ttl is not None else None
+        self._entries[key] = (result, size, expires_at)
+        self.current_bytes += size
+
+        while self.current_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _remove(self, key: str):
+        _, size, _ = self._entries.pop(key)
+        self.current_bytes -= size
@@ -0,0 +1,76 @@
+"""
+Server Configuration
+Tunables read from DEVKIT_* environment variables
+"""
+
+import os
+
+
+def env_int(name: str, default: int) -> int:
+    """Read an integer setting, falling back to the default when unset or invalid"""
+    value = os.environ.get(name, "")
+    try:
+        return int(value) if value else default
+    except ValueError:
+        return default
+
+
+CPU_COUNT = os.cpu_count() or 1
+
+# Worker pools for CPU-heavy tool work (see utils/executor.py)
+THREAD_WORKERS = env_int("DEVKIT_THREAD_WORKERS", min(32, CPU_COUNT + 4))
+PROCESS_WORKERS = env_int("DEVKIT_PROCESS_WORKERS", CPU_COUNT)
+
+# Scales every tool's offload threshold; 0 offloads all work, a huge value disables offloading
+OFFLOAD_THRESHOLD_SCALE = env_int("DEVKIT_OFFLOAD_THRESHOLD_PERCENT", 100)
+
+# Default number of calls devkit_batch runs at once
+BATCH_PARALLELISM = env_int("DEVKIT_BATCH_PARALLELISM", 8)
+
+# Memory bound for cached results of deterministic tools (see utils/cache.py)
+CACHE_MAX_BYTES = env_int("DEVKIT_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+
+# Calls with more argument characters than this skip that cache, so the key hash never runs on the event loop
+CACHE_MAX_ARGUMENT_CHARS = env_int("DEVKIT_CACHE_MAX_ARGUMENT_CHARS", 256 * 1024)
+
+# Periodic Prometheus text dump of tool metrics; disabled unless a file is set
+METRICS_FILE = os.environ.get("DEVKIT_METRICS_FILE", "")
+METRICS_INTERVAL = env_int("DEVKIT_METRICS_INTERVAL", 15)
+
+# Results longer than this many characters are returned as a resource URI plus a preview
+INLINE_LIMIT = env_int("DEVKIT_INLINE_LIMIT", 256 * 1024)
+
+# Spill store for those results (see utils/spill.py)
+SPILL_MEMORY_BYTES = env_int("DEVKIT_SPILL_MEMORY_BYTES", 64 * 1024 * 1024)
+SPILL_MAX_BYTES = env_int("DEVKIT_SPILL_MAX_BYTES", 1024 * 1024 * 1024)
+SPILL_MAX_AGE = env_int("DEVKIT_SPILL_MAX_AGE", 900)
+SPILL_DIR = os.environ.get("DEVKIT_SPILL_DIR", "")
+
+# HTTP transport (python server.py --transport http)
+HTTP_HOST = os.environ.get("DEVKIT_HTTP_HOST", "127.0.0.1")
+HTTP_PORT = env_int("DEVKIT_HTTP_PORT", 8765)
+HTTP_MAX_CONCURRENCY = env_int("DEVKIT_HTTP_MAX_CONCURRENCY", 64)
+HTTP_SHUTDOWN_TIMEOUT = env_int("DEVKIT_HTTP_SHUTDOWN_TIMEOUT", 10)
+
+# Keep-alive pool shared by http_tester calls (see utils/http_pool.py)
+HTTP_POOL_MAX_CONNECTIONS = env_int("DEVKIT_HTTP_POOL_MAX_CONNECTIONS", 100)
+HTTP_POOL_MAX_KEEPALIVE = env_int("DEVKIT_HTTP_POOL_MAX_KEEPALIVE", 20)
+HTTP_POOL_KEEPALIVE_EXPIRY = env_int("DEVKIT_HTTP_POOL_KEEPALIVE_EXPIRY", 30)
+
+# Response body bytes http_tester keeps in memory; longer bodies are streamed and counted
+HTTP_PREVIEW_BYTES = env_int("DEVKIT_HTTP_PREVIEW_BYTES", 64 * 1024)
+
+# Opt-in http_tester response cache (see utils/http_cache.py); set a directory to keep it across restarts
+HTTP_CACHE_MAX_BYTES = env_int("DEVKIT_HTTP_CACHE_MAX_BYTES", 32 * 1024 * 1024)
+HTTP_CACHE_DIR = os.environ.get("DEVKIT_HTTP_CACHE_DIR", "")
+
+# json_formatter re-indents documents this large token by token instead of parsing them
+# into objects (see utils/json_stream.py); sort_keys always uses the parsed path
+JSON_STREAM_MIN_BYTES = env_int("DEVKIT_JSON_STREAM_MIN_BYTES", 1024 * 1024)
+
+# JSON parser/serializer for json_formatter and http_tester: "auto" uses orjson when installed, "json" forces the stdlib
+JSON_BACKEND = os.environ.get("DEVKIT_JSON_BACKEND", "auto")
+
+# Directories (os.pathsep-separated) that the `path` argument of json_formatter, hash_generator
+# and base64_tool, schema_path and collection_path may read files from; refused while unset
+ALLOWED_ROOTS = [root for root in os.environ.get("DEVKIT_ALLOWED_ROOTS", "").split(os.pathsep) if root]
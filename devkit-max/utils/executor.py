@@ -0,0 +1,72 @@
+"""
+Tool Work Executor
+Runs CPU-heavy tool work off the asyncio event loop according to each tool's policy
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from tools.manifest import TOOLS
+from utils import config
+
+
+_pools: Dict[str, Executor] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(kind: str) -> Executor:
+    """Return the shared "thread" or "process" pool, creating it on first use"""
+    with _pools_lock:
+        pool = _pools.get(kind)
+        if pool is None:
+            if kind == "thread":
+                pool = ThreadPoolExecutor(
+                    max_workers=config.THREAD_WORKERS,
+                    thread_name_prefix="devkit-worker"
+                )
+            elif kind == "process":
+                pool = ProcessPoolExecutor(max_workers=config.PROCESS_WORKERS)
+            else:
+                raise ValueError(f"Unknown pool kind: {kind}")
+            _pools[kind] = pool
+        return pool
+
+
+def get_policy(tool: str) -> Optional[Dict[str, Any]]:
+    """Execution policy from the manifest: {"pool": "thread"|"process", "threshold": bytes}"""
+    entry = TOOLS.get(tool)
+    return entry.get("execution") if entry else None
+
+
+def should_offload(tool: str, size: int) -> bool:
+    policy = get_policy(tool)
+    if policy is None:
+        return False
+    threshold = policy["threshold"] * config.OFFLOAD_THRESHOLD_SCALE // 100
+    return size >= threshold
+
+
+async def run_tool_work(tool: str, size: int, func: Callable, *args):
+    """
+    Run func(*args) for a tool, inline for small inputs or in a worker pool
+    once the input size reaches the tool's threshold.
+
+    Work sent to the process pool must be a module-level function with
+    picklable arguments and results.
+    """
+    if not should_offload(tool, size):
+        return func(*args)
+    pool = get_pool(get_policy(tool)["pool"])
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pool, functools.partial(func, *args))
+
+
+def shutdown_pools():
+    """Stop all worker pools; called on server exit"""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown(wait=True, cancel_futures=True)
+        _pools.clear()
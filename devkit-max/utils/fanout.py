@@ -0,0 +1,90 @@
+"""
+Fan-out Runner
+Sends a list of requests concurrently under a global and a per-host limit
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from utils.http_body import read_body
+from utils.load_runner import error_category
+
+
+def normalize_spec(spec: Any, defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """A request spec is a URL string or {"url", "method", "headers", "body"}"""
+    if isinstance(spec, str):
+        spec = {"url": spec}
+    headers = dict(defaults.get("headers") or {}, **(spec.get("headers") or {}))
+    body = spec.get("body", "")
+    if body and "content-type" not in (key.lower() for key in headers):
+        headers["Content-Type"] = "application/json"
+    return {
+        "method": (spec.get("method") or defaults.get("method") or "GET").upper(),
+        "url": spec["url"],
+        "headers": headers,
+        "body": body,
+    }
+
+
+def host_of(url: str) -> Optional[str]:
+    """The host[:port] requests to `url` queue on, or None when it is not an http(s) URL httpx accepts"""
+    if not url.startswith(("http://", "https://")):
+        return None
+    try:
+        return httpx.URL(url).netloc.decode()
+    except httpx.InvalidURL:
+        return None
+
+
+async def run_fanout(
+    client: httpx.AsyncClient,
+    specs: List[Dict[str, Any]],
+    concurrency: int,
+    per_host_limit: int,
+    on_result: Optional[Callable[[int, Dict[str, Any]], Awaitable[None]]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Run every spec and return one row per spec, in input order.
+
+    A request first waits for a slot on its host, then for a global slot, so
+    a slow host cannot occupy global slots while its own queue drains.
+    `on_result(index, row)` is awaited as each request finishes.
+    """
+    global_slots = asyncio.Semaphore(max(1, concurrency))
+    host_slots: Dict[str, asyncio.Semaphore] = {}
+    rows: List[Optional[Dict[str, Any]]] = [None] * len(specs)
+
+    async def run_one(index: int, spec: Dict[str, Any]):
+        row = {"method": spec["method"], "url": spec["url"], "status": None,
+               "latency_ms": None, "size_bytes": 0, "error": None}
+        host = host_of(spec["url"])
+        if host is None:
+            row["error"] = "invalid_url"
+
+        if host is not None:
+            host_slot = host_slots.setdefault(host, asyncio.Semaphore(max(1, per_host_limit)))
+            async with host_slot, global_slots:
+                started = time.perf_counter_ns()
+                try:
+                    async with client.stream(
+                        spec["method"],
+                        spec["url"],
+                        headers=spec["headers"],
+                        content=spec["body"] or None
+                    ) as response:
+                        body_read = await read_body(response, 0)
+                    row["status"] = response.status_code
+                    row["size_bytes"] = body_read.total_bytes
+                except Exception as e:
+                    row["error"] = error_category(e)
+                row["latency_ms"] = round((time.perf_counter_ns() - started) / 1e6, 2)
+
+        rows[index] = row
+        if on_result is not None:
+            await on_result(index, row)
+
+    await asyncio.gather(*(run_one(i, spec) for i, spec in enumerate(specs)))
+    return rows
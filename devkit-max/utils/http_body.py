@@ -0,0 +1,71 @@
+"""
+HTTP Body Reader
+Streams a response body, keeping only a bounded prefix in memory
+"""
+
+import codecs
+import hashlib
+from typing import Optional
+
+import httpx
+
+
+class BodyRead:
+    """What was learned from one streamed body"""
+
+    __slots__ = ("prefix", "total_bytes", "complete", "aborted", "digest")
+
+    def __init__(self):
+        self.prefix = bytearray()
+        self.total_bytes = 0
+        # True when the prefix holds the whole body
+        self.complete = True
+        # True when reading stopped at max_bytes before the body ended
+        self.aborted = False
+        self.digest: Optional[str] = None
+
+    def text(self, encoding: Optional[str]) -> str:
+        """Decode the prefix, dropping a multi-byte character cut off at its end"""
+        try:
+            decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        return decoder.decode(bytes(self.prefix), final=self.complete)
+
+
+async def read_body(
+    response: httpx.Response,
+    keep_bytes: int,
+    max_bytes: Optional[int] = None,
+    hash_algorithm: Optional[str] = None
+) -> BodyRead:
+    """
+    Consume a streamed response chunk by chunk.
+
+    The first `keep_bytes` bytes are kept; the rest are only counted (and
+    hashed when `hash_algorithm` is set). Reading stops once `max_bytes` have
+    arrived; the caller's `client.stream()` block then closes the connection
+    instead of draining it.
+    """
+    read = BodyRead()
+    hasher = hashlib.new(hash_algorithm) if hash_algorithm else None
+
+    async for chunk in response.aiter_bytes():
+        if max_bytes is not None and read.total_bytes + len(chunk) > max_bytes:
+            chunk = chunk[:max_bytes - read.total_bytes]
+            read.aborted = True
+        read.total_bytes += len(chunk)
+        if hasher is not None:
+            hasher.update(chunk)
+        room = keep_bytes - len(read.prefix)
+        if room > 0:
+            read.prefix += chunk[:room]
+        if len(chunk) > max(room, 0):
+            read.complete = False
+        if read.aborted:
+            read.complete = False
+            break
+
+    if hasher is not None:
+        read.digest = hasher.hexdigest()
+    return read
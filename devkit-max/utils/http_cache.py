@@ -0,0 +1,384 @@
+"""
+HTTP Response Cache
+GET/HEAD cache for http_tester following Cache-Control, ETag and
+Last-Modified, with a byte-bounded LRU and optional on-disk persistence.
+Every client of the server shares it, so it follows the shared-cache rules:
+private replies are not stored, s-maxage wins over max-age, Set-Cookie is
+dropped and authorized replies need an explicit directive
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from utils import config
+
+# Statuses a cache may store without explicit freshness (RFC 9111 heuristically cacheable)
+CACHEABLE_STATUSES = {200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501}
+
+# The body is stored decoded, so these would no longer describe it
+BODY_HEADERS = {"content-length", "content-encoding", "transfer-encoding"}
+
+# Headers never stored, since entries are served to every client (BODY_HEADERS included)
+UNSTORED_HEADERS = BODY_HEADERS | {"set-cookie"}
+
+# Cap on heuristic freshness derived from Last-Modified
+MAX_HEURISTIC_SECONDS = 24 * 3600
+
+# Response directives that let a shared cache store the reply to an authorized request (RFC 9111 section 3.5)
+AUTHORIZED_STORABLE = {"public", "s-maxage", "must-revalidate"}
+
+
+def parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    """'max-age=60, no-cache' -> {"max-age": "60", "no-cache": None}"""
+    directives = {}
+    for part in value.split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+
+def request_cache_control(request_headers: Dict[str, str]) -> Dict[str, Optional[str]]:
+    """Cache-Control directives of a request, whatever the header's case"""
+    for name, value in request_headers.items():
+        if name.lower() == "cache-control":
+            return parse_cache_control(value)
+    return {}
+
+
+def http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class CachedResponse:
+    """A stored response plus what is needed to judge its freshness"""
+
+    __slots__ = ("url", "status", "headers", "body", "http_version", "vary", "stored_at", "initial_age", "lifetime")
+
+    def __init__(
+        self,
+        url: str,
+        status: int,
+        headers: List[Tuple[str, str]],
+        body: bytes,
+        http_version: str,
+        vary: Dict[str, Optional[str]],
+        stored_at: float
+    ):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.http_version = http_version
+        self.vary = vary
+        self.stored_at = stored_at
+        self.initial_age = 0.0
+        self.lifetime = 0.0
+        self._compute_freshness()
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(k) + len(v) for k, v in self.headers) + len(self.url)
+
+    def header(self, name: str) -> Optional[str]:
+        name = name.lower()
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return None
+
+    @property
+    def cache_control(self) -> Dict[str, Optional[str]]:
+        return parse_cache_control(self.header("cache-control") or "")
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry"""
+        headers = {}
+        if self.header("etag"):
+            headers["If-None-Match"] = self.header("etag")
+        if self.header("last-modified"):
+            headers["If-Modified-Since"] = self.header("last-modified")
+        return headers
+
+    def age(self, now: float) -> float:
+        return self.initial_age + max(0.0, now - self.stored_at)
+
+    def is_fresh(self, now: float, request_headers: Optional[Dict[str, str]] = None) -> bool:
+        """Servable without revalidation; a request's own no-cache forces revalidation"""
+        if "no-cache" in self.cache_control:
+            return False
+        if request_headers and "no-cache" in request_cache_control(request_headers):
+            return False
+        return self.age(now) < self.lifetime
+
+    def _compute_freshness(self):
+        directives = self.cache_control
+        date = http_date(self.header("date")) or self.stored_at
+        try:
+            age_header = float(self.header("age") or 0)
+        except ValueError:
+            age_header = 0.0
+        self.initial_age = max(age_header, self.stored_at - date, 0.0)
+
+        for name in ("s-maxage", "max-age"):
+            if name in directives:
+                try:
+                    self.lifetime = float(directives[name])
+                except (TypeError, ValueError):
+                    self.lifetime = 0.0
+                return
+        expires = self.header("expires")
+        if expires is not None:
+            expires_at = http_date(expires)
+            self.lifetime = max(0.0, expires_at - date) if expires_at else 0.0
+            return
+        last_modified = http_date(self.header("last-modified"))
+        if last_modified is not None and self.status in CACHEABLE_STATUSES:
+            self.lifetime = min(MAX_HEURISTIC_SECONDS, max(0.0, (date - last_modified) * 0.1))
+
+    def matches(self, request_headers: Dict[str, str]) -> bool:
+        """True when the request agrees with the stored one on every Vary header"""
+        lowered = {k.lower(): v for k, v in request_headers.items()}
+        return all(lowered.get(name) == value for name, value in self.vary.items())
+
+    def to_response(self, method: str) -> httpx.Response:
+        """An httpx response replaying this entry (no body for HEAD)"""
+        return httpx.Response(
+            self.status,
+            headers=self.headers,
+            content=b"" if method == "HEAD" else self.body,
+            extensions={"http_version": self.http_version.encode()}
+        )
+
+    def to_json(self) -> Dict[str, object]:
+        return {
+            "url": self.url,
+            "status": self.status,
+            "headers": self.headers,
+            "body": base64.b64encode(self.body).decode(),
+            "http_version": self.http_version,
+            "vary": self.vary,
+            "stored_at": self.stored_at,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, object]) -> "CachedResponse":
+        return cls(
+            data["url"],
+            data["status"],
+            [tuple(pair) for pair in data["headers"]],
+            base64.b64decode(data["body"]),
+            data["http_version"],
+            data["vary"],
+            data["stored_at"]
+        )
+
+
+class HttpCache:
+    """
+    LRU of responses keyed by URL, bounded by total stored bytes.
+
+    Uses wall-clock time so entries persisted to `directory` keep their age
+    across server restarts. Safe to call from worker threads.
+    """
+
+    def __init__(self, max_bytes: int, directory: Optional[str] = None, clock: Callable[[], float] = time.time):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.clock = clock
+        self.current_bytes = 0
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._load()
+
+    def lookup(self, url: str, request_headers: Dict[str, str]) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None or not entry.matches(request_headers):
+                return None
+            self._entries.move_to_end(url)
+            return entry
+
+    def store(
+        self,
+        url: str,
+        request_headers: Dict[str, str],
+        response: httpx.Response,
+        body: bytes
+    ) -> Optional[CachedResponse]:
+        """Store a complete GET response if its headers and the request's allow it; returns the entry"""
+        directives = parse_cache_control(response.headers.get("cache-control", ""))
+        vary_names = [
+            name.strip().lower() for name in response.headers.get("vary", "").split(",") if name.strip()
+        ]
+        if "no-store" in directives or "*" in vary_names or response.status_code not in CACHEABLE_STATUSES:
+            return None
+        # private replies are meant for one client only, and this cache is shared
+        if "private" in directives:
+            return None
+
+        lowered = {k.lower(): v for k, v in request_headers.items()}
+        if "no-store" in parse_cache_control(lowered.get("cache-control", "")):
+            return None
+        # Another client must not get a reply fetched with someone else's credentials
+        if "authorization" in lowered and not AUTHORIZED_STORABLE.intersection(directives):
+            return None
+        entry = CachedResponse(
+            url,
+            response.status_code,
+            [(key, value) for key, value in response.headers.multi_items() if key.lower() not in UNSTORED_HEADERS],
+            body,
+            response.http_version,
+            {name: lowered.get(name) for name in vary_names},
+            self.clock()
+        )
+        if entry.lifetime <= 0 and not entry.validators:
+            return None
+        self._put(entry)
+        return entry
+
+    def freshen(self, entry: CachedResponse, not_modified: httpx.Response) -> CachedResponse:
+        """Apply a 304 response's headers to a stored entry and restart its age"""
+        updated = {key.lower(): value for key, value in not_modified.headers.multi_items()}
+        headers = [(key, updated.pop(key.lower(), value)) for key, value in entry.headers]
+        headers += [(key, value) for key, value in updated.items() if key not in UNSTORED_HEADERS]
+        fresh = CachedResponse(
+            entry.url, entry.status, headers, entry.body, entry.http_version, entry.vary, self.clock()
+        )
+        self._put(fresh)
+        return fresh
+
+    def record(self, outcome: str):
+        """Count a lookup outcome: hit, revalidated or miss"""
+        with self._lock:
+            if outcome == "hit":
+                self.hits += 1
+            elif outcome == "revalidated":
+                self.revalidations += 1
+            else:
+                self.misses += 1
+
+    def invalidate(self, url: str):
+        """Drop an entry after an unsafe request (POST, PUT, ...) to its URL"""
+        with self._lock:
+            entry = self._entries.pop(url, None)
+            if entry is not None:
+                self.current_bytes -= entry.size
+                self._delete_file(url)
+
+    def clear(self):
+        with self._lock:
+            for url in list(self._entries):
+                self._delete_file(url)
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "revalidations": self.revalidations,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _put(self, entry: CachedResponse):
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(entry.url, None)
+            if old is not None:
+                self.current_bytes -= old.size
+            self._entries[entry.url] = entry
+            self.current_bytes += entry.size
+            while self.current_bytes > self.max_bytes:
+                url, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= evicted.size
+                self.evictions += 1
+                self._delete_file(url)
+            self._write_file(entry)
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(url.encode()).hexdigest() + ".json")
+
+    def _write_file(self, entry: CachedResponse):
+        if not self.directory:
+            return
+        path = self._path(entry.url)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry.to_json(), f)
+        os.replace(tmp, path)
+
+    def _delete_file(self, url: str):
+        if not self.directory:
+            return
+        try:
+            os.remove(self._path(url))
+        except OSError:
+            pass
+
+    def _load(self):
+        """Read persisted entries, oldest first, so the LRU order survives a restart"""
+        paths = [os.path.join(self.directory, name) for name in os.listdir(self.directory) if name.endswith(".json")]
+        paths.sort(key=os.path.getmtime)
+        for path in paths:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    entry = CachedResponse.from_json(json.load(f))
+            except (OSError, ValueError, KeyError, TypeError):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                continue
+            if entry.size > self.max_bytes:
+                continue
+            self._entries[entry.url] = entry
+            self.current_bytes += entry.size
+        while self.current_bytes > self.max_bytes:
+            url, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= evicted.size
+            self._delete_file(url)
+
+
+_cache: Optional[HttpCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> HttpCache:
+    """The shared cache, loading persisted entries on first use"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = HttpCache(config.HTTP_CACHE_MAX_BYTES, config.HTTP_CACHE_DIR or None)
+        return _cache
+
+
+def existing_cache() -> Optional[HttpCache]:
+    """The shared cache if something has used it, without creating it"""
+    return _cache
@@ -0,0 +1,46 @@
+"""
+HTTP Client Pool
+Shared keep-alive httpx clients, one per (timeout, verify, http2) setting
+"""
+
+import asyncio
+import weakref
+from typing import Dict, Tuple
+
+import httpx
+
+from utils import config
+
+ClientKey = Tuple[float, bool, bool]
+
+# Clients hold connections bound to the event loop that opened them, so each
+# loop gets its own set; a loop's clients are dropped when the loop is collected
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[ClientKey, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_client(timeout: float = 10, verify: bool = True, http2: bool = False) -> httpx.AsyncClient:
+    """Return the shared client for these settings, creating it on first use"""
+    clients = _clients.setdefault(asyncio.get_running_loop(), {})
+    key = (float(timeout), bool(verify), bool(http2))
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=timeout,
+            verify=verify,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=config.HTTP_POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=config.HTTP_POOL_MAX_KEEPALIVE,
+                keepalive_expiry=config.HTTP_POOL_KEEPALIVE_EXPIRY
+            )
+        )
+        clients[key] = client
+    return client
+
+
+async def close_clients():
+    """Close every client opened on the running loop; called on server exit"""
+    clients = _clients.pop(asyncio.get_running_loop(), {})
+    await asyncio.gather(*(client.aclose() for client in clients.values()), return_exceptions=True)
@@ -0,0 +1,74 @@
+"""
+HTTP Phase Timing
+Splits a request's latency into phases using httpcore trace events
+"""
+
+import time
+from typing import Dict, Optional
+
+# Reported phases, in the order they happen
+PHASES = ["queue", "connect", "tls", "send", "wait", "download"]
+
+
+class PhaseTimer:
+    """
+    Pass `timer.trace` as the request's "trace" extension, then call `finish()`
+    once the body has been read.
+
+    Phases (milliseconds):
+      queue     request start until a connection is ready to use (pool wait, client overhead)
+      connect   DNS lookup plus TCP connect; httpcore does both in one step
+      tls       TLS handshake
+      send      writing request headers and body
+      wait      request sent until response headers arrive (time to first byte)
+      download  response headers until the body has been read
+
+    connect and tls are absent when a pooled connection was reused.
+    """
+
+    __slots__ = ("start_ns", "end_ns", "events")
+
+    def __init__(self):
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+        self.events: Dict[str, int] = {}
+
+    async def trace(self, event_name: str, info):
+        # "http11.send_request_headers.started" and "http2.send_request_headers.started" -> same key
+        if event_name.startswith(("http11.", "http2.")):
+            event_name = event_name.split(".", 1)[1]
+        self.events.setdefault(event_name, time.perf_counter_ns())
+
+    def finish(self):
+        self.end_ns = time.perf_counter_ns()
+
+    @property
+    def reused(self) -> bool:
+        """True when no new connection was opened for this request"""
+        return "connection.connect_tcp.started" not in self.events
+
+    @property
+    def total_ns(self) -> int:
+        return (self.end_ns or time.perf_counter_ns()) - self.start_ns
+
+    def phases_ns(self) -> Dict[str, int]:
+        """Duration of each phase that happened; failed requests yield only the phases reached"""
+        events = self.events
+        end = self.end_ns or time.perf_counter_ns()
+        ready = events.get("connection.connect_tcp.started", events.get("send_request_headers.started"))
+        spans = {
+            "queue": (self.start_ns, ready),
+            "connect": (events.get("connection.connect_tcp.started"), events.get("connection.connect_tcp.complete")),
+            "tls": (events.get("connection.start_tls.started"), events.get("connection.start_tls.complete")),
+            "send": (events.get("send_request_headers.started"), events.get("send_request_body.complete")),
+            "wait": (events.get("send_request_body.complete"), events.get("receive_response_headers.complete")),
+            "download": (events.get("receive_response_headers.complete"), end),
+        }
+        return {
+            phase: finish - begin
+            for phase, (begin, finish) in spans.items()
+            if begin is not None and finish is not None
+        }
+
+    def phases_ms(self) -> Dict[str, float]:
+        return {phase: round(ns / 1e6, 3) for phase, ns in self.phases_ns().items()}
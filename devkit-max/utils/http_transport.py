@@ -0,0 +1,107 @@
+"""
+HTTP Transport
+Serves one MCP server to many clients over streamable HTTP (POST + SSE at /mcp)
+"""
+
+import asyncio
+import contextlib
+import signal
+import sys
+import threading
+
+import uvicorn
+from mcp.server import Server
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+MCP_PATH = "/mcp"
+
+
+class ConcurrencyLimit:
+    """
+    ASGI middleware that admits at most `limit` JSON-RPC POSTs at a time.
+
+    Each POST carries one request and stays open until its response is sent,
+    so this bounds the tool calls in flight across all sessions. Requests over
+    the limit wait for a slot instead of failing. Long-lived GET event streams
+    and session DELETEs are not counted.
+    """
+
+    def __init__(self, app, limit: int):
+        self.app = app
+        self._semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        async with self._semaphore:
+            await self.app(scope, receive, send)
+
+
+class GracefulServer(uvicorn.Server):
+    """
+    uvicorn server that returns normally after a signal-triggered shutdown.
+
+    Stock uvicorn re-raises SIGINT/SIGTERM once it has stopped, which would
+    kill the process before the caller's cleanup (worker pools, spill files,
+    final metrics dump) runs.
+    """
+
+    @contextlib.contextmanager
+    def capture_signals(self):
+        if threading.current_thread() is not threading.main_thread():
+            yield
+            return
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self.handle_exit, sig, None)
+        try:
+            yield
+        finally:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(sig)
+
+
+def build_app(server: Server, max_concurrency: int) -> Starlette:
+    """Starlette app exposing `server` at /mcp with one session per client"""
+    session_manager = StreamableHTTPSessionManager(app=server)
+
+    async def handle_mcp(scope, receive, send):
+        await session_manager.handle_request(scope, receive, send)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
+        async with session_manager.run():
+            yield
+
+    app = Starlette(routes=[Mount(MCP_PATH, app=handle_mcp)], lifespan=lifespan)
+    app.add_middleware(ConcurrencyLimit, limit=max_concurrency)
+    return app
+
+
+async def serve(server: Server, host: str, port: int, max_concurrency: int, shutdown_timeout: int):
+    """
+    Run the HTTP transport until SIGINT/SIGTERM.
+
+    On a signal the server stops accepting connections and waits up to
+    `shutdown_timeout` seconds for in-flight requests before closing sessions;
+    a second SIGINT forces the exit.
+    """
+    app = build_app(server, max_concurrency)
+    settings = uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        log_level="warning",
+        timeout_graceful_shutdown=shutdown_timeout,
+    )
+    print(
+        f"🌐 Serving MCP on http://{host}:{port}{MCP_PATH} "
+        f"(max {max_concurrency} concurrent requests)",
+        file=sys.stderr
+    )
+    await GracefulServer(settings).serve()
+    print("✅ HTTP transport stopped", file=sys.stderr)
@@ -0,0 +1,137 @@
+"""
+JSON Backend
+Parses and re-serializes JSON with orjson when it is installed, the stdlib
+json module otherwise; both give identical output and identical errors
+"""
+
+import json
+import re
+from typing import Any, Optional, Tuple
+
+from utils import config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if config.JSON_BACKEND == "json":
+    orjson = None
+
+# orjson reads integers outside 64 bits as floats; documents with one go to the stdlib
+DIGIT_RUN = re.compile(r"[0-9]{19,}")
+INTEGER_RANGE = range(-2 ** 63, 2 ** 64)
+
+# orjson writes 1e16 / 1e-7 / 0.00001 where float repr writes 1e+16 / 1e-07 / 1e-05.
+# Cheap checks first (these also hit strings); the string-aware rewrite only runs after one matches
+ORJSON_EXPONENT = re.compile(r"e[-+]?[0-9]+(?:[,\]}\n]|\Z)")
+ORJSON_FLOAT = re.compile(
+    r'("[^"\\]*(?:\\.[^"\\]*)*")'
+    r'|(?<![0-9.])-?[0-9]+(?:\.[0-9]+)?e[-+]?[0-9]+'
+    r'|(?<![0-9.])-?0\.0000[0-9]*'
+)
+
+# What ensure_ascii=True escapes beyond orjson: DEL and everything above ASCII
+NOT_PRINTABLE_ASCII = re.compile(r"[^\x00-\x7e]")
+
+
+def name() -> str:
+    return "orjson" if orjson is not None else "json"
+
+
+def _fits_orjson(text: str) -> bool:
+    """False when the text holds an integer orjson would read as a float (or digits in a string that look like one)"""
+    for match in DIGIT_RUN.finditer(text):
+        before = text[match.start() - 1:match.start()]
+        if before == ".":
+            # Fraction digits
+            continue
+        digits = match.group(0)
+        if len(digits) > 20 or int(before + digits if before == "-" else digits) not in INTEGER_RANGE:
+            return False
+    return True
+
+
+def _parse(text: str) -> Tuple[Any, bool]:
+    """(value, parsed by orjson)"""
+    if orjson is not None and _fits_orjson(text):
+        try:
+            return orjson.loads(text), True
+        except orjson.JSONDecodeError:
+            # Invalid, or valid only for the stdlib (NaN, Infinity, lone surrogates, overflowing
+            # floats, very deep nesting): either way json.loads gives the answer and the error
+            pass
+    return json.loads(text), False
+
+
+def loads(text: str) -> Any:
+    """json.loads; invalid input raises the stdlib's JSONDecodeError with its message and position"""
+    return _parse(text)[0]
+
+
+def _float_repr(match: "re.Match") -> str:
+    if match.group(1):
+        return match.group(1)
+    return float.__repr__(float(match.group(0)))
+
+
+def _escape_ascii(match: "re.Match") -> str:
+    code = ord(match.group(0))
+    if code > 0xFFFF:
+        code -= 0x10000
+        return "\\u{0:04x}\\u{1:04x}".format(0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF))
+    return "\\u{0:04x}".format(code)
+
+
+def _orjson_dumps(data: Any, indent: Optional[int], sort_keys: bool, compact: bool, ensure_ascii: bool) -> Optional[str]:
+    """orjson's serialization made identical to json.dumps, or None when it cannot be"""
+    if compact:
+        option = 0
+    elif indent == 2:
+        option = orjson.OPT_INDENT_2
+    else:
+        return None
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    try:
+        text = orjson.dumps(data, option=option).decode()
+    except orjson.JSONEncodeError:
+        # Nesting deeper than orjson allows
+        return None
+    if "0.0000" in text or ORJSON_EXPONENT.search(text):
+        text = ORJSON_FLOAT.sub(_float_repr, text)
+    if ensure_ascii and (not text.isascii() or "\x7f" in text):
+        # These characters only occur inside strings, so the whole text can be substituted
+        text = NOT_PRINTABLE_ASCII.sub(_escape_ascii, text)
+    return text
+
+
+def reformat(
+    text: str,
+    indent: int,
+    sort_keys: bool = False,
+    compact: bool = False,
+    ensure_ascii: bool = False
+) -> Tuple[Any, str]:
+    """
+    Parse and re-serialize a document; returns (value, formatted).
+
+    Same result as json.dumps(json.loads(text), indent=indent or None,
+    separators=(",", ":") if compact, sort_keys=sort_keys,
+    ensure_ascii=ensure_ascii). orjson only writes compact and 2-space
+    layouts; other indents use the stdlib serializer after an orjson parse.
+    """
+    data, fast = _parse(text)
+    indent = indent if indent > 0 and not compact else None
+    if fast:
+        formatted = _orjson_dumps(data, indent, sort_keys, compact, ensure_ascii)
+        if formatted is not None:
+            return data, formatted
+    formatted = json.dumps(
+        data,
+        indent=indent,
+        separators=(",", ":") if compact else None,
+        sort_keys=sort_keys,
+        ensure_ascii=ensure_ascii
+    )
+    return data, formatted
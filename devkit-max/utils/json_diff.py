@@ -0,0 +1,223 @@
+"""
+JSON Diff
+Structural diff of two parsed JSON documents as a JSON Patch (RFC 6902)
+operation list, skipping identical subtrees by comparing bottom-up digests
+"""
+
+import bisect
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+CONTAINERS = (dict, list)
+
+_MISSING = object()
+
+
+def pointer(path: str, token: Any) -> str:
+    """path extended by one JSON Pointer reference token"""
+    return f"{path}/{str(token).replace('~', '~0').replace('/', '~1')}"
+
+
+def _same_scalar(a: Any, b: Any) -> bool:
+    # 1, 1.0 and true are different JSON; NaN equals itself here so it is not reported forever
+    return type(a) is type(b) and (a == b or a != a and b != b)
+
+
+class Differ:
+    """
+    Collects patch operations for one pair of documents.
+
+    Every container of both documents gets a digest of its contents (object
+    keys in sorted order, array elements in order), computed once bottom-up
+    and kept by id(); two subtrees are equal when their digests are, so an
+    unchanged branch costs one integer comparison however large it is.
+    Digests are the interpreter's salted 64-bit string hash, so two
+    different subtrees compared here collide with odds of about 2**-64.
+    """
+
+    def __init__(self, array_key: Optional[str] = None):
+        self.array_key = array_key
+        self.ops: List[Dict[str, Any]] = []
+        self.digests: Dict[int, int] = {}
+
+    def digest(self, node: Any) -> int:
+        digest = self.digests.get(id(node))
+        if digest is not None:
+            return digest
+        # Child digests are wrapped in a tuple so none can pass for a number in the repr
+        if isinstance(node, dict):
+            parts = [
+                (key, (self.digest(value),) if isinstance(value, CONTAINERS) else value)
+                for key, value in node.items()
+            ]
+            parts.sort()
+            digest = hash("{" + repr(parts))
+        else:
+            digest = hash("[" + repr([(self.digest(value),) if isinstance(value, CONTAINERS) else value for value in node]))
+        self.digests[id(node)] = digest
+        return digest
+
+    def identity(self, node: Any) -> Tuple[type, Any]:
+        """Hashable stand-in for a value: equal for equal subtrees"""
+        return type(node), self.digest(node) if isinstance(node, CONTAINERS) else node
+
+    def same(self, a: Any, b: Any) -> bool:
+        if isinstance(a, CONTAINERS):
+            return type(a) is type(b) and self.digest(a) == self.digest(b)
+        return _same_scalar(a, b)
+
+    def compare(self, a: Any, b: Any, path: str = ""):
+        if isinstance(a, dict) and isinstance(b, dict):
+            if self.digest(a) != self.digest(b):
+                self.compare_objects(a, b, path)
+        elif isinstance(a, list) and isinstance(b, list):
+            if self.digest(a) != self.digest(b):
+                self.compare_arrays(a, b, path)
+        elif isinstance(a, CONTAINERS) or isinstance(b, CONTAINERS) or not _same_scalar(a, b):
+            self.ops.append({"op": "replace", "path": path, "value": b})
+
+    def compare_objects(self, a: dict, b: dict, path: str):
+        for key in a:
+            if key not in b:
+                self.ops.append({"op": "remove", "path": pointer(path, key)})
+        for key, value in b.items():
+            old = a.get(key, _MISSING)
+            if old is _MISSING:
+                self.ops.append({"op": "add", "path": pointer(path, key), "value": value})
+            else:
+                self.compare(old, value, pointer(path, key))
+
+    def compare_arrays(self, a: list, b: list, path: str):
+        if self.array_key is not None:
+            old_keys = self.element_keys(a)
+            new_keys = self.element_keys(b) if old_keys is not None else None
+            if new_keys is not None:
+                self.compare_keyed(a, b, old_keys, new_keys, path)
+                return
+        self.compare_positional(a, b, path)
+
+    def compare_positional(self, a: list, b: list, path: str):
+        """
+        Pair elements by index, after trimming the unchanged head and tail and
+        anchoring on elements that occur exactly once on both sides (in
+        order), so an insertion and a deletion far apart do not turn every
+        element between them into a replace.
+        """
+        start = 0
+        limit = min(len(a), len(b))
+        while start < limit and self.same(a[start], b[start]):
+            start += 1
+        end_a, end_b = len(a), len(b)
+        while end_a > start and end_b > start and self.same(a[end_a - 1], b[end_b - 1]):
+            end_a -= 1
+            end_b -= 1
+
+        anchors: List[Tuple[int, int]] = []
+        if end_a - start > 1 and end_b - start > 1:
+            old_ids = [self.identity(item) for item in a[start:end_a]]
+            new_ids = [self.identity(item) for item in b[start:end_b]]
+            old_counts = Counter(old_ids)
+            new_counts = Counter(new_ids)
+            old_at = {identity: index for index, identity in enumerate(old_ids, start) if old_counts[identity] == 1}
+            candidates = [
+                (old_at[identity], index) for index, identity in enumerate(new_ids, start)
+                if new_counts[identity] == 1 and identity in old_at
+            ]
+            keep = _longest_increasing([old for old, _ in candidates])
+            anchors = [(old, new) for old, new in candidates if old in keep]
+
+        old_from = new_from = start
+        for old_to, new_to in anchors + [(end_a, end_b)]:
+            self.compare_run(a, b, old_from, old_to, new_from, new_to, path)
+            old_from, new_from = old_to + 1, new_to + 1
+
+    def compare_run(self, a: list, b: list, old_from: int, old_to: int, new_from: int, new_to: int, path: str):
+        """
+        Turn a[old_from:old_to] into b[new_from:new_to]; everything before
+        it already matches b, so the run starts at index new_from
+        """
+        paired = min(old_to - old_from, new_to - new_from)
+        for offset in range(paired):
+            self.compare(a[old_from + offset], b[new_from + offset], pointer(path, new_from + offset))
+        # Highest index first, so each path is still valid when it is applied
+        for offset in range(old_to - old_from - 1, paired - 1, -1):
+            self.ops.append({"op": "remove", "path": pointer(path, new_from + offset)})
+        for index in range(new_from + paired, new_to):
+            self.ops.append({"op": "add", "path": pointer(path, index), "value": b[index]})
+
+    def element_keys(self, items: list) -> Optional[List[Tuple[type, Any]]]:
+        """The array_key value of every element, or None unless all are objects with a distinct scalar key"""
+        keys = []
+        for item in items:
+            if not isinstance(item, dict):
+                return None
+            key = item.get(self.array_key, _MISSING)
+            if key is _MISSING or isinstance(key, CONTAINERS):
+                return None
+            keys.append((type(key), key))
+        return keys if len(set(keys)) == len(keys) else None
+
+    def compare_keyed(self, a: list, b: list, old_keys: list, new_keys: list, path: str):
+        """
+        Match elements by array_key: unmatched old elements are removed,
+        unmatched new ones added, and matched ones diffed where they end up.
+        Reordering is expressed as moves of the elements outside the longest
+        run already in order.
+        """
+        old_index = {key: index for index, key in enumerate(old_keys)}
+        new_index = {key: index for index, key in enumerate(new_keys)}
+        for index in range(len(a) - 1, -1, -1):
+            if old_keys[index] not in new_index:
+                self.ops.append({"op": "remove", "path": pointer(path, index)})
+
+        # The array after the removals, as old indexes
+        current = [index for index, key in enumerate(old_keys) if key in new_index]
+        stays = _longest_increasing(
+            [old_index[key] for key in new_keys if key in old_index]
+        )
+        for position, key in enumerate(new_keys):
+            old = old_index.get(key)
+            if old is None:
+                self.ops.append({"op": "add", "path": pointer(path, position), "value": b[position]})
+                current.insert(position, -1)
+                continue
+            # Elements that are not yet in place and have to move go to the end for now
+            while current[position] != old and current[position] not in stays:
+                self.ops.append({"op": "move", "from": pointer(path, position), "path": pointer(path, "-")})
+                current.append(current.pop(position))
+            if current[position] != old:
+                found = current.index(old, position)
+                self.ops.append({"op": "move", "from": pointer(path, found), "path": pointer(path, position)})
+                current.insert(position, current.pop(found))
+            self.compare(a[old], b[position], pointer(path, position))
+
+
+def _longest_increasing(values: List[int]) -> set:
+    """Members of one longest strictly increasing subsequence"""
+    tails: List[int] = []
+    tail_at: List[int] = []
+    previous = [-1] * len(values)
+    for position, value in enumerate(values):
+        slot = bisect.bisect_left(tails, value)
+        if slot:
+            previous[position] = tail_at[slot - 1]
+        if slot == len(tails):
+            tails.append(value)
+            tail_at.append(position)
+        else:
+            tails[slot] = value
+            tail_at[slot] = position
+    members = set()
+    position = tail_at[-1] if tail_at else -1
+    while position != -1:
+        members.add(values[position])
+        position = previous[position]
+    return members
+
+
+def diff(old: Any, new: Any, array_key: Optional[str] = None) -> List[Dict[str, Any]]:
+    """JSON Patch operations that turn `old` into `new`; arrays of objects are matched on `array_key` when given"""
+    differ = Differ(array_key)
+    differ.compare(old, new)
+    return differ.ops
+
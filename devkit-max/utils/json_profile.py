@@ -0,0 +1,379 @@
+"""
+JSON Profiler
+Single-pass statistics for a JSON document (depth, types, keys and lengths
+per path, largest subtrees), read token by token from a str or any bytes-like
+buffer such as an mmap, without building the parsed tree
+"""
+
+import codecs
+import heapq
+import json
+import re
+from json.decoder import scanstring
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from utils.json_stream import (
+    COLON, COMMA_OR_CLOSE, END, EXPECTING, EXPONENT, FRACTION, INTEGER, KEY, KEY_OR_CLOSE,
+    LITERAL, PUNCTUATION, STRING, VALUE, VALUE_OR_CLOSE,
+)
+
+# utils.json_stream.TOKEN over UTF-8 bytes; multi-byte characters are plain string bytes here
+TOKEN = re.compile(
+    rb'[ \t\n\r]*(?:'
+    rb'("[^"\\\x00-\x1f]*(?:\\.[^"\\\x00-\x1f]*)*")'
+    rb'|(-?(?:0|[1-9][0-9]*))(\.[0-9]+)?([eE][-+]?[0-9]+)?'
+    rb'|([\[\]{},:])'
+    rb'|(true|false|null|NaN|Infinity|-Infinity))'
+)
+WHITESPACE = re.compile(rb'[ \t\n\r]*')
+
+# Everything up to the next bracket or comma outside a string, for stepping over unsampled elements
+FLAT = re.compile(rb'(?:[^"\[\]{},]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+
+IDENTIFIER = re.compile(r'[A-Za-z_][A-Za-z0-9_]*\Z')
+
+# Distinct paths tracked; values under further paths still count toward the totals
+MAX_PATHS = 1000
+
+# String length histogram buckets: (upper bound exclusive, label)
+STRING_BUCKETS = [(1, "0"), (8, "1-7"), (64, "8-63"), (512, "64-511"), (4096, "512-4095"), (None, "4096+")]
+
+# Bytes decoded at a time when turning a byte offset into a line and column
+ERROR_CHUNK = 1024 * 1024
+
+LITERAL_TYPES = {b"true": "boolean", b"false": "boolean", b"null": "null"}
+
+Buffer = Union[str, bytes, bytearray, memoryview, Any]
+
+
+class PathStats:
+    """Everything seen at one path, with array indexes collapsed to [*]"""
+
+    __slots__ = ("count", "types", "keys", "array_length", "string_length", "children")
+
+    def __init__(self):
+        self.count = 0
+        self.types: Dict[str, int] = {}
+        self.keys: Dict[str, int] = {}
+        self.array_length: Optional[List[int]] = None
+        self.string_length: Optional[List[int]] = None
+        self.children: Dict[Any, str] = {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"count": self.count, "types": self.types}
+        if self.keys:
+            result["keys"] = self.keys
+        if self.array_length:
+            result["array_length"] = self.array_length
+        if self.string_length:
+            result["string_length"] = self.string_length
+        return result
+
+
+def _widen(bounds: Optional[List[int]], value: int) -> List[int]:
+    if bounds is None:
+        return [value, value]
+    if value < bounds[0]:
+        bounds[0] = value
+    elif value > bounds[1]:
+        bounds[1] = value
+    return bounds
+
+
+def _segment(key: str) -> str:
+    return f".{key}" if IDENTIFIER.match(key) else "['" + key.replace("\\", "\\\\").replace("'", "\\'") + "']"
+
+
+def decode_error(message: str, buffer: Buffer, position: int) -> json.JSONDecodeError:
+    """JSONDecodeError for a byte offset, with line, column and position counted in characters"""
+    decoder = codecs.getincrementaldecoder("utf-8")("replace")
+    line = 1
+    chars = 0
+    line_start = 0
+    for start in range(0, position, ERROR_CHUNK):
+        piece = decoder.decode(bytes(buffer[start:min(start + ERROR_CHUNK, position)]))
+        newlines = piece.count("\n")
+        if newlines:
+            line += newlines
+            line_start = chars + piece.rindex("\n") + 1
+        chars += len(piece)
+    column = chars - line_start + 1
+    error = json.JSONDecodeError(message, "", 0)
+    error.pos, error.lineno, error.colno = chars, line, column
+    error.args = (f"{message}: line {line} column {column} (char {chars})",)
+    return error
+
+
+class Profiler:
+    """
+    Collects statistics for one document; call run(), then to_dict().
+
+    Only the stack of open containers, the per-path table (at most
+    MAX_PATHS entries) and the `top` largest subtrees are kept, so memory
+    does not grow with the document. With sample=N only every Nth element
+    of the outermost arrays is profiled: the others are stepped over by
+    bracket counting, without being validated, but still counted in array
+    lengths and considered for the largest subtrees.
+    """
+
+    def __init__(self, buffer: Buffer, top: int = 10, sample: int = 1):
+        self.buffer = buffer.encode("utf-8", "surrogatepass") if isinstance(buffer, str) else buffer
+        self.top = top
+        self.sample = max(1, sample)
+        self.paths: Dict[str, PathStats] = {}
+        self.untracked = 0
+        self.values = 0
+        self.skipped = 0
+        self.max_depth = 0
+        self.types: Dict[str, int] = {}
+        self.strings = [0] * len(STRING_BUCKETS)
+        self.string_total = 0
+        self.largest: List[Tuple[int, int, str]] = []
+        self._serial = 0
+
+    def stats(self, path: str) -> Optional[PathStats]:
+        stats = self.paths.get(path)
+        if stats is None:
+            if len(self.paths) >= MAX_PATHS:
+                return None
+            stats = self.paths[path] = PathStats()
+        return stats
+
+    def child_path(self, parent: str, token: Any) -> str:
+        """parent extended by a key (str) or by [*] (None); child paths are built once per parent"""
+        stats = self.paths.get(parent)
+        children = stats.children if stats is not None else {}
+        path = children.get(token)
+        if path is None:
+            path = parent + ("[*]" if token is None else _segment(token))
+            if stats is not None and len(children) < MAX_PATHS:
+                children[token] = path
+        return path
+
+    def record(self, path: str, kind: str) -> Optional[PathStats]:
+        self.values += 1
+        self.types[kind] = self.types.get(kind, 0) + 1
+        stats = self.stats(path)
+        if stats is None:
+            self.untracked += 1
+            return None
+        stats.count += 1
+        stats.types[kind] = stats.types.get(kind, 0) + 1
+        return stats
+
+    def record_string(self, path: str, length: int):
+        stats = self.record(path, "string")
+        if stats is not None:
+            stats.string_length = _widen(stats.string_length, length)
+        self.string_total += length
+        for index, (bound, _) in enumerate(STRING_BUCKETS):
+            if bound is None or length < bound:
+                self.strings[index] += 1
+                break
+
+    def consider(self, size: int, tokens: List[Any]):
+        """Offer a closed subtree to the `top` largest; its path is only built if it makes the cut"""
+        if self.top <= 0 or len(self.largest) >= self.top and size <= self.largest[0][0]:
+            return
+        path = "$" + "".join(f"[{token}]" if isinstance(token, int) else _segment(token) for token in tokens)
+        self._serial += 1
+        entry = (size, -self._serial, path)
+        if len(self.largest) < self.top:
+            heapq.heappush(self.largest, entry)
+        else:
+            heapq.heapreplace(self.largest, entry)
+
+    def skip(self, position: int) -> Tuple[int, int]:
+        """(end, nesting depth) of the array element at position, without reading it"""
+        buffer = self.buffer
+        depth = 0
+        deepest = 0
+        while True:
+            position = FLAT.match(buffer, position).end()
+            char = buffer[position:position + 1]
+            if char == b"[" or char == b"{":
+                depth += 1
+                if depth > deepest:
+                    deepest = depth
+            elif char == b"]" or char == b"}":
+                if depth == 0:
+                    return position, deepest
+                depth -= 1
+            elif char == b",":
+                if depth == 0:
+                    return position, deepest
+            else:
+                raise decode_error("Expecting ',' delimiter", buffer, position)
+            position += 1
+
+    def error(self, state: int, position: int):
+        buffer = self.buffer
+        if buffer[position:position + 1] == b'"' and state in (VALUE, VALUE_OR_CLOSE, KEY, KEY_OR_CLOSE):
+            # The exact string error (unterminated, bad escape, control character)
+            window = bytes(buffer[position:position + ERROR_CHUNK]).decode("utf-8", "replace")
+            try:
+                scanstring(window, 1)
+            except json.JSONDecodeError as e:
+                raise decode_error(e.msg, buffer, position + len(window[:e.pos].encode("utf-8", "surrogatepass")))
+            raise decode_error("Unterminated string starting at", buffer, position)
+        raise decode_error(EXPECTING[state], buffer, position)
+
+    def unescape(self, token: bytes, start: int) -> str:
+        """The decoded text of a string token containing escapes, which may still be invalid"""
+        text = token.decode("utf-8", "surrogatepass")
+        try:
+            return scanstring(text, 1)[0]
+        except json.JSONDecodeError as e:
+            raise decode_error(e.msg, self.buffer, start + len(text[:e.pos].encode("utf-8", "surrogatepass")))
+
+    def run(self) -> "Profiler":
+        buffer = self.buffer
+        match = TOKEN.match
+        size = len(buffer)
+        # One frame per open container: [is object, path, start offset, members, samples]
+        stack: List[list] = []
+        # tokens[i]: key or index of the member being read in stack[i]
+        tokens: List[Any] = []
+        sampling = False
+        path = "$"
+        state = VALUE
+        position = 0
+
+        while True:
+            if state == VALUE and stack and not stack[-1][0] and stack[-1][4] and stack[-1][3] % self.sample:
+                # An unsampled array element
+                start = WHITESPACE.match(buffer, position).end()
+                position, deepest = self.skip(start)
+                self.skipped += 1
+                self.max_depth = max(self.max_depth, len(stack) + deepest)
+                if buffer[start:start + 1] in (b"[", b"{"):
+                    self.consider(position - start, tokens)
+                state = COMMA_OR_CLOSE
+                continue
+
+            m = match(buffer, position)
+            if m is None:
+                position = WHITESPACE.match(buffer, position).end()
+                if state == END and position == size:
+                    break
+                self.error(state, position)
+            kind = m.lastindex
+            position = m.end()
+
+            if kind == PUNCTUATION:
+                char = buffer[position - 1:position]
+                if char == b",":
+                    if state != COMMA_OR_CLOSE:
+                        self.error(state, position - 1)
+                    frame = stack[-1]
+                    frame[3] += 1
+                    if frame[0]:
+                        state = KEY
+                    else:
+                        tokens[-1] = frame[3]
+                        path = self.child_path(frame[1], None)
+                        state = VALUE
+                    continue
+                if char == b":":
+                    if state != COLON:
+                        self.error(state, position - 1)
+                    state = VALUE
+                    continue
+                if char == b"[" or char == b"{":
+                    if state != VALUE and state != VALUE_OR_CLOSE:
+                        self.error(state, position - 1)
+                    is_object = char == b"{"
+                    stats = self.record(path, "object" if is_object else "array")
+                    samples = not is_object and self.sample > 1 and not sampling
+                    if samples:
+                        sampling = True
+                    stack.append([is_object, path, position - 1, 0, samples, stats])
+                    tokens.append(0)
+                    if len(stack) > self.max_depth:
+                        self.max_depth = len(stack)
+                    if is_object:
+                        state = KEY_OR_CLOSE
+                    else:
+                        path = self.child_path(path, None)
+                        state = VALUE_OR_CLOSE
+                    continue
+                # "]" or "}"
+                is_object = char == b"}"
+                if not stack or stack[-1][0] != is_object or state not in (COMMA_OR_CLOSE, KEY_OR_CLOSE if is_object else VALUE_OR_CLOSE):
+                    self.error(state, position - 1)
+                frame = stack.pop()
+                tokens.pop()
+                members = 0 if state != COMMA_OR_CLOSE else frame[3] + 1
+                stats = frame[5]
+                if not is_object and stats is not None:
+                    stats.array_length = _widen(stats.array_length, members)
+                if frame[4]:
+                    sampling = False
+                if stack:
+                    self.consider(position - frame[2], tokens)
+                path = frame[1]
+            elif kind == STRING:
+                token = m.group(STRING)
+                if state == KEY or state == KEY_OR_CLOSE:
+                    key = token[1:-1].decode("utf-8", "surrogatepass")
+                    if "\\" in key:
+                        key = self.unescape(token, m.start(STRING))
+                    frame = stack[-1]
+                    if frame[5] is not None:
+                        frame[5].keys[key] = frame[5].keys.get(key, 0) + 1
+                    tokens[-1] = key
+                    path = self.child_path(frame[1], key)
+                    state = COLON
+                    continue
+                if state != VALUE and state != VALUE_OR_CLOSE:
+                    self.error(state, m.start(STRING))
+                if b"\\" in token:
+                    length = len(self.unescape(token, m.start(STRING)))
+                elif token.isascii():
+                    length = len(token) - 2
+                else:
+                    length = len(token.decode("utf-8", "surrogatepass")) - 2
+                self.record_string(path, length)
+            else:
+                if state != VALUE and state != VALUE_OR_CLOSE:
+                    # A number's last group may be its fraction or exponent; report where it starts
+                    self.error(state, m.start(INTEGER if kind in (FRACTION, EXPONENT) else kind))
+                if kind == LITERAL:
+                    literal = m.group(LITERAL)
+                    self.record(path, LITERAL_TYPES.get(literal, "number"))
+                elif kind == INTEGER and m.group(3) is None and m.group(4) is None:
+                    self.record(path, "integer")
+                else:
+                    self.record(path, "number")
+
+            # A value (scalar or just-closed container) is complete
+            state = COMMA_OR_CLOSE if stack else END
+            if stack:
+                path = stack[-1][1] if stack[-1][0] else path
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        strings = sum(self.strings)
+        result: Dict[str, Any] = {
+            "bytes": len(self.buffer),
+            "values": self.values,
+            "max_depth": self.max_depth,
+            "types": dict(sorted(self.types.items(), key=lambda item: -item[1])),
+            "strings": {
+                "count": strings,
+                "mean_length": round(self.string_total / strings, 1) if strings else 0,
+                "histogram": {label: count for (_, label), count in zip(STRING_BUCKETS, self.strings)},
+            },
+            "paths": {path: stats.to_dict() for path, stats in self.paths.items()},
+            "largest": [{"path": path, "bytes": size} for size, _, path in sorted(self.largest, reverse=True)],
+        }
+        if self.sample > 1:
+            result["sample"] = {"every": self.sample, "skipped": self.skipped}
+        if self.untracked:
+            result["untracked_values"] = self.untracked
+        return result
+
+
+def profile(buffer: Buffer, top: int = 10, sample: int = 1) -> Dict[str, Any]:
+    """Statistics for a JSON document given as text or UTF-8 bytes (see Profiler)"""
+    return Profiler(buffer, top, sample).run().to_dict()
@@ -0,0 +1,544 @@
+"""
+JSON Query
+JSONPath and jq-style path expressions, compiled once and evaluated either on
+parsed data or directly on the JSON text
+"""
+
+import functools
+import json
+import re
+from json.decoder import scanstring
+from typing import Any, Callable, List, Optional
+
+from utils import json_backend
+
+NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*")
+INTEGER = re.compile(r"-?[0-9]+")
+NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?")
+OPERATOR = re.compile(r"==|!=|<=|>=|<|>")
+QUERY_WHITESPACE = re.compile(r"\s*")
+
+# JSON text scanning for streamed evaluation
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+STRING = re.compile(r'"[^"\\\x00-\x1f]*(?:\\.[^"\\\x00-\x1f]*)*"')
+SCALAR = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?|true|false|null|NaN|-?Infinity")
+# Everything up to the next bracket, strings included, in one match
+FLAT = re.compile(r'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+
+# Containers up to this size are decoded and evaluated in one go instead of walked
+DECODE_BYTES = 64 * 1024
+
+_decoder = json.JSONDecoder()
+
+
+class QueryError(ValueError):
+    """A query that does not parse"""
+
+
+def _children(node: Any) -> List[Any]:
+    if isinstance(node, dict):
+        return list(node.values())
+    if isinstance(node, list):
+        return node
+    return []
+
+
+class Field:
+    def __init__(self, name: str):
+        self.name = name
+
+    def apply(self, nodes: List[Any]) -> List[Any]:
+        return [node[self.name] for node in nodes if isinstance(node, dict) and self.name in node]
+
+    def selects_key(self, key: str) -> bool:
+        return key == self.name
+
+    def selects_index(self, index: int) -> bool:
+        return False
+
+
+class Wildcard:
+    def apply(self, nodes: List[Any]) -> List[Any]:
+        return [child for node in nodes for child in _children(node)]
+
+    def selects_key(self, key: str) -> bool:
+        return True
+
+    def selects_index(self, index: int) -> bool:
+        return True
+
+
+class Index:
+    def __init__(self, index: int):
+        self.index = index
+
+    def apply(self, nodes: List[Any]) -> List[Any]:
+        return [
+            node[self.index] for node in nodes
+            if isinstance(node, list) and -len(node) <= self.index < len(node)
+        ]
+
+    def selects_key(self, key: str) -> bool:
+        return False
+
+    def selects_index(self, index: int) -> bool:
+        return index == self.index
+
+
+class Slice:
+    def __init__(self, start: Optional[int], stop: Optional[int], step: Optional[int]):
+        if step == 0:
+            raise QueryError("slice step cannot be zero")
+        self.start, self.stop, self.step = start, stop, step
+
+    def apply(self, nodes: List[Any]) -> List[Any]:
+        return [child for node in nodes if isinstance(node, list) for child in node[self.start:self.stop:self.step]]
+
+    @property
+    def forward(self) -> bool:
+        """Decidable element by element, without knowing the array's length"""
+        return all(bound is None or bound >= 0 for bound in (self.start, self.stop, self.step))
+
+    def selects_key(self, key: str) -> bool:
+        return False
+
+    def selects_index(self, index: int) -> bool:
+        start = self.start or 0
+        if index < start or (self.stop is not None and index >= self.stop):
+            return False
+        return (index - start) % (self.step or 1) == 0
+
+
+class Union:
+    """[a, b, ...]: matches in selector order, so not streamable"""
+
+    def __init__(self, selectors: list):
+        self.selectors = selectors
+
+    def apply(self, nodes: List[Any]) -> List[Any]:
+        return [match for node in nodes for selector in self.selectors for match in selector.apply([node])]
+
+
+class Descend:
+    """..step: the step applied to a node and every node below it, in document order"""
+
+    def __init__(self, step):
+        self.step = step
+
+    def apply(self, nodes: List[Any]) -> List[Any]:
+        out = []
+        stack = list(reversed(nodes))
+        while stack:
+            node = stack.pop()
+            out.extend(self.step.apply([node]))
+            stack.extend(reversed(_children(node)))
+        return out
+
+
+class Filter:
+    """[?(condition)]: children of each node for which the condition holds"""
+
+    def __init__(self, condition: Callable[[Any], bool]):
+        self.condition = condition
+
+    def apply(self, nodes: List[Any]) -> List[Any]:
+        return [child for node in nodes for child in _children(node) if self.condition(child)]
+
+
+class Select:
+    """jq select(condition): each node itself, if the condition holds"""
+
+    def __init__(self, condition: Callable[[Any], bool]):
+        self.condition = condition
+
+    def apply(self, nodes: List[Any]) -> List[Any]:
+        return [node for node in nodes if self.condition(node)]
+
+
+def _compare(op: str, left: Any, right: Any) -> bool:
+    if op == "==":
+        return left == right and isinstance(left, bool) == isinstance(right, bool)
+    if op == "!=":
+        return not _compare("==", left, right)
+    numeric = (int, float)
+    if isinstance(left, bool) or isinstance(right, bool):
+        return False
+    if not (isinstance(left, numeric) and isinstance(right, numeric)) and not (isinstance(left, str) and isinstance(right, str)):
+        return False
+    if op == "<":
+        return left < right
+    if op == "<=":
+        return left <= right
+    if op == ">":
+        return left > right
+    return left >= right
+
+
+def evaluate_steps(steps: list, nodes: List[Any]) -> List[Any]:
+    for step in steps:
+        nodes = step.apply(nodes)
+    return nodes
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def error(self, message: str):
+        raise QueryError(f"{message} at position {self.pos} in query {self.text!r}")
+
+    def skip_space(self):
+        self.pos = QUERY_WHITESPACE.match(self.text, self.pos).end()
+
+    def peek(self, literal: str) -> bool:
+        return self.text.startswith(literal, self.pos)
+
+    def take(self, literal: str) -> bool:
+        if self.peek(literal):
+            self.pos += len(literal)
+            return True
+        return False
+
+    def expect(self, literal: str):
+        if not self.take(literal):
+            self.error(f"expected {literal!r}")
+
+    def quoted(self) -> str:
+        quote = self.text[self.pos]
+        end = self.pos + 1
+        chars = []
+        while end < len(self.text) and self.text[end] != quote:
+            if self.text[end] == "\\" and end + 1 < len(self.text):
+                end += 1
+            chars.append(self.text[end])
+            end += 1
+        if end >= len(self.text):
+            self.error("unterminated string")
+        self.pos = end + 1
+        return "".join(chars)
+
+    def regex(self, pattern: "re.Pattern") -> Optional[str]:
+        match = pattern.match(self.text, self.pos)
+        if match is None or not match.group(0):
+            return None
+        self.pos = match.end()
+        return match.group(0)
+
+    def query(self) -> list:
+        self.skip_space()
+        if not (self.take("$") or self.peek(".")):
+            self.error("a query starts with $ (JSONPath) or . (jq)")
+        steps = self.steps(top=True)
+        self.skip_space()
+        if self.pos < len(self.text):
+            self.error("unexpected character")
+        return steps
+
+    def steps(self, top: bool = False) -> list:
+        steps = []
+        while True:
+            if top:
+                self.skip_space()
+            if self.take(".."):
+                steps.append(Descend(self.member(after_dot=True)))
+            elif self.take("."):
+                if self.peek("[") or (not top and not self.peek_name()) or (top and self.at_end_of_path()):
+                    continue
+                steps.append(self.member(after_dot=True))
+            elif self.peek("["):
+                steps.append(self.bracket())
+            elif top and self.take("|"):
+                self.skip_space()
+                if self.take("select"):
+                    self.skip_space()
+                    self.expect("(")
+                    steps.append(Select(self.expression()))
+                    self.skip_space()
+                    self.expect(")")
+                elif not self.peek("."):
+                    self.error("expected a path or select(...) after |")
+            else:
+                return steps
+
+    def peek_name(self) -> bool:
+        return bool(NAME.match(self.text, self.pos)) or self.peek("*") or self.peek('"')
+
+    def at_end_of_path(self) -> bool:
+        rest = self.text[self.pos:].lstrip()
+        return not rest or rest[0] == "|"
+
+    def member(self, after_dot: bool):
+        if self.take("*"):
+            return Wildcard()
+        if self.peek("["):
+            return self.bracket()
+        if self.peek('"') or self.peek("'"):
+            return Field(self.quoted())
+        name = self.regex(NAME)
+        if name is None:
+            self.error("expected a field name")
+        return Field(name)
+
+    def bracket(self):
+        self.expect("[")
+        self.skip_space()
+        if self.take("]"):
+            return Wildcard()
+        if self.take("*"):
+            self.skip_space()
+            self.expect("]")
+            return Wildcard()
+        if self.take("?"):
+            self.skip_space()
+            condition = self.expression()
+            self.skip_space()
+            self.expect("]")
+            return Filter(condition)
+        selectors = [self.selector()]
+        self.skip_space()
+        while self.take(","):
+            self.skip_space()
+            selectors.append(self.selector())
+            self.skip_space()
+        self.expect("]")
+        return selectors[0] if len(selectors) == 1 else Union(selectors)
+
+    def selector(self):
+        if self.peek('"') or self.peek("'"):
+            return Field(self.quoted())
+        if self.peek("*"):
+            self.pos += 1
+            return Wildcard()
+        bounds: List[Optional[int]] = []
+        colons = 0
+        while True:
+            self.skip_space()
+            number = self.regex(INTEGER)
+            bounds.append(int(number) if number is not None else None)
+            self.skip_space()
+            if colons < 2 and self.take(":"):
+                colons += 1
+                continue
+            break
+        if colons == 0:
+            if bounds[0] is None:
+                self.error("expected an index, slice, name or *")
+            return Index(bounds[0])
+        bounds += [None] * (3 - len(bounds))
+        return Slice(*bounds)
+
+    def expression(self) -> Callable[[Any], bool]:
+        left = self.conjunction()
+        while True:
+            self.skip_space()
+            if not (self.take("||") or self.keyword("or")):
+                return left
+            right = self.conjunction()
+            left = (lambda a, b: lambda node: a(node) or b(node))(left, right)
+
+    def conjunction(self) -> Callable[[Any], bool]:
+        left = self.unary()
+        while True:
+            self.skip_space()
+            if not (self.take("&&") or self.keyword("and")):
+                return left
+            right = self.unary()
+            left = (lambda a, b: lambda node: a(node) and b(node))(left, right)
+
+    def keyword(self, word: str) -> bool:
+        if self.peek(word) and not NAME.match(self.text, self.pos + len(word)):
+            self.pos += len(word)
+            return True
+        return False
+
+    def unary(self) -> Callable[[Any], bool]:
+        self.skip_space()
+        if self.take("!") or self.keyword("not"):
+            inner = self.unary()
+            return lambda node: not inner(node)
+        if self.take("("):
+            inner = self.expression()
+            self.skip_space()
+            self.expect(")")
+            return inner
+        if not (self.take("@") or self.peek(".")):
+            self.error("expected @ or . to start a condition")
+        path = self.steps()
+        self.skip_space()
+        op = self.regex(OPERATOR)
+        if op is None:
+            return lambda node: bool(evaluate_steps(path, [node]))
+        self.skip_space()
+        literal = self.literal()
+        return lambda node: any(_compare(op, value, literal) for value in evaluate_steps(path, [node]))
+
+    def literal(self) -> Any:
+        if self.peek('"') or self.peek("'"):
+            return self.quoted()
+        for word, value in (("true", True), ("false", False), ("null", None)):
+            if self.keyword(word):
+                return value
+        number = self.regex(NUMBER)
+        if number is None:
+            self.error("expected a number, string, true, false or null")
+        return json.loads(number)
+
+
+class Query:
+    """A compiled query; evaluate() on parsed data, stream() on JSON text"""
+
+    def __init__(self, text: str, steps: list):
+        self.text = text
+        self.steps = steps
+
+    def evaluate(self, value: Any) -> List[Any]:
+        return evaluate_steps(self.steps, [value])
+
+    @property
+    def streamable(self) -> bool:
+        """Every step can be decided from keys and positions as the text is scanned"""
+        for step in self.steps:
+            if isinstance(step, (Union, Descend)):
+                return False
+            if isinstance(step, Index) and step.index < 0:
+                return False
+            if isinstance(step, Slice) and not step.forward:
+                return False
+        return True
+
+    @property
+    def single_path(self) -> bool:
+        """At most one match: scanning can stop at the first one"""
+        return all(isinstance(step, (Field, Index)) for step in self.steps)
+
+    def stream(self, text: str) -> List[Any]:
+        """
+        Evaluate directly on JSON text (requires `streamable`). Containers
+        larger than DECODE_BYTES are walked member by member: unselected
+        members are stepped over by bracket counting, without being decoded
+        or validated. Smaller containers, matches and filter candidates are
+        decoded one at a time, so memory follows the largest of those rather
+        than the document.
+        """
+        out: List[Any] = []
+        position = WHITESPACE.match(text).end()
+        try:
+            end = _walk(text, position, self.steps, 0, out, self.single_path)
+        except _Found:
+            return out
+        end = WHITESPACE.match(text, end).end()
+        if end != len(text):
+            raise json.JSONDecodeError("Extra data", text, end)
+        return out
+
+
+class _Found(Exception):
+    pass
+
+
+def _skip(text: str, position: int, limit: Optional[int] = None) -> int:
+    """
+    End of the value starting at position, without decoding it; -1 when it
+    runs past `limit`
+    """
+    char = text[position:position + 1]
+    if char == '"':
+        match = STRING.match(text, position)
+        return match.end() if match else scanstring(text, position + 1)[1]
+    if char != "[" and char != "{":
+        match = SCALAR.match(text, position)
+        if match is None:
+            raise json.JSONDecodeError("Expecting value", text, position)
+        return match.end()
+    depth = 0
+    while True:
+        char = text[position:position + 1]
+        if char == "[" or char == "{":
+            depth += 1
+            position += 1
+        elif char == "]" or char == "}":
+            depth -= 1
+            position += 1
+            if depth == 0:
+                return position
+        elif char == '"':
+            # FLAT stops short of a malformed string; this raises its error
+            position = scanstring(text, position + 1)[1]
+        else:
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, position)
+        position = FLAT.match(text, position).end()
+        if limit is not None and position > limit:
+            return -1
+
+
+def _decode_and_evaluate(text: str, position: int, steps: list, out: List[Any], single: bool) -> int:
+    value, end = _decoder.raw_decode(text, position)
+    matches = evaluate_steps(steps, [value])
+    out.extend(matches)
+    if single and matches:
+        raise _Found()
+    return end
+
+
+def _walk(text: str, position: int, steps: list, index: int, out: List[Any], single: bool) -> int:
+    """Collect matches of steps[index:] in the value at position; returns the value's end"""
+    if index == len(steps):
+        return _decode_and_evaluate(text, position, [], out, single)
+    step = steps[index]
+    char = text[position:position + 1]
+    if char != "{" and char != "[":
+        if isinstance(step, Select):
+            return _decode_and_evaluate(text, position, steps[index:], out, single)
+        return _skip(text, position)
+    if isinstance(step, Select) or _skip(text, position, position + DECODE_BYTES) != -1:
+        # Small subtrees decode faster than they can be walked
+        return _decode_and_evaluate(text, position, steps[index:], out, single)
+
+    close = "}" if char == "{" else "]"
+    position = WHITESPACE.match(text, position + 1).end()
+    if text.startswith(close, position):
+        return position + 1
+    count = 0
+    while True:
+        if char == "{":
+            if not text.startswith('"', position):
+                raise json.JSONDecodeError("Expecting property name enclosed in double quotes", text, position)
+            key, position = scanstring(text, position + 1)
+            position = WHITESPACE.match(text, position).end()
+            if not text.startswith(":", position):
+                raise json.JSONDecodeError("Expecting ':' delimiter", text, position)
+            position = WHITESPACE.match(text, position + 1).end()
+            selected = isinstance(step, Filter) or step.selects_key(key)
+        else:
+            selected = isinstance(step, Filter) or step.selects_index(count)
+            count += 1
+        if isinstance(step, Filter):
+            value, position = _decoder.raw_decode(text, position)
+            if step.condition(value):
+                out.extend(evaluate_steps(steps[index + 1:], [value]))
+        elif selected:
+            position = _walk(text, position, steps, index + 1, out, single)
+        else:
+            position = _skip(text, position)
+        position = WHITESPACE.match(text, position).end()
+        if text.startswith(",", position):
+            position = WHITESPACE.match(text, position + 1).end()
+        elif text.startswith(close, position):
+            return position + 1
+        else:
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, position)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_query(text: str) -> Query:
+    """Parse a query once; later calls with the same string reuse it"""
+    return Query(text, _Parser(text).query())
+
+
+def run_query(text: str, query: str, stream: bool) -> List[Any]:
+    """Matches of `query` in a JSON document, scanning the text when `stream` and the query allow it"""
+    compiled = compile_query(query)
+    if stream and compiled.streamable:
+        return compiled.stream(text)
+    return compiled.evaluate(json_backend.loads(text))
@@ -0,0 +1,529 @@
+"""
+JSON Schema
+Compiles a JSON Schema into nested validator closures once, so checking a
+document is one pass over the data instead of re-reading the schema for
+every value; compiled validators are cached by a hash of the schema
+"""
+
+import hashlib
+import json
+import math
+import re
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import unquote
+
+import jsonschema
+from jsonschema import validators
+
+from utils.local_files import resolve
+
+# Violations described in a report; the rest are only counted
+MAX_REPORTED_VIOLATIONS = 100
+
+# Compiled schemas kept, least recently used dropped first
+SCHEMA_CACHE_SIZE = 64
+
+# Keywords handled by jsonschema itself rather than compiled ($id only below the root);
+# keywords in neither list are annotations or unknown, and never fail
+UNSUPPORTED = {
+    "$id", "$anchor", "$dynamicRef", "$dynamicAnchor", "$recursiveRef", "$recursiveAnchor",
+    "unevaluatedProperties", "unevaluatedItems", "dependencies", "$vocabulary",
+}
+
+# Drafts with keyword meanings the compiler does not follow (boolean exclusiveMaximum and the like)
+OLD_DRAFTS = ("draft-03", "draft-04")
+
+# A violation while it bubbles up: (reference tokens innermost first, message)
+Violation = Tuple[List[Any], str]
+Check = Callable[[Any], Optional[List[Violation]]]
+
+
+class SchemaError(ValueError):
+    """The schema is not valid JSON Schema"""
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def json_type(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    return "array" if isinstance(value, list) else "object"
+
+
+TYPE_TESTS = {
+    "null": lambda value: value is None,
+    "boolean": lambda value: isinstance(value, bool),
+    "string": lambda value: isinstance(value, str),
+    "array": lambda value: isinstance(value, list),
+    "object": lambda value: isinstance(value, dict),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "integer": lambda value: (
+        isinstance(value, int) and not isinstance(value, bool)
+        or isinstance(value, float) and value.is_integer()
+    ),
+}
+
+
+def _equal(a: Any, b: Any) -> bool:
+    """JSON equality: 1 equals 1.0 but not true"""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return a is b
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_equal(a[key], b[key]) for key in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_equal(x, y) for x, y in zip(a, b))
+    return a == b and (type(a) is type(b) or isinstance(a, (int, float)) and isinstance(b, (int, float)))
+
+
+def _identity(value: Any) -> Any:
+    """Hashable form of a value that is equal exactly when _equal is"""
+    if isinstance(value, dict):
+        return "object", frozenset((key, _identity(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return "array", tuple(_identity(item) for item in value)
+    if isinstance(value, bool):
+        return "boolean", value
+    return "value", value
+
+
+def _render(value: Any, limit: int = 60) -> str:
+    text = json.dumps(value, ensure_ascii=False)
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
+def _fail(message: str) -> List[Violation]:
+    return [([], message)]
+
+
+def _merge(errors: Optional[List[Violation]], found: List[Violation], token: Any = None) -> List[Violation]:
+    if token is not None:
+        for tokens, _ in found:
+            tokens.append(token)
+    if errors is None:
+        return found
+    errors.extend(found)
+    return errors
+
+
+def _valid(value: Any) -> None:
+    return None
+
+
+def _never(value: Any) -> List[Violation]:
+    return _fail("no value is allowed here")
+
+
+def _all_of(checks: List[Check]) -> Check:
+    if not checks:
+        return _valid
+    if len(checks) == 1:
+        return checks[0]
+
+    def check(value):
+        errors = None
+        for child in checks:
+            found = child(value)
+            if found:
+                errors = _merge(errors, found)
+        return errors
+    return check
+
+
+class _Compiler:
+    """Turns one schema document into closures; $ref targets are compiled once and shared"""
+
+    def __init__(self, root: Any):
+        self.root = root
+        self.refs: Dict[str, Check] = {}
+
+    def compile(self, schema: Any) -> Check:
+        if schema is True:
+            return _valid
+        if schema is False:
+            return _never
+        unsupported = UNSUPPORTED.intersection(schema)
+        if schema is self.root:
+            unsupported.discard("$id")
+        if unsupported:
+            raise _Unsupported(sorted(unsupported)[0])
+
+        checks: List[Check] = []
+        if "$ref" in schema:
+            checks.append(self.ref(schema["$ref"]))
+        if "type" in schema:
+            checks.append(self.type(schema["type"]))
+        if "enum" in schema:
+            checks.append(self.enum(schema["enum"]))
+        if "const" in schema:
+            checks.append(self.const(schema["const"]))
+        checks.extend(self.numbers(schema))
+        checks.extend(self.strings(schema))
+        if {"properties", "patternProperties", "additionalProperties"}.intersection(schema):
+            checks.append(self.properties(schema))
+        checks.extend(self.objects(schema))
+        if {"items", "prefixItems", "additionalItems"}.intersection(schema):
+            checks.append(self.items(schema))
+        checks.extend(self.arrays(schema))
+        checks.extend(self.combinators(schema))
+        return _all_of(checks)
+
+    def ref(self, reference: str) -> Check:
+        if not reference.startswith("#") or reference[1:2] not in ("", "/"):
+            raise _Unsupported("$ref")
+        check = self.refs.get(reference)
+        if check is None:
+            # Registered before compiling the target, so recursive schemas terminate
+            target: List[Check] = []
+            self.refs[reference] = check = lambda value: target[0](value)
+            node = self.root
+            for token in reference[2:].split("/") if reference != "#" else []:
+                token = unquote(token).replace("~1", "/").replace("~0", "~")
+                try:
+                    node = node[int(token)] if isinstance(node, list) else node[token]
+                except (KeyError, IndexError, ValueError, TypeError):
+                    raise SchemaError(f"$ref {reference} does not point into the schema")
+            target.append(self.compile(node))
+        return check
+
+    def type(self, expected: Any) -> Check:
+        names = [expected] if isinstance(expected, str) else list(expected)
+        tests = [TYPE_TESTS[name] for name in names]
+        wanted = " or ".join(names)
+        if len(tests) == 1:
+            test = tests[0]
+            return lambda value: None if test(value) else _fail(f"expected {wanted}, got {json_type(value)}")
+        return lambda value: None if any(test(value) for test in tests) else _fail(f"expected {wanted}, got {json_type(value)}")
+
+    def enum(self, options: list) -> Check:
+        message = f"not one of {_render(options)}"
+        return lambda value: None if any(_equal(value, option) for option in options) else _fail(message)
+
+    def const(self, constant: Any) -> Check:
+        message = f"expected {_render(constant)}"
+        return lambda value: None if _equal(value, constant) else _fail(message)
+
+    def numbers(self, schema: dict) -> List[Check]:
+        def number(value):
+            return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+        checks = []
+        bounds = [
+            ("minimum", lambda value, limit: value >= limit, "less than the minimum of"),
+            ("maximum", lambda value, limit: value <= limit, "greater than the maximum of"),
+            ("exclusiveMinimum", lambda value, limit: value > limit, "not greater than"),
+            ("exclusiveMaximum", lambda value, limit: value < limit, "not less than"),
+        ]
+        for keyword, holds, text in bounds:
+            if keyword in schema:
+                def check(value, limit=schema[keyword], holds=holds, text=text):
+                    if number(value) and not holds(value, limit):
+                        return _fail(f"{value} is {text} {limit}")
+                    return None
+                checks.append(check)
+        if "multipleOf" in schema:
+            divisor = schema["multipleOf"]
+
+            def multiple(value):
+                if not number(value):
+                    return None
+                if isinstance(divisor, float) or isinstance(value, float):
+                    quotient = value / divisor
+                    failed = math.isinf(quotient) or int(quotient) != quotient
+                else:
+                    failed = value % divisor != 0
+                return _fail(f"{value} is not a multiple of {divisor}") if failed else None
+            checks.append(multiple)
+        return checks
+
+    def strings(self, schema: dict) -> List[Check]:
+        checks = []
+        if "minLength" in schema:
+            shortest = schema["minLength"]
+            checks.append(lambda value: _fail(f"shorter than {shortest} characters")
+                          if isinstance(value, str) and len(value) < shortest else None)
+        if "maxLength" in schema:
+            longest = schema["maxLength"]
+            checks.append(lambda value: _fail(f"longer than {longest} characters")
+                          if isinstance(value, str) and len(value) > longest else None)
+        if "pattern" in schema:
+            pattern = re.compile(schema["pattern"])
+            checks.append(lambda value: _fail(f"does not match {_render(pattern.pattern)}")
+                          if isinstance(value, str) and not pattern.search(value) else None)
+        return checks
+
+    def properties(self, schema: dict) -> Check:
+        named = [(name, self.compile(sub)) for name, sub in schema.get("properties", {}).items()]
+        names = set(schema.get("properties", {}))
+        patterns = [(re.compile(pattern), self.compile(sub)) for pattern, sub in schema.get("patternProperties", {}).items()]
+        additional = schema.get("additionalProperties", True)
+        if additional is False:
+            rest: Optional[Check] = lambda value: _fail("additional property is not allowed")
+        else:
+            rest = None if additional is True else self.compile(additional)
+
+        def check(value):
+            if not isinstance(value, dict):
+                return None
+            errors = None
+            for name, child in named:
+                if name in value:
+                    found = child(value[name])
+                    if found:
+                        errors = _merge(errors, found, name)
+            if patterns or rest is not None:
+                for key, item in value.items():
+                    matched = key in names
+                    for pattern, child in patterns:
+                        if pattern.search(key):
+                            matched = True
+                            found = child(item)
+                            if found:
+                                errors = _merge(errors, found, key)
+                    if not matched and rest is not None:
+                        found = rest(item)
+                        if found:
+                            errors = _merge(errors, found, key)
+            return errors
+        return check
+
+    def objects(self, schema: dict) -> List[Check]:
+        checks = []
+        if "required" in schema:
+            required = schema["required"]
+
+            def check_required(value):
+                if not isinstance(value, dict):
+                    return None
+                missing = [name for name in required if name not in value]
+                return [([], f"missing required property {_render(name)}") for name in missing] or None
+            checks.append(check_required)
+        if "minProperties" in schema:
+            fewest = schema["minProperties"]
+            checks.append(lambda value: _fail(f"fewer than {fewest} properties")
+                          if isinstance(value, dict) and len(value) < fewest else None)
+        if "maxProperties" in schema:
+            most = schema["maxProperties"]
+            checks.append(lambda value: _fail(f"more than {most} properties")
+                          if isinstance(value, dict) and len(value) > most else None)
+        if "propertyNames" in schema:
+            names = self.compile(schema["propertyNames"])
+
+            def check_names(value):
+                if not isinstance(value, dict):
+                    return None
+                errors = None
+                for key in value:
+                    found = names(key)
+                    if found:
+                        errors = _merge(errors, [([key], f"property name {_render(key)}: {message}") for _, message in found])
+                return errors
+            checks.append(check_names)
+        if "dependentRequired" in schema:
+            dependent = schema["dependentRequired"]
+
+            def check_dependent(value):
+                if not isinstance(value, dict):
+                    return None
+                errors = [
+                    ([], f"{_render(name)} is required when {_render(trigger)} is present")
+                    for trigger, names in dependent.items() if trigger in value
+                    for name in names if name not in value
+                ]
+                return errors or None
+            checks.append(check_dependent)
+        if "dependentSchemas" in schema:
+            dependent_schemas = [(trigger, self.compile(sub)) for trigger, sub in schema["dependentSchemas"].items()]
+
+            def check_dependent_schemas(value):
+                if not isinstance(value, dict):
+                    return None
+                errors = None
+                for trigger, child in dependent_schemas:
+                    if trigger in value:
+                        found = child(value)
+                        if found:
+                            errors = _merge(errors, found)
+                return errors
+            checks.append(check_dependent_schemas)
+        return checks
+
+    def items(self, schema: dict) -> Check:
+        if isinstance(schema.get("items"), list):
+            # Draft 2019-09 and earlier: a list of items is a tuple, additionalItems covers the rest
+            prefix = [self.compile(sub) for sub in schema["items"]]
+            rest_schema = schema.get("additionalItems", True)
+        else:
+            prefix = [self.compile(sub) for sub in schema.get("prefixItems", [])]
+            rest_schema = schema.get("items", True)
+        rest = None if rest_schema is True else self.compile(rest_schema)
+
+        def check(value):
+            if not isinstance(value, list):
+                return None
+            errors = None
+            for index, child in enumerate(prefix[:len(value)]):
+                found = child(value[index])
+                if found:
+                    errors = _merge(errors, found, index)
+            if rest is not None:
+                start = len(prefix)
+                for index, item in enumerate(value[start:] if start else value, start):
+                    found = rest(item)
+                    if found:
+                        errors = _merge(errors, found, index)
+            return errors
+        return check
+
+    def arrays(self, schema: dict) -> List[Check]:
+        checks = []
+        if "minItems" in schema:
+            fewest = schema["minItems"]
+            checks.append(lambda value: _fail(f"fewer than {fewest} items")
+                          if isinstance(value, list) and len(value) < fewest else None)
+        if "maxItems" in schema:
+            most = schema["maxItems"]
+            checks.append(lambda value: _fail(f"more than {most} items")
+                          if isinstance(value, list) and len(value) > most else None)
+        if schema.get("uniqueItems"):
+            def check_unique(value):
+                if not isinstance(value, list):
+                    return None
+                seen = {}
+                for index, item in enumerate(value):
+                    earlier = seen.setdefault(_identity(item), index)
+                    if earlier != index:
+                        return [([index], f"duplicate of item {earlier}")]
+                return None
+            checks.append(check_unique)
+        if "contains" in schema:
+            contains = self.compile(schema["contains"])
+            at_least = schema.get("minContains", 1)
+            at_most = schema.get("maxContains")
+
+            def check_contains(value):
+                if not isinstance(value, list):
+                    return None
+                count = sum(1 for item in value if not contains(item))
+                if count < at_least:
+                    return _fail(f"fewer than {at_least} items match \"contains\"")
+                if at_most is not None and count > at_most:
+                    return _fail(f"more than {at_most} items match \"contains\"")
+                return None
+            checks.append(check_contains)
+        return checks
+
+    def combinators(self, schema: dict) -> List[Check]:
+        checks = []
+        if "allOf" in schema:
+            checks.append(_all_of([self.compile(sub) for sub in schema["allOf"]]))
+        if "anyOf" in schema:
+            options = [self.compile(sub) for sub in schema["anyOf"]]
+            checks.append(lambda value: None if any(not option(value) for option in options)
+                          else _fail("does not match any schema in anyOf"))
+        if "oneOf" in schema:
+            choices = [self.compile(sub) for sub in schema["oneOf"]]
+
+            def check_one_of(value):
+                matches = sum(1 for choice in choices if not choice(value))
+                if matches == 1:
+                    return None
+                return _fail("does not match any schema in oneOf" if matches == 0 else f"matches {matches} schemas in oneOf")
+            checks.append(check_one_of)
+        if "not" in schema:
+            negated = self.compile(schema["not"])
+            checks.append(lambda value: _fail("matches the schema in \"not\"") if not negated(value) else None)
+        if "if" in schema:
+            condition = self.compile(schema["if"])
+            then = self.compile(schema.get("then", True))
+            otherwise = self.compile(schema.get("else", True))
+            checks.append(lambda value: then(value) if not condition(value) else otherwise(value))
+        return checks
+
+
+def pointer(tokens: List[Any]) -> str:
+    """JSON Pointer for reference tokens listed outermost first"""
+    return "".join(f"/{str(token).replace('~', '~0').replace('/', '~1')}" for token in tokens)
+
+
+class Validator:
+    """A compiled schema; validators the compiler cannot express run on jsonschema instead"""
+
+    __slots__ = ("check", "fallback")
+
+    def __init__(self, schema: Any):
+        self.fallback = None
+        try:
+            if isinstance(schema, dict) and any(draft in str(schema.get("$schema", "")) for draft in OLD_DRAFTS):
+                raise _Unsupported("$schema")
+            self.check = _Compiler(schema).compile(schema)
+        except _Unsupported:
+            self.check = None
+            self.fallback = validators.validator_for(schema)(schema)
+
+    @property
+    def compiled(self) -> bool:
+        return self.check is not None
+
+    def violations(self, value: Any, limit: int = MAX_REPORTED_VIOLATIONS) -> Tuple[List[Dict[str, str]], int]:
+        """Up to `limit` {"path", "message"} violations, plus how many there are in all"""
+        if self.fallback is not None:
+            found = [(pointer(list(error.absolute_path)), error.message) for error in self.fallback.iter_errors(value)]
+        else:
+            found = [(pointer(tokens[::-1]), message) for tokens, message in self.check(value) or []]
+        return [{"path": path, "message": message} for path, message in found[:limit]], len(found)
+
+
+_validators: "OrderedDict[str, Validator]" = OrderedDict()
+
+
+def compile_schema(schema: Any) -> Validator:
+    """Validator for a schema (parsed JSON); schemas equal as JSON share one compiled validator"""
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    digest = hashlib.sha256(canonical.encode()).hexdigest()
+    validator = _validators.get(digest)
+    if validator is not None:
+        _validators.move_to_end(digest)
+        return validator
+
+    if not isinstance(schema, (dict, bool)):
+        raise SchemaError("a schema must be an object or a boolean")
+    try:
+        validators.validator_for(schema).check_schema(schema)
+    except jsonschema.SchemaError as e:
+        raise SchemaError(f"invalid schema: {e.message}")
+    validator = Validator(schema)
+    _validators[digest] = validator
+    if len(_validators) > SCHEMA_CACHE_SIZE:
+        _validators.popitem(last=False)
+    return validator
+
+
+def load_schema(schema: Any = None, schema_path: Optional[str] = None) -> Any:
+    """
+    The schema passed inline (an object, a boolean or JSON text) or read from
+    a local file under the allowed roots (see utils/local_files.py)
+    """
+    if schema_path:
+        schema_path = resolve(schema_path)
+        try:
+            with open(schema_path, encoding="utf-8") as handle:
+                schema = handle.read()
+        except OSError as e:
+            raise SchemaError(f"cannot read schema file: {e.strerror}")
+    if isinstance(schema, str):
+        try:
+            schema = json.loads(schema)
+        except json.JSONDecodeError as e:
+            raise SchemaError(f"schema is not valid JSON: {e.msg} (line {e.lineno}, column {e.colno})")
+    return schema
@@ -0,0 +1,234 @@
+"""
+Streaming JSON Re-indenter
+Re-formats a JSON document token by token, without building the parsed tree
+"""
+
+import json
+import re
+import sys
+from json.decoder import scanstring
+from json.encoder import encode_basestring
+from typing import Iterator, List, Optional
+
+# One token, after optional whitespace: string | number (int, fraction, exponent) | punctuation | literal
+TOKEN = re.compile(
+    r'[ \t\n\r]*(?:'
+    r'("[^"\\\x00-\x1f]*(?:\\.[^"\\\x00-\x1f]*)*")'
+    r'|(-?(?:0|[1-9][0-9]*))(\.[0-9]+)?([eE][-+]?[0-9]+)?'
+    r'|([\[\]{},:])'
+    r'|(true|false|null|NaN|Infinity|-Infinity))'
+)
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+STRING, INTEGER, FRACTION, EXPONENT, PUNCTUATION, LITERAL = range(1, 7)
+
+# What the next token may be
+VALUE, VALUE_OR_CLOSE, KEY_OR_CLOSE, KEY, COLON, COMMA_OR_CLOSE, END = range(7)
+
+# json.loads's message for an unexpected token in each state
+EXPECTING = {
+    VALUE: "Expecting value",
+    VALUE_OR_CLOSE: "Expecting value",
+    KEY_OR_CLOSE: "Expecting property name enclosed in double quotes",
+    KEY: "Expecting property name enclosed in double quotes",
+    COLON: "Expecting ':' delimiter",
+    COMMA_OR_CLOSE: "Expecting ',' delimiter",
+    END: "Extra data",
+}
+
+# Keys remembered per open object to catch duplicates; wider objects are not checked past this
+MAX_TRACKED_KEYS = 4096
+
+INFINITY = float("inf")
+
+# Output pieces joined into one chunk before it is yielded
+CHUNK_PIECES = 8192
+
+
+class NotStreamable(Exception):
+    """The document is valid but the tree path must format it (duplicate keys, huge integers)"""
+
+
+class Reindenter:
+    """
+    Iterate for the formatted document in chunks, then read `summary`.
+
+    Output is identical to json.dumps(json.loads(text), indent=indent,
+    separators=..., ensure_ascii=False): strings with escapes and numbers
+    with a fraction or exponent are re-encoded the way json.dumps would
+    write them, everything else is copied. Invalid documents raise the same
+    JSONDecodeError (message and position) as json.loads.
+
+    Memory held besides the input and output is the stack of open
+    containers plus the keys of open objects (see MAX_TRACKED_KEYS).
+    """
+
+    def __init__(self, text: str, indent: Optional[int] = None, compact: bool = False):
+        self.text = text
+        self.indent = indent if indent and not compact else None
+        self.item_separator = "," if compact or self.indent else ", "
+        self.key_separator = ":" if compact else ": "
+        self.members = 0
+        self.summary: Optional[str] = None
+
+    def _error(self, state: int, position: int, comma: int):
+        text = self.text
+        if state != END and text.startswith('"', position) and state != COLON and state != COMMA_OR_CLOSE:
+            # Raises the exact string error (unterminated, bad escape, control character)
+            scanstring(text, position + 1)
+        if sys.version_info >= (3, 13) and state in (VALUE, KEY) and comma >= 0 and text.startswith(("]", "}"), position):
+            kind = "object" if text[position] == "}" else "array"
+            raise json.JSONDecodeError(f"Illegal trailing comma before end of {kind}", text, comma)
+        raise json.JSONDecodeError(EXPECTING[state], text, position)
+
+    def __iter__(self) -> Iterator[str]:
+        text = self.text
+        match = TOKEN.match
+        indent = self.indent
+        item_separator = self.item_separator
+        key_separator = self.key_separator
+        int_limit = sys.get_int_max_str_digits() if hasattr(sys, "get_int_max_str_digits") else 0
+
+        # pads[d]: what goes before an item at depth d (newline plus indentation, or nothing)
+        pads: List[str] = ["\n" if indent else ""]
+        # One entry per open container: a key set for objects, None for arrays
+        stack: List[Optional[set]] = []
+        depth = 0
+        members = 0
+        out: List[str] = []
+        append = out.append
+        state = VALUE
+        # An opening bracket plus the pad after it, held back until we know the container is not empty
+        pending = ""
+        position = 0
+        comma = -1
+
+        while True:
+            m = match(text, position)
+            if m is None:
+                position = WHITESPACE.match(text, position).end()
+                if state == END and position == len(text):
+                    break
+                self._error(state, position, comma)
+            kind = m.lastindex
+            position = m.end()
+
+            if kind == PUNCTUATION:
+                char = text[position - 1]
+                if char == ",":
+                    if state != COMMA_OR_CLOSE:
+                        self._error(state, position - 1, comma)
+                    append(item_separator)
+                    append(pads[depth])
+                    state = KEY if stack[-1] is not None else VALUE
+                    comma = position - 1
+                    if len(out) >= CHUNK_PIECES:
+                        yield "".join(out)
+                        out.clear()
+                    continue
+                if char == ":":
+                    if state != COLON:
+                        self._error(state, position - 1, comma)
+                    append(key_separator)
+                    state = VALUE
+                    continue
+                if char == "[" or char == "{":
+                    if state != VALUE and state != VALUE_OR_CLOSE:
+                        self._error(state, position - 1, comma)
+                    if pending:
+                        append(pending)
+                    stack.append(set() if char == "{" else None)
+                    depth += 1
+                    if len(pads) <= depth:
+                        pads.append("\n" + " " * (indent * depth) if indent else "")
+                    pending = char + pads[depth]
+                    state = KEY_OR_CLOSE if char == "{" else VALUE_OR_CLOSE
+                    continue
+                # "]" or "}"
+                is_object = char == "}"
+                if state == COMMA_OR_CLOSE and (stack[-1] is not None) == is_object:
+                    stack.pop()
+                    depth -= 1
+                    append(pads[depth])
+                    append(char)
+                elif pending and (state == KEY_OR_CLOSE) == is_object:
+                    stack.pop()
+                    depth -= 1
+                    append(pending[0])
+                    append(char)
+                    pending = ""
+                else:
+                    self._error(state, position - 1, comma)
+            else:
+                if kind == STRING:
+                    # Misplaced strings are reported before their escapes are decoded, as json.loads does
+                    if state == COLON or state == COMMA_OR_CLOSE or state == END:
+                        self._error(state, m.start(STRING), comma)
+                    token = m.group(STRING)
+                    if "\\" in token:
+                        value = scanstring(text, m.start(STRING) + 1)[0]
+                        token = encode_basestring(value)
+                    else:
+                        value = token[1:-1]
+                    if state == KEY or state == KEY_OR_CLOSE:
+                        keys = stack[-1]
+                        if len(keys) < MAX_TRACKED_KEYS:
+                            if value in keys:
+                                raise NotStreamable("duplicate key")
+                            keys.add(value)
+                        if pending:
+                            append(pending)
+                            pending = ""
+                        append(token)
+                        state = COLON
+                        continue
+                elif kind == INTEGER:
+                    token = m.group(INTEGER)
+                    if token == "-0":
+                        token = "0"
+                    elif int_limit and len(token) > int_limit:
+                        raise NotStreamable("integer exceeds the conversion limit")
+                elif kind == LITERAL:
+                    token = m.group(LITERAL)
+                else:
+                    number = float(text[m.start(INTEGER):position])
+                    if number == INFINITY:
+                        token = "Infinity"
+                    elif number == -INFINITY:
+                        token = "-Infinity"
+                    else:
+                        token = float.__repr__(number)
+
+                if state != VALUE and state != VALUE_OR_CLOSE:
+                    # A number's last group may be its fraction or exponent; report where it starts
+                    self._error(state, m.start(INTEGER if kind in (FRACTION, EXPONENT) else kind), comma)
+                if pending:
+                    append(pending)
+                    pending = ""
+                append(token)
+
+            # A value (scalar or just-closed container) is complete
+            if depth:
+                state = COMMA_OR_CLOSE
+                if depth == 1:
+                    members += 1
+            else:
+                state = END
+
+        if out:
+            yield "".join(out)
+        self.members = members
+        first = text[WHITESPACE.match(text).end()]
+        if first == "{":
+            self.summary = f"{members} keys"
+        elif first == "[":
+            self.summary = f"{members} items"
+        else:
+            self.summary = "scalar value"
+
+
+def reindent(text: str, indent: Optional[int] = None, compact: bool = False):
+    """Format a document without parsing it into objects; returns (formatted, item count summary)"""
+    formatter = Reindenter(text, indent, compact)
+    formatted = "".join(formatter)
+    return formatted, formatter.summary
@@ -0,0 +1,92 @@
+"""
+Local File Input
+Checks that files named by tool arguments (`path`, `schema_path`,
+`collection_path`) are under the allowed root directories, and reads payload
+files memory-mapped or in reused chunks rather than copied into strings
+"""
+
+import mmap
+import os
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Union
+
+from utils import config
+
+# Bytes per chunk; a multiple of 3 so Base64-encoded chunks join without padding
+CHUNK_BYTES = 3 * 512 * 1024
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+class PathNotAllowed(ValueError):
+    """The path is outside every allowed root, or file input is disabled"""
+
+
+def resolve(path: str) -> str:
+    """The real path of a regular file under one of config.ALLOWED_ROOTS (symlinks and .. resolved first)"""
+    if not config.ALLOWED_ROOTS:
+        raise PathNotAllowed("file input is disabled; set DEVKIT_ALLOWED_ROOTS to the directories it may read")
+    real = os.path.realpath(os.path.expanduser(path))
+    for root in config.ALLOWED_ROOTS:
+        root = os.path.realpath(os.path.expanduser(root))
+        if os.path.commonpath([root, real]) == root:
+            break
+    else:
+        raise PathNotAllowed(f"{path} is outside the allowed directories")
+    if not os.path.isfile(real):
+        raise ValueError(f"{path} is not a file" if os.path.exists(real) else f"{path} does not exist")
+    return real
+
+
+def input_path(arguments: Dict[str, Any], inline: str) -> Optional[str]:
+    """The resolved `path` argument, or None when the tool's inline argument is given instead"""
+    path = arguments.get("path")
+    if not path:
+        if inline not in arguments:
+            raise ValueError(f"{inline} or path is required")
+        return None
+    if inline in arguments:
+        raise ValueError(f"pass either {inline} or path, not both")
+    return resolve(path)
+
+
+@contextmanager
+def mapped(path: str) -> Iterator[Buffer]:
+    """The file's contents as a read-only mmap (b"" for an empty file), unmapped on exit"""
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+
+def read_chunks(path: str, size: Optional[int] = None) -> Iterator[memoryview]:
+    """
+    The file in chunks of `size` bytes (the last may be shorter), read into
+    one reused buffer; each chunk is only valid until the next is requested
+    """
+    chunk = bytearray(size or CHUNK_BYTES)
+    with open(path, "rb", buffering=0) as handle, memoryview(chunk) as view:
+        while True:
+            count = handle.readinto(view)
+            if not count:
+                return
+            yield view[:count]
+
+
+def read_text(path: str) -> str:
+    """The file decoded as UTF-8 straight from its mapping"""
+    with mapped(path) as buffer:
+        return str(buffer, "utf-8")
+
+
+def with_buffer(path: str, func: Callable, *args):
+    """func(mapped file, *args); module-level so file work can be sent to the process pool by path"""
+    with mapped(path) as buffer:
+        return func(buffer, *args)
+
+
+def with_text(path: str, func: Callable, *args):
+    """func(file text, *args); the text counterpart of with_buffer"""
+    return func(read_text(path), *args)
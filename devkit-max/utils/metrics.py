@@ -0,0 +1,184 @@
+"""
+Tool Metrics
+Fixed-bucket latency histograms and payload counters for every tool call
+"""
+
+import os
+from bisect import bisect_left
+from typing import Any, Dict, List
+
+# Bucket upper bounds in nanoseconds (10µs .. 60s); one overflow bucket follows
+BUCKET_BOUNDS_NS = [
+    10_000, 25_000, 50_000, 100_000, 250_000, 500_000,
+    1_000_000, 2_500_000, 5_000_000, 10_000_000, 25_000_000, 50_000_000,
+    100_000_000, 250_000_000, 500_000_000,
+    1_000_000_000, 2_500_000_000, 5_000_000_000, 10_000_000_000,
+    30_000_000_000, 60_000_000_000,
+]
+
+
+def geometric_bounds(low_ns: int, high_ns: int, ratio: float) -> List[int]:
+    """Bucket bounds growing by `ratio` from low to high; percentiles land within that factor"""
+    bounds = [low_ns]
+    while bounds[-1] < high_ns:
+        bounds.append(max(bounds[-1] + 1, int(bounds[-1] * ratio)))
+    return bounds
+
+
+class Histogram:
+    """Counts observations per fixed bucket; percentiles resolve to bucket bounds"""
+
+    __slots__ = ("bounds", "counts", "count", "total", "min", "max")
+
+    def __init__(self, bounds: List[int] = BUCKET_BOUNDS_NS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def observe(self, value_ns: int):
+        self.counts[bisect_left(self.bounds, value_ns)] += 1
+        if not self.count or value_ns < self.min:
+            self.min = value_ns
+        self.count += 1
+        self.total += value_ns
+        if value_ns > self.max:
+            self.max = value_ns
+
+    def percentile(self, q: float) -> int:
+        """Upper bound (ns) of the bucket holding the q-th observation, capped at the max seen"""
+        if not self.count:
+            return 0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                bound = self.bounds[i] if i < len(self.bounds) else self.max
+                return max(self.min, min(bound, self.max))
+        return self.max
+
+
+class ToolStats:
+    """Everything recorded for one tool"""
+
+    __slots__ = ("calls", "errors", "input_bytes", "output_bytes", "wall", "cpu")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.input_bytes = 0
+        self.output_bytes = 0
+        self.wall = Histogram()
+        self.cpu = Histogram()
+
+
+def payload_size(value: Any) -> int:
+    """Approximate size of call arguments: string lengths, recursing into containers"""
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(payload_size(v) for v in value.values())
+    if isinstance(value, list):
+        return sum(payload_size(v) for v in value)
+    return 8
+
+
+def result_bytes(result: Dict[str, Any]) -> int:
+    return sum(len(block.get("text", "")) for block in result.get("content", []))
+
+
+def is_error_result(result: Dict[str, Any]) -> bool:
+    """Tools report handled failures as text starting with ❌, or an "error" object in structured mode"""
+    content = result.get("content")
+    return bool(content) and content[0].get("text", "").startswith(("❌", '{"error":'))
+
+
+class Metrics:
+    """Per-tool stats keyed by tool name"""
+
+    def __init__(self):
+        self.tools: Dict[str, ToolStats] = {}
+
+    def record(self, tool: str, wall_ns: int, cpu_ns: int, input_bytes: int, output_bytes: int, error: bool):
+        stats = self.tools.get(tool)
+        if stats is None:
+            stats = self.tools[tool] = ToolStats()
+        stats.calls += 1
+        stats.input_bytes += input_bytes
+        stats.output_bytes += output_bytes
+        if error:
+            stats.errors += 1
+        stats.wall.observe(wall_ns)
+        stats.cpu.observe(cpu_ns)
+
+    def reset(self):
+        self.tools.clear()
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Per-tool percentiles in milliseconds, sorted by tool name"""
+        rows = []
+        for name in sorted(self.tools):
+            stats = self.tools[name]
+            rows.append({
+                "tool": name,
+                "calls": stats.calls,
+                "errors": stats.errors,
+                "p50_ms": stats.wall.percentile(0.50) / 1e6,
+                "p90_ms": stats.wall.percentile(0.90) / 1e6,
+                "p99_ms": stats.wall.percentile(0.99) / 1e6,
+                "max_ms": stats.wall.max / 1e6,
+                "cpu_p50_ms": stats.cpu.percentile(0.50) / 1e6,
+                "cpu_p99_ms": stats.cpu.percentile(0.99) / 1e6,
+                "input_bytes": stats.input_bytes,
+                "output_bytes": stats.output_bytes,
+            })
+        return rows
+
+    def to_prometheus(self, cache_stats: Dict[str, int] = None) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        lines = []
+
+        def histogram(metric: str, help_text: str, attr: str):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} histogram")
+            for name in sorted(self.tools):
+                hist = getattr(self.tools[name], attr)
+                cumulative = 0
+                for bound, n in zip(hist.bounds, hist.counts):
+                    cumulative += n
+                    lines.append(f'{metric}_bucket{{tool="{name}",le="{bound / 1e9:g}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{tool="{name}",le="+Inf"}} {hist.count}')
+                lines.append(f'{metric}_sum{{tool="{name}"}} {hist.total / 1e9:.9f}')
+                lines.append(f'{metric}_count{{tool="{name}"}} {hist.count}')
+
+        def counter(metric: str, help_text: str, attr: str):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for name in sorted(self.tools):
+                lines.append(f'{metric}{{tool="{name}"}} {getattr(self.tools[name], attr)}')
+
+        histogram("devkit_tool_duration_seconds", "Wall time per tool call", "wall")
+        histogram("devkit_tool_cpu_seconds", "Event loop CPU time per tool call", "cpu")
+        counter("devkit_tool_calls_total", "Tool calls", "calls")
+        counter("devkit_tool_errors_total", "Tool calls that failed", "errors")
+        counter("devkit_tool_input_bytes_total", "Approximate argument size", "input_bytes")
+        counter("devkit_tool_output_bytes_total", "Result text size", "output_bytes")
+
+        if cache_stats:
+            for key in ["hits", "misses", "evictions", "expirations"]:
+                lines.append(f"# TYPE devkit_cache_{key}_total counter")
+                lines.append(f"devkit_cache_{key}_total {cache_stats[key]}")
+            lines.append("# TYPE devkit_cache_bytes gauge")
+            lines.append(f"devkit_cache_bytes {cache_stats['bytes']}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str, cache_stats: Dict[str, int] = None):
+        """Atomically replace `path` with the current metrics"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus(cache_stats))
+        os.replace(tmp_path, path)
@@ -0,0 +1,129 @@
+"""
+JSON Lines
+Validates and re-formats newline-delimited JSON one record at a time
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from utils import config, json_backend
+from utils.executor import get_pool
+
+# Invalid lines described in a report; the rest are only counted
+MAX_REPORTED_ERRORS = 100
+
+# Formatted records joined into one block at a time, so millions of records are not millions of objects
+BLOCK_RECORDS = 4096
+
+# Input handed to each worker process by parallel parsing
+CHUNK_BYTES = 1024 * 1024
+
+
+class NdjsonReport:
+    """Formatted records plus the line numbers of records that failed to parse"""
+
+    __slots__ = ("blocks", "records", "invalid", "errors")
+
+    def __init__(self):
+        self.blocks: List[str] = []
+        self.records = 0
+        self.invalid = 0
+        self.errors: List[Dict[str, Any]] = []
+
+    def merge(self, other: "NdjsonReport"):
+        """Append a later chunk's report"""
+        self.blocks.extend(other.blocks)
+        self.records += other.records
+        self.invalid += other.invalid
+        self.errors.extend(other.errors[:MAX_REPORTED_ERRORS - len(self.errors)])
+
+    def formatted(self, separator: str) -> str:
+        return separator.join(self.blocks)
+
+
+def iter_lines(text: str, first_line: int = 1) -> Iterator[Tuple[int, str]]:
+    """(line number, line) for each non-blank line, without splitting the whole input up front"""
+    position = 0
+    number = first_line
+    while position < len(text):
+        end = text.find("\n", position)
+        if end == -1:
+            end = len(text)
+        line = text[position:end]
+        if line.strip():
+            yield number, line
+        position = end + 1
+        number += 1
+
+
+def format_ndjson(
+    text: str,
+    indent: int,
+    sort_keys: bool,
+    compact: bool = False,
+    separator: str = "\n",
+    first_line: int = 1
+) -> NdjsonReport:
+    """Parse and re-serialize each line on its own; a bad line is reported and skipped"""
+    report = NdjsonReport()
+    block: List[str] = []
+    for number, line in iter_lines(text, first_line):
+        try:
+            _, formatted = json_backend.reformat(line, indent, sort_keys, compact)
+        except json.JSONDecodeError as e:
+            report.invalid += 1
+            if len(report.errors) < MAX_REPORTED_ERRORS:
+                report.errors.append({"line": number, "column": e.colno, "error": e.msg})
+            continue
+        block.append(formatted)
+        report.records += 1
+        if len(block) >= BLOCK_RECORDS:
+            report.blocks.append(separator.join(block))
+            block.clear()
+    if block:
+        report.blocks.append(separator.join(block))
+    return report
+
+
+def iter_chunks(text: str, chunk_bytes: int = CHUNK_BYTES) -> Iterator[Tuple[int, str]]:
+    """(first line number, chunk) slices of about chunk_bytes, cut after a newline"""
+    position = 0
+    number = 1
+    while position < len(text):
+        end = text.find("\n", position + chunk_bytes)
+        end = len(text) if end == -1 else end + 1
+        chunk = text[position:end]
+        yield number, chunk
+        number += chunk.count("\n")
+        position = end
+
+
+async def format_ndjson_parallel(
+    text: str,
+    indent: int,
+    sort_keys: bool,
+    compact: bool = False,
+    separator: str = "\n",
+    chunk_bytes: Optional[int] = None
+) -> NdjsonReport:
+    """
+    format_ndjson across the process pool, one chunk per task. At most two
+    chunks per worker are in flight, so only that much of the input is
+    copied at once; reports are merged in input order.
+    """
+    loop = asyncio.get_running_loop()
+    pool = get_pool("process")
+    window = max(1, config.PROCESS_WORKERS * 2)
+    report = NdjsonReport()
+    pending: List[asyncio.Future] = []
+
+    for first_line, chunk in iter_chunks(text, chunk_bytes or CHUNK_BYTES):
+        if len(pending) >= window:
+            report.merge(await pending.pop(0))
+        pending.append(loop.run_in_executor(
+            pool, format_ndjson, chunk, indent, sort_keys, compact, separator, first_line
+        ))
+    for future in pending:
+        report.merge(await future)
+    return report
@@ -0,0 +1,42 @@
+"""
+Structured Output
+Compact machine-readable replies for tools called with output="structured"
+"""
+
+import json
+from typing import Any, Dict
+
+
+def is_structured(arguments: Dict[str, Any]) -> bool:
+    """True when the caller asked for a JSON object instead of markdown"""
+    return arguments.get("output") == "structured"
+
+
+def _reply(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "content": [{
+            "type": "text",
+            "text": json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        }]
+    }
+
+
+def structured_result(result: Any, **meta) -> Dict[str, Any]:
+    """{"result": ..., "meta": {...}} as a single compact JSON text block"""
+    return _reply({"result": result, "meta": meta})
+
+
+def structured_raw(result_json: str, **meta) -> Dict[str, Any]:
+    """Like structured_result, but splices an already-serialized JSON value in verbatim"""
+    meta_json = json.dumps(meta, ensure_ascii=False, separators=(",", ":"))
+    return {
+        "content": [{
+            "type": "text",
+            "text": f'{{"result":{result_json},"meta":{meta_json}}}'
+        }]
+    }
+
+
+def structured_error(message: str, **meta) -> Dict[str, Any]:
+    """{"error": ..., "meta": {...}} as a single compact JSON text block"""
+    return _reply({"error": message, "meta": meta})
@@ -0,0 +1,27 @@
+"""
+Progress Notifications
+Lets long-running tools report partial results to the calling MCP client
+"""
+
+from typing import Optional
+
+from mcp.server.lowlevel.server import request_ctx
+
+
+async def report_progress(progress: float, total: Optional[float] = None, message: Optional[str] = None) -> bool:
+    """
+    Send a progress notification for the tool call being handled, if the
+    client asked for them with a progressToken. Returns whether one was sent;
+    outside an MCP request (tests, benchmarks, batch) this is a no-op.
+    """
+    try:
+        ctx = request_ctx.get()
+    except LookupError:
+        return False
+    token = ctx.meta.progressToken if ctx.meta is not None else None
+    if token is None:
+        return False
+    await ctx.session.send_progress_notification(
+        token, progress, total=total, message=message, related_request_id=ctx.request_id
+    )
+    return True
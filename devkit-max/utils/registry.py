@@ -0,0 +1,152 @@
+"""
+Tool Registry
+Collects every tool's schema and handler behind one list_tools/call_tool pair
+"""
+
+import asyncio
+import importlib
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import jsonschema
+import mcp.types as types
+
+from utils import config
+from utils.cache import ResultCache, cache_key
+from utils.metrics import Metrics, is_error_result, payload_size, result_bytes
+
+
+class ToolRegistry:
+    """
+    Maps tool names to handlers, importing tool modules on first use.
+
+    Schemas come from the static manifest, so list_tools never imports a tool.
+    When a module is needed, its `register_tool(server)` runs against the
+    registry, which stands in for the MCP Server and captures the handlers
+    declared with `@server.list_tools()` and `@server.call_tool()`.
+    """
+
+    def __init__(self):
+        self.handlers: Dict[str, Callable] = {}
+        self.tools: List[types.Tool] = []
+        self.modules: Dict[str, str] = {}
+        self.schemas: Dict[str, Dict[str, Any]] = {}
+        self.cache_policies: Dict[str, Dict[str, Any]] = {}
+        self.cache = ResultCache(config.CACHE_MAX_BYTES)
+        self.metrics = Metrics()
+        self._list_handler: Optional[Callable] = None
+        self._call_handler: Optional[Callable] = None
+        self._import_lock = threading.Lock()
+
+    def list_tools(self):
+        def decorator(func):
+            self._list_handler = func
+            return func
+        return decorator
+
+    def call_tool(self):
+        def decorator(func):
+            self._call_handler = func
+            return func
+        return decorator
+
+    def load_manifest(self, manifest: Dict[str, Dict[str, Any]]) -> List[str]:
+        """Index tools from a manifest of {name: {"module": ..., "schema": ...}}"""
+        for name, entry in manifest.items():
+            if name in self.modules:
+                raise ValueError(f"Duplicate tool name: {name}")
+            self.tools.append(types.Tool(**entry["schema"]))
+            self.modules[name] = entry["module"]
+            self.schemas[name] = entry["schema"]["inputSchema"]
+            if "cache" in entry:
+                self.cache_policies[name] = entry["cache"]
+        return list(manifest)
+
+    def validate(self, name: str, arguments: Dict[str, Any]):
+        """Check arguments against a tool's input schema, as the MCP server does for direct calls"""
+        if name not in self.schemas:
+            raise ValueError(f"Unknown tool: {name}")
+        try:
+            jsonschema.validate(instance=arguments, schema=self.schemas[name])
+        except jsonschema.ValidationError as e:
+            raise ValueError(f"Input validation error: {e.message}")
+
+    def import_tool(self, name: str) -> Callable:
+        """Import the module behind a tool and index its call handler"""
+        with self._import_lock:
+            handler = self.handlers.get(name)
+            if handler is not None:
+                return handler
+
+            module_path = self.modules[name]
+            module = importlib.import_module(module_path)
+
+            self._list_handler = None
+            self._call_handler = None
+            module.register_tool(self)
+            if self._call_handler is None:
+                raise ValueError(f"{module_path}.register_tool did not define a call_tool handler")
+
+            for tool_name, path in self.modules.items():
+                if path == module_path:
+                    self.handlers[tool_name] = self._call_handler
+            return self._call_handler
+
+    def warm_up(self) -> List[str]:
+        """Import every tool module not loaded yet; safe to run in a worker thread"""
+        loaded = []
+        for name in self.modules:
+            if name not in self.handlers:
+                self.import_tool(name)
+                loaded.append(name)
+        return loaded
+
+    async def call(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Dispatch a call to the tool's own handler, returning its raw result dict"""
+        arguments = arguments or {}
+        wall_start = time.perf_counter_ns()
+        cpu_start = time.thread_time_ns()
+        result = None
+        try:
+            result = await self._dispatch(name, arguments)
+            return result
+        finally:
+            if name in self.modules:
+                self.metrics.record(
+                    name,
+                    time.perf_counter_ns() - wall_start,
+                    time.thread_time_ns() - cpu_start,
+                    payload_size(arguments),
+                    result_bytes(result) if result is not None else 0,
+                    result is None or is_error_result(result)
+                )
+
+    async def _dispatch(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        policy = self.cache_policies.get(name)
+        if policy is not None and any(arguments.get(argument) for argument in policy.get("bypass", ())):
+            policy = None
+        # Hashing large inputs for the key would block the loop before the tool can offload its work
+        if policy is not None and payload_size(arguments) > config.CACHE_MAX_ARGUMENT_CHARS:
+            policy = None
+        if policy is not None:
+            key = cache_key(name, arguments)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        handler = self.handlers.get(name)
+        if handler is None:
+            if name not in self.modules:
+                raise ValueError(f"Unknown tool: {name}")
+            handler = await asyncio.to_thread(self.import_tool, name)
+        result = await handler(name, arguments)
+
+        if policy is not None:
+            self.cache.put(key, result, ttl=policy.get("ttl"))
+        return result
+
+
+def to_content(result: Dict[str, Any]) -> List[types.TextContent]:
+    """Convert a tool's {"content": [...]} result into MCP content blocks"""
+    return [types.TextContent(**block) for block in result.get("content", [])]
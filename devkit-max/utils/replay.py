@@ -0,0 +1,237 @@
+"""
+Request Replay
+Replays a HAR file or a JSON request collection: independent requests run in
+parallel, requests that use variables extracted from earlier responses wait
+for them
+"""
+
+import asyncio
+import json
+import re
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import httpx
+
+from utils import json_backend, local_files
+from utils.http_body import read_body
+from utils.load_runner import error_category
+
+VARIABLE = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+
+# "$.data.items[0].id" -> ["data", "items", 0, "id"]
+PATH_PART = re.compile(r"\.([A-Za-z_][A-Za-z0-9_-]*)|\[(\d+)\]|\[\"([^\"]*)\"\]")
+
+
+class ReplayStep:
+    """One request of a collection and what it needs from earlier ones"""
+
+    def __init__(self, index: int, spec: Dict[str, Any]):
+        self.index = index
+        self.name = spec.get("name") or f"request {index + 1}"
+        self.method = (spec.get("method") or "GET").upper()
+        self.url = spec["url"]
+        self.headers: Dict[str, str] = dict(spec.get("headers") or {})
+        self.body: str = spec.get("body") or ""
+        self.extract: Dict[str, str] = dict(spec.get("extract") or {})
+        self.expect: Dict[str, Any] = dict(spec.get("assert") or {})
+        self.depends: Set[int] = set()
+        # Extracted variable -> index of the step it is taken from
+        self.sources: Dict[str, int] = {}
+
+    def variables_used(self) -> Set[str]:
+        text = " ".join([self.url, self.body, *self.headers.keys(), *self.headers.values()])
+        return set(VARIABLE.findall(text))
+
+
+def _har_steps(har: Dict[str, Any]) -> List[Dict[str, Any]]:
+    specs = []
+    for entry in har["log"]["entries"]:
+        request = entry["request"]
+        headers = {
+            h["name"]: h["value"] for h in request.get("headers", [])
+            if not h["name"].startswith(":") and h["name"].lower() not in ("content-length", "host")
+        }
+        spec = {
+            "name": f"{request['method']} {request['url']}",
+            "method": request["method"],
+            "url": request["url"],
+            "headers": headers,
+            "body": (request.get("postData") or {}).get("text", ""),
+        }
+        status = (entry.get("response") or {}).get("status")
+        if status:
+            spec["assert"] = {"status": status}
+        specs.append(spec)
+    return specs
+
+
+def read_collection(path: str) -> Any:
+    """A HAR file or JSON collection from under the allowed roots (see utils/local_files.py)"""
+    with open(local_files.resolve(path), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_collection(data: Dict[str, Any]) -> Tuple[List[ReplayStep], Dict[str, str]]:
+    """
+    Parse a HAR log ({"log": {"entries": [...]}}) or a collection
+    ({"variables": {...}, "requests": [...]}) into steps plus static variables.
+
+    A step depends on the latest earlier step that extracts a variable it
+    uses, and takes the value from that step even if another step extracts
+    the same name; it also depends on any steps named in its "depends_on" list.
+    """
+    if "log" in data:
+        specs, variables = _har_steps(data), {}
+    else:
+        specs, variables = data.get("requests", []), dict(data.get("variables") or {})
+
+    steps = [ReplayStep(i, spec) for i, spec in enumerate(specs)]
+    by_name = {step.name: step.index for step in steps}
+    producers: Dict[str, int] = {}
+    for step, spec in zip(steps, specs):
+        for name in step.variables_used():
+            if name in producers:
+                step.sources[name] = producers[name]
+                step.depends.add(producers[name])
+            elif name not in variables:
+                raise ValueError(f"{step.name}: variable '{name}' is not defined or extracted by an earlier request")
+        for name in spec.get("depends_on") or []:
+            if by_name.get(name, step.index) >= step.index:
+                raise ValueError(f"{step.name}: depends_on '{name}' must name an earlier request")
+            step.depends.add(by_name[name])
+        for name in step.extract:
+            producers[name] = step.index
+    return steps, {k: str(v) for k, v in variables.items()}
+
+
+def substitute(text: str, variables: Dict[str, str]) -> str:
+    return VARIABLE.sub(lambda m: variables[m.group(1)], text)
+
+
+def extract_value(document: Any, path: str) -> Any:
+    """Follow a "$.a.b[0]" path into parsed JSON; raises KeyError when it does not resolve"""
+    if not path.startswith("$"):
+        raise KeyError(path)
+    value = document
+    position = 1
+    while position < len(path):
+        match = PATH_PART.match(path, position)
+        if match is None:
+            raise KeyError(path)
+        key, index, quoted = match.groups()
+        if index is not None:
+            if not isinstance(value, list) or int(index) >= len(value):
+                raise KeyError(path)
+            value = value[int(index)]
+        else:
+            key = key if key is not None else quoted
+            if not isinstance(value, dict) or key not in value:
+                raise KeyError(path)
+            value = value[key]
+        position = match.end()
+    return value
+
+
+def check_assertions(expect: Dict[str, Any], status: int, latency_ms: float, text: str) -> List[str]:
+    """Failed assertion messages (empty when everything passed)"""
+    failures = []
+    if "status" in expect and status != expect["status"]:
+        failures.append(f"status {status} != {expect['status']}")
+    if "max_ms" in expect and latency_ms > expect["max_ms"]:
+        failures.append(f"latency {latency_ms:.0f}ms > {expect['max_ms']}ms")
+    if "body_contains" in expect and expect["body_contains"] not in text:
+        failures.append(f"body does not contain {expect['body_contains']!r}")
+    for path, wanted in (expect.get("json") or {}).items():
+        try:
+            actual = extract_value(json_backend.loads(text), path)
+        except (ValueError, KeyError):
+            failures.append(f"{path} missing")
+            continue
+        if actual != wanted:
+            failures.append(f"{path} = {actual!r}, expected {wanted!r}")
+    return failures
+
+
+async def run_replay(
+    client: httpx.AsyncClient,
+    steps: List[ReplayStep],
+    variables: Dict[str, str],
+    concurrency: int,
+    keep_bytes: int
+) -> List[Dict[str, Any]]:
+    """
+    Start every step as soon as the steps it depends on have finished, with
+    at most `concurrency` requests in flight. A step whose dependency failed
+    is skipped. Returns one row per step in collection order.
+    """
+    slots = asyncio.Semaphore(max(1, concurrency))
+    done = {step.index: asyncio.Event() for step in steps}
+    rows: List[Optional[Dict[str, Any]]] = [None] * len(steps)
+    # Each step's extracted values, kept apart so steps running at the same
+    # time cannot overwrite a variable another step is about to read
+    extracted: Dict[int, Dict[str, str]] = {}
+    origin = time.perf_counter_ns()
+
+    async def run_step(step: ReplayStep):
+        for index in step.depends:
+            await done[index].wait()
+        row = {"name": step.name, "method": step.method, "url": step.url, "status": None,
+               "start_ms": None, "latency_ms": None, "failures": [], "error": None, "skipped": False}
+        try:
+            failed = [rows[i]["name"] for i in step.depends if not rows[i]["ok"]]
+            if failed:
+                row["skipped"] = True
+                row["error"] = f"skipped: {', '.join(failed)} failed"
+                return
+
+            values = dict(variables)
+            values.update((name, extracted[index][name]) for name, index in step.sources.items())
+            url = substitute(step.url, values)
+            row["url"] = url
+            headers = {substitute(k, values): substitute(v, values) for k, v in step.headers.items()}
+            body = substitute(step.body, values)
+            if body and "content-type" not in (key.lower() for key in headers):
+                headers["Content-Type"] = "application/json"
+
+            async with slots:
+                started = time.perf_counter_ns()
+                row["start_ms"] = round((started - origin) / 1e6, 2)
+                try:
+                    async with client.stream(step.method, url, headers=headers, content=body or None) as response:
+                        body_read = await read_body(response, keep_bytes)
+                except Exception as e:
+                    row["error"] = error_category(e)
+                    return
+                finally:
+                    row["latency_ms"] = round((time.perf_counter_ns() - started) / 1e6, 2)
+
+            row["status"] = response.status_code
+            text = body_read.text(response.encoding)
+            row["failures"] = check_assertions(step.expect, response.status_code, row["latency_ms"], text)
+            found = extracted[step.index] = {}
+            for name, path in step.extract.items():
+                try:
+                    if path.lower().startswith("header:"):
+                        value = response.headers[path.split(":", 1)[1].strip()]
+                    else:
+                        value = extract_value(json_backend.loads(text), path)
+                    found[name] = value if isinstance(value, str) else json.dumps(value)
+                except (ValueError, KeyError):
+                    row["failures"].append(f"could not extract {name} from {path}")
+        finally:
+            row["ok"] = row["error"] is None and not row["failures"]
+            rows[step.index] = row
+            done[step.index].set()
+
+    await asyncio.gather(*(run_step(step) for step in steps))
+    return rows
+
+
+def critical_path_ms(steps: List[ReplayStep], rows: List[Dict[str, Any]]) -> float:
+    """Longest chain of dependent request latencies: the floor for replay time"""
+    finish: Dict[int, float] = {}
+    for step in steps:
+        before = max((finish[i] for i in step.depends), default=0.0)
+        finish[step.index] = before + (rows[step.index]["latency_ms"] or 0.0)
+    return round(max(finish.values(), default=0.0), 2)
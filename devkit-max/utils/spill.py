@@ -0,0 +1,290 @@
+"""
+Spill Store
+Keeps large tool results out of the reply: results are held in memory, spilled
+to temp files when the memory budget is exceeded, and read back in ranges
+through MCP resources (devkit://results/<id>?offset=<chars>&length=<chars>).
+Each entry belongs to the client session whose call stored it, and is only
+listed and read within that session.
+"""
+
+import codecs
+import json
+import os
+import secrets
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from utils import config
+
+URI_PREFIX = "devkit://results/"
+
+# Characters between byte-offset checkpoints in spilled files
+CHECKPOINT_CHARS = 64 * 1024
+
+# Bytes read from disk at a time while decoding a range
+READ_BLOCK_BYTES = 64 * 1024
+
+# Characters of a spilled result shown inline
+PREVIEW_CHARS = 2000
+
+# Key of the client session the current tool call belongs to (set by server.py)
+session: ContextVar[Optional[str]] = ContextVar("spill_session", default=None)
+
+
+class SpillEntry:
+    __slots__ = ("id", "label", "mime_type", "chars", "bytes", "created", "text", "path", "checkpoints", "owner")
+
+    def __init__(self, entry_id: str, label: str, mime_type: str, text: str, created: float,
+                 owner: Optional[str] = None):
+        self.id = entry_id
+        self.label = label
+        self.mime_type = mime_type
+        self.chars = len(text)
+        self.bytes = len(text.encode("utf-8", "surrogatepass"))
+        self.created = created
+        self.text: Optional[str] = text
+        self.path: Optional[str] = None
+        # checkpoints[k] is the byte offset of character k * CHECKPOINT_CHARS in the file
+        self.checkpoints: List[int] = []
+        self.owner = owner
+
+    @property
+    def uri(self) -> str:
+        return f"{URI_PREFIX}{self.id}"
+
+
+class SpillStore:
+    """
+    Bounded store of large results, oldest first.
+
+    Entries are stored with an owner (a session key, or None) and are only
+    listed and read for that same owner.
+
+    Entries stay in memory up to `memory_bytes`; older entries then move to
+    temp files. Entries older than `max_age` seconds, or the oldest ones once
+    all entries together exceed `max_bytes`, are dropped.
+    """
+
+    def __init__(
+        self,
+        memory_bytes: int,
+        max_bytes: int,
+        max_age: float,
+        directory: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.memory_bytes = memory_bytes
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.directory = directory
+        self.clock = clock
+        self.entries: "OrderedDict[str, SpillEntry]" = OrderedDict()
+        self.bytes_in_memory = 0
+        self.bytes_total = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def put(
+        self,
+        text: str,
+        label: str = "result",
+        mime_type: str = "text/plain",
+        owner: Optional[str] = None
+    ) -> SpillEntry:
+        """Store a result and return its entry (use `.uri` to reference it)"""
+        entry = SpillEntry(secrets.token_hex(8), label, mime_type, text, self.clock(), owner)
+        with self._lock:
+            self._expire()
+            self.entries[entry.id] = entry
+            self.bytes_in_memory += entry.bytes
+            self.bytes_total += entry.bytes
+
+            while self.bytes_total > self.max_bytes and len(self.entries) > 1:
+                self._drop(next(iter(self.entries.values())))
+                self.evictions += 1
+
+            for candidate in list(self.entries.values()):
+                if self.bytes_in_memory <= self.memory_bytes:
+                    break
+                if candidate.text is not None:
+                    self._spill(candidate)
+        return entry
+
+    def get(self, entry_id: str, owner: Optional[str] = None) -> Optional[SpillEntry]:
+        with self._lock:
+            self._expire()
+            entry = self.entries.get(entry_id)
+            return entry if entry is not None and entry.owner == owner else None
+
+    def list(self, owner: Optional[str] = None) -> List[SpillEntry]:
+        with self._lock:
+            self._expire()
+            return [entry for entry in self.entries.values() if entry.owner == owner]
+
+    def read(
+        self,
+        entry_id: str,
+        offset: int = 0,
+        length: Optional[int] = None,
+        owner: Optional[str] = None
+    ) -> Tuple[str, SpillEntry]:
+        """Characters [offset, offset + length) of a stored result; KeyError for another owner's entry"""
+        with self._lock:
+            self._expire()
+            entry = self.entries.get(entry_id)
+            if entry is None or entry.owner != owner:
+                raise KeyError(entry_id)
+            text = entry.text
+            handle = open(entry.path, "rb") if text is None else None
+
+        offset = max(0, offset)
+        end = entry.chars if length is None else min(entry.chars, offset + max(0, length))
+        if text is not None:
+            return text[offset:end], entry
+
+        with handle:
+            return self._read_file(handle, entry, offset, end), entry
+
+    def clear(self):
+        with self._lock:
+            for entry in list(self.entries.values()):
+                self._drop(entry)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self.entries),
+                "on_disk": sum(1 for entry in self.entries.values() if entry.path),
+                "bytes_in_memory": self.bytes_in_memory,
+                "bytes_total": self.bytes_total,
+                "evictions": self.evictions,
+            }
+
+    def _read_file(self, handle, entry: SpillEntry, offset: int, end: int) -> str:
+        if offset >= end:
+            return ""
+        checkpoint = offset // CHECKPOINT_CHARS
+        handle.seek(entry.checkpoints[checkpoint])
+        skip = offset - checkpoint * CHECKPOINT_CHARS
+        wanted = end - offset
+
+        decoder = codecs.getincrementaldecoder("utf-8")("surrogatepass")
+        parts = []
+        have = 0
+        while have < skip + wanted:
+            block = handle.read(READ_BLOCK_BYTES)
+            if not block:
+                break
+            chunk = decoder.decode(block)
+            parts.append(chunk)
+            have += len(chunk)
+        return "".join(parts)[skip:skip + wanted]
+
+    def _spill(self, entry: SpillEntry):
+        fd, path = tempfile.mkstemp(prefix="devkit-", suffix=".spill", dir=self.directory)
+        written = 0
+        with os.fdopen(fd, "wb") as f:
+            for start in range(0, entry.chars, CHECKPOINT_CHARS):
+                entry.checkpoints.append(written)
+                data = entry.text[start:start + CHECKPOINT_CHARS].encode("utf-8", "surrogatepass")
+                f.write(data)
+                written += len(data)
+        if not entry.checkpoints:
+            entry.checkpoints.append(0)
+        entry.path = path
+        entry.text = None
+        self.bytes_in_memory -= entry.bytes
+
+    def _drop(self, entry: SpillEntry):
+        self.entries.pop(entry.id, None)
+        self.bytes_total -= entry.bytes
+        if entry.text is not None:
+            self.bytes_in_memory -= entry.bytes
+        elif entry.path:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    def _expire(self):
+        cutoff = self.clock() - self.max_age
+        while self.entries:
+            oldest = next(iter(self.entries.values()))
+            if oldest.created > cutoff:
+                break
+            self._drop(oldest)
+            self.evictions += 1
+
+
+def parse_uri(uri: str) -> Tuple[str, int, Optional[int]]:
+    """Split devkit://results/<id>?offset=&length= into (id, offset, length)"""
+    if not uri.startswith(URI_PREFIX):
+        raise ValueError(f"Unknown resource: {uri}")
+    parsed = urlparse(uri)
+    entry_id = uri[len(URI_PREFIX):].split("?")[0]
+    query = parse_qs(parsed.query)
+    offset = int(query.get("offset", ["0"])[0])
+    length = int(query["length"][0]) if "length" in query else None
+    return entry_id, offset, length
+
+
+def summarize(entry: SpillEntry, preview: str) -> str:
+    """Markdown reply pointing at a spilled result"""
+    return f"""📎 **Large result stored as a resource** ({entry.chars:,} chars, {entry.bytes / 1024:.1f} KB)
+
+**Resource:** `{entry.uri}`
+Read it with `resources/read`; add `?offset=<chars>&length=<chars>` to fetch a range.
+
+**Preview:**
+```
+{preview}
+```"""
+
+
+def spill_large_result(
+    result: Dict[str, Any],
+    label: str,
+    structured: bool,
+    limit: Optional[int] = None
+) -> Dict[str, Any]:
+    """Replace a tool result longer than the inline limit with a resource reference"""
+    limit = config.INLINE_LIMIT if limit is None else limit
+    blocks = result.get("content", [])
+    if sum(len(block.get("text", "")) for block in blocks) <= limit:
+        return result
+
+    text = "\n".join(block.get("text", "") for block in blocks)
+    if structured:
+        entry = store.put(text, label=label, mime_type="application/json", owner=session.get())
+        reply = json.dumps({
+            "resource": {
+                "uri": entry.uri,
+                "mime_type": entry.mime_type,
+                "chars": entry.chars,
+                "bytes": entry.bytes
+            },
+            "meta": {"spilled": True}
+        }, separators=(",", ":"))
+    else:
+        entry = store.put(text, label=label, mime_type="text/markdown", owner=session.get())
+        reply = summarize(entry, text[:PREVIEW_CHARS] + "\n... [truncated]")
+
+    return {
+        "content": [{
+            "type": "text",
+            "text": reply
+        }]
+    }
+
+
+store = SpillStore(
+    memory_bytes=config.SPILL_MEMORY_BYTES,
+    max_bytes=config.SPILL_MAX_BYTES,
+    max_age=config.SPILL_MAX_AGE,
+    directory=config.SPILL_DIR or None
+)